@@ -0,0 +1,217 @@
+import os
+import random
+import tempfile
+
+from benchmarks.harness import benchmark
+from jungle_game.controller.game_controller import GameController
+from jungle_game.model.game_state import GameState
+from jungle_game.model.piece import Piece
+from jungle_game.model.position import Position
+from jungle_game.model.animal_type import (
+    ELEPHANT, LION, TIGER, LEOPARD, WOLF, DOG, CAT, RAT
+)
+from jungle_game.model import movegen
+from jungle_game.model.timeline import Timeline
+from jungle_game.engine import playout
+from jungle_game.profile import play_random_game
+
+
+def clear_board(state):
+    for r in range(9):
+        for c in range(7):
+            state.board.pieces[r][c] = None
+
+
+# Lions and tigers of both sides parked on the river banks, so most of the
+# generated moves are jumps.
+def jump_heavy_state():
+    state = GameState()
+    clear_board(state)
+    placements = [
+        (LION, 1, 3, 0), (TIGER, 1, 6, 1), (LION, -1, 2, 2), (TIGER, -1, 4, 6),
+        (RAT, 1, 7, 6), (RAT, -1, 1, 0), (ELEPHANT, 1, 6, 5), (ELEPHANT, -1, 2, 4),
+    ]
+    for animal, player, r, c in placements:
+        state.board.pieces[r][c] = Piece(animal, player, Position(r, c))
+    return state
+
+
+# Long game without captures: both elephants shuffle back and forth.
+def long_shuffle_state(plies):
+    state = GameState()
+    cycle = [
+        (Position(6, 0), Position(5, 0)),
+        (Position(2, 6), Position(3, 6)),
+        (Position(5, 0), Position(6, 0)),
+        (Position(3, 6), Position(2, 6)),
+    ]
+    for i in range(plies):
+        state.make_move(*cycle[i % 4])
+    return state
+
+
+@benchmark("legal_moves_start", number=200)
+def bench_legal_moves_start():
+    state = GameState()
+
+    def run():
+        state.invalidate_legal_moves()
+        state.get_legal_moves(1)
+    return run
+
+
+@benchmark("legal_moves_jumps", number=200)
+def bench_legal_moves_jumps():
+    state = jump_heavy_state()
+
+    def run():
+        state.invalidate_legal_moves()
+        state.get_legal_moves(1)
+        state.get_legal_moves(-1)
+    return run
+
+
+# Every piece of both sides tries every adjacent square of a crowded middle
+# game, so most checks reach the capture rules
+def crowded_state():
+    state = GameState()
+    clear_board(state)
+    animals = [ELEPHANT, LION, TIGER, LEOPARD, WOLF, DOG, CAT, RAT]
+    squares = [(r, c) for r in (2, 3, 4, 5, 6) for c in range(7)]
+    for i, (r, c) in enumerate(squares[:32]):
+        player = 1 if (r + c) % 2 == 0 else -1
+        state.board.pieces[r][c] = Piece(animals[i % 8], player, Position(r, c))
+    return state
+
+
+@benchmark("capture_checks", number=50)
+def bench_capture_checks():
+    state = crowded_state()
+    board = state.board
+    pairs = []
+    for r in range(9):
+        for c in range(7):
+            piece = board.pieces[r][c]
+            if piece is None:
+                continue
+            for dr, dc in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+                if 0 <= r + dr <= 8 and 0 <= c + dc <= 6:
+                    pairs.append((piece, Position(r + dr, c + dc), piece.player))
+
+    def run():
+        for piece, target, player in pairs:
+            board.is_legal_move(piece, target, player)
+    return run
+
+
+@benchmark("capture_playouts", number=1)
+def bench_capture_playouts():
+    def run():
+        rng = random.Random(7)
+        for _ in range(5):
+            playout.random_playout(playout.flat_board(GameState()), 1, rng,
+                                   max_plies=200, capture_bias=0.5)
+    return run
+
+
+@benchmark("validate_cached_move", number=2000)
+def bench_validate_cached_move():
+    state = GameState()
+    state.get_legal_moves(1)
+    from_pos, to_pos = Position(6, 0), Position(5, 0)
+    return lambda: state.is_legal(from_pos, to_pos)
+
+
+@benchmark("staged_moves_all", number=200)
+def bench_staged_moves_all():
+    state = jump_heavy_state()
+    return lambda: list(movegen.iter_moves(state))
+
+
+@benchmark("staged_moves_first", number=200)
+def bench_staged_moves_first():
+    state = jump_heavy_state()
+    return lambda: next(movegen.iter_moves(state))
+
+
+@benchmark("random_games", number=1)
+def bench_random_games():
+    def run():
+        rng = random.Random(42)
+        for _ in range(5):
+            play_random_game(rng, max_plies=200, undo_every=0)
+    return run
+
+
+# Same workload as random_games on the flat playout board; should be >= 10x faster
+@benchmark("random_playouts", number=1)
+def bench_random_playouts():
+    def run():
+        rng = random.Random(42)
+        for _ in range(5):
+            playout.random_playout(playout.flat_board(GameState()), 1, rng, max_plies=200)
+    return run
+
+
+@benchmark("undo_chain", number=5)
+def bench_undo_chain():
+    def run():
+        state = long_shuffle_state(1000)
+        while state.undo_last_move():
+            pass
+    return run
+
+
+@benchmark("save_load_game", number=50)
+def bench_save_load_game():
+    state = long_shuffle_state(10)
+    filename = os.path.join(tempfile.mkdtemp(), "bench.jungle")
+
+    def run():
+        state.save_game(filename)
+        GameState.load_game(filename)
+    return run
+
+
+@benchmark("record_10k_plies", number=3)
+def bench_record_10k():
+    state = long_shuffle_state(10000)
+    filename = os.path.join(tempfile.mkdtemp(), "bench.record")
+
+    def run():
+        state.save_record(filename)
+        GameState.replay_history(filename)
+    return run
+
+
+SHUFFLE_MOVES = [(6, 0, 5, 0), (2, 6, 3, 6), (5, 0, 6, 0), (3, 6, 2, 6)] * 500
+
+
+@benchmark("apply_move_tuple_loop", number=3)
+def bench_apply_move_tuple_loop():
+    def run():
+        ctrl = GameController.new_game()
+        for move in SHUFFLE_MOVES:
+            ctrl.apply_move_tuple(move)
+    return run
+
+
+@benchmark("apply_moves_batch", number=3)
+def bench_apply_moves_batch():
+    def run():
+        GameController.new_game().apply_moves(SHUFFLE_MOVES)
+    return run
+
+
+# Random access into a 2000-ply game; cost should not grow with game length
+@benchmark("timeline_seek", number=5)
+def bench_timeline_seek():
+    timeline = Timeline()
+    for r1, c1, r2, c2 in SHUFFLE_MOVES:
+        timeline.play(Position(r1, c1), Position(r2, c2))
+    plies = random.Random(3).sample(range(timeline.end + 1), 50)
+
+    def run():
+        for ply in plies:
+            timeline.seek(ply)
+    return run
@@ -0,0 +1,81 @@
+import json
+import platform
+import statistics
+import sys
+import timeit
+
+# Self-contained timeit harness.
+#
+# A benchmark is a setup function that returns the zero-argument callable to
+# time. Each run records the best and median time per call; compare() checks
+# those against a stored baseline with a relative tolerance.
+
+REGISTRY = {}
+
+
+class Benchmark:
+    def __init__(self, name, setup, number, repeat):
+        self.name = name
+        self.setup = setup
+        self.number = number
+        self.repeat = repeat
+
+    def run(self):
+        func = self.setup()
+        timings = timeit.Timer(func).repeat(repeat=self.repeat, number=self.number)
+        per_call = [t / self.number for t in timings]
+        return {
+            "best": min(per_call),
+            "median": statistics.median(per_call),
+            "number": self.number,
+            "repeat": self.repeat
+        }
+
+
+def benchmark(name, number=10, repeat=5):
+    def register(setup):
+        REGISTRY[name] = Benchmark(name, setup, number, repeat)
+        return setup
+    return register
+
+
+def run_all(names=None, out=sys.stdout):
+    results = {}
+    for name, bench in REGISTRY.items():
+        if names and name not in names:
+            continue
+        result = bench.run()
+        results[name] = result
+        if out is not None:
+            out.write(f"{name:<32}{result['best'] * 1e3:>12.3f} ms"
+                      f"{result['median'] * 1e3:>12.3f} ms\n")
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": results
+    }
+
+
+def save(report, filename):
+    with open(filename, "w") as f:
+        json.dump(report, f, indent=4, sort_keys=True)
+
+
+def load(filename):
+    with open(filename, "r") as f:
+        return json.load(f)
+
+
+# Returns a list of (name, baseline, current, ratio) for every benchmark whose
+# best time got slower than baseline * (1 + tolerance).
+def compare(report, baseline, tolerance):
+    regressions = []
+    current = report["results"]
+    for name, base in baseline["results"].items():
+        if name not in current:
+            continue
+        ratio = current[name]["best"] / base["best"]
+        if ratio > 1 + tolerance:
+            regressions.append((name, base["best"], current[name]["best"], ratio))
+    return regressions
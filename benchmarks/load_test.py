@@ -0,0 +1,373 @@
+import argparse
+import json
+import os
+import random
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+from jungle_game.controller.game_controller import GameController
+from jungle_game.model.game_state import GameState
+
+# Load generator for capacity numbers on a single machine.
+#
+# N simulated players each drive their own GameController, either directly
+# (in-process) or through a small line-based TCP server on localhost. Worker
+# threads step all sessions round-robin, so every session stays live for the
+# whole run. A session plays random legal moves (or a scripted .record game),
+# and now and then undoes a move or saves and reloads its game.
+#
+# The report has latency percentiles per operation, overall throughput and,
+# from a separate tracemalloc pass (tracing would skew the timings), the
+# memory one session costs. --budget OP=MS turns it into a release gate: the
+# exit status is 1 if the p99 of OP exceeds MS milliseconds.
+
+OPERATIONS = ("make_move", "undo", "save_game", "load_game")
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(q / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+# -------- clients --------
+
+class LocalClient:
+    def __init__(self):
+        self.controller = GameController()
+
+    def legal_moves(self):
+        state = self.controller.game_state
+        return [(a.row, a.col, b.row, b.col)
+                for a, b in state.get_legal_moves(state.current_player)]
+
+    def make_move(self, r1, c1, r2, c2):
+        return self.controller.make_move(r1, c1, r2, c2)
+
+    def undo(self):
+        return self.controller.undo()
+
+    def save_game(self, filename):
+        self.controller.save_game(filename)
+        return True
+
+    def load_game(self, filename):
+        self.controller.load_game(filename)
+        return True
+
+    def is_game_over(self):
+        return self.controller.is_game_over()
+
+    def reset(self):
+        self.controller.reset_game()
+
+    def close(self):
+        pass
+
+
+# One request per line, one reply line per request:
+#   moves                -> "r c r c,r c r c,..."
+#   move r c r c         -> "1" / "0"
+#   undo                 -> "1" / "0"
+#   save <file>, load <file>, reset -> "1"
+#   over                 -> "1" / "0"
+# Errors come back as "! <message>".
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        client = LocalClient()
+        for line in self.rfile:
+            command, _, arg = line.decode().strip().partition(" ")
+            try:
+                reply = self._dispatch(client, command, arg)
+            except Exception as exc:
+                reply = f"! {exc}"
+            self.wfile.write(reply.encode() + b"\n")
+
+    def _dispatch(self, client, command, arg):
+        if command == "moves":
+            return ",".join(" ".join(map(str, move)) for move in client.legal_moves())
+        if command == "move":
+            return "1" if client.make_move(*map(int, arg.split())) else "0"
+        if command == "undo":
+            return "1" if client.undo() else "0"
+        if command == "save":
+            return "1" if client.save_game(arg) else "0"
+        if command == "load":
+            return "1" if client.load_game(arg) else "0"
+        if command == "over":
+            return "1" if client.is_game_over() else "0"
+        if command == "reset":
+            client.reset()
+            return "1"
+        raise ValueError(f"unknown command {command!r}")
+
+
+class GameServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 1024
+
+    def __init__(self, address=("127.0.0.1", 0)):
+        super().__init__(address, _Handler)
+
+    def start(self):
+        thread = threading.Thread(target=self.serve_forever, name="load-test-server",
+                                  daemon=True)
+        thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class SocketClient:
+    def __init__(self, address):
+        self.sock = socket.create_connection(address)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.file = self.sock.makefile("rwb")
+
+    def _call(self, line):
+        self.file.write(line.encode() + b"\n")
+        self.file.flush()
+        reply = self.file.readline().decode().rstrip("\n")
+        if reply.startswith("!"):
+            raise RuntimeError(reply[2:])
+        return reply
+
+    def legal_moves(self):
+        reply = self._call("moves")
+        return [tuple(map(int, move.split())) for move in reply.split(",") if move]
+
+    def make_move(self, r1, c1, r2, c2):
+        return self._call(f"move {r1} {c1} {r2} {c2}") == "1"
+
+    def undo(self):
+        return self._call("undo") == "1"
+
+    def save_game(self, filename):
+        return self._call(f"save {filename}") == "1"
+
+    def load_game(self, filename):
+        return self._call(f"load {filename}") == "1"
+
+    def is_game_over(self):
+        return self._call("over") == "1"
+
+    def reset(self):
+        self._call("reset")
+
+    def close(self):
+        self.file.close()
+        self.sock.close()
+
+
+# -------- sessions --------
+
+class Session:
+    def __init__(self, client, rng, filename, script=None, undo_rate=0.05, save_rate=0.02):
+        self.client = client
+        self.rng = rng
+        self.filename = filename
+        self.script = script     # list of (r1, c1, r2, c2), replayed in a loop
+        self.undo_rate = undo_rate
+        self.save_rate = save_rate
+        self.ply = 0
+        self.latencies = {op: [] for op in OPERATIONS}
+
+    def _timed(self, op, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        self.latencies[op].append(time.perf_counter() - start)
+        return result
+
+    def _next_move(self):
+        if self.script is not None:
+            if self.ply < len(self.script):
+                return self.script[self.ply]
+            return None
+        moves = self.client.legal_moves()
+        return self.rng.choice(moves) if moves else None
+
+    # One action: a move, an undo, or a save followed by a load
+    def step(self):
+        roll = self.rng.random()
+        if roll < self.undo_rate:
+            # scripted games play straight through
+            if self.script is None and self.ply:
+                if self._timed("undo", self.client.undo):
+                    self.ply -= 1
+                return
+        elif roll < self.undo_rate + self.save_rate:
+            self._timed("save_game", self.client.save_game, self.filename)
+            self._timed("load_game", self.client.load_game, self.filename)
+            return
+        move = self._next_move()
+        if move is None or self.client.is_game_over():
+            self.client.reset()
+            self.ply = 0
+            return
+        if self._timed("make_move", self.client.make_move, *move):
+            self.ply += 1
+
+
+def _make_client(mode, address):
+    return SocketClient(address) if mode == "socket" else LocalClient()
+
+
+def _make_sessions(count, mode, address, directory, seed, script, undo_rate, save_rate):
+    return [
+        Session(_make_client(mode, address), random.Random(seed + i),
+                os.path.join(directory, f"session{i}.jungle"), script,
+                undo_rate, save_rate)
+        for i in range(count)
+    ]
+
+
+def _drive(sessions, actions):
+    for _ in range(actions):
+        for session in sessions:
+            session.step()
+
+
+def run(clients=100, actions=50, workers=8, mode="local", seed=0, script=None,
+        undo_rate=0.05, save_rate=0.02, memory_sample=50):
+    if mode not in ("local", "socket"):
+        raise ValueError(f"unknown mode {mode!r}")
+    server = GameServer().start() if mode == "socket" else None
+    address = server.server_address if server else None
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            sessions = _make_sessions(clients, mode, address, directory, seed, script,
+                                      undo_rate, save_rate)
+            threads = [
+                threading.Thread(target=_drive, args=(sessions[i::workers], actions))
+                for i in range(min(workers, clients))
+            ]
+            start = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - start
+            for session in sessions:
+                session.client.close()
+            memory = measure_session_memory(min(memory_sample, clients), actions,
+                                            directory, seed, script)
+    finally:
+        if server is not None:
+            server.stop()
+    return report(sessions, elapsed, memory, mode, workers, actions)
+
+
+# Traced bytes per in-process session after playing `actions` steps
+def measure_session_memory(count, actions, directory, seed=0, script=None):
+    if count <= 0:
+        return 0
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        sessions = _make_sessions(count, "local", None, directory, seed, script, 0.05, 0.0)
+        _drive(sessions, actions)
+        for session in sessions:
+            session.latencies = None   # the harness's bookkeeping, not the game's
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return (after - before) / count
+
+
+def report(sessions, elapsed, memory_per_session, mode, workers, actions):
+    operations = {}
+    total = 0
+    for op in OPERATIONS:
+        samples = sorted(t for session in sessions for t in session.latencies[op])
+        total += len(samples)
+        operations[op] = {
+            "count": len(samples),
+            "p50_ms": percentile(samples, 50) * 1e3,
+            "p90_ms": percentile(samples, 90) * 1e3,
+            "p99_ms": percentile(samples, 99) * 1e3,
+            "max_ms": (samples[-1] if samples else 0.0) * 1e3,
+        }
+    return {
+        "mode": mode,
+        "sessions": len(sessions),
+        "workers": workers,
+        "actions_per_session": actions,
+        "elapsed_s": elapsed,
+        "operations": operations,
+        "throughput_ops_s": total / elapsed if elapsed else 0.0,
+        "memory_per_session_bytes": memory_per_session,
+    }
+
+
+def print_report(result):
+    print(f"{result['sessions']} sessions, {result['workers']} workers, "
+          f"{result['mode']} mode, {result['elapsed_s']:.2f} s")
+    print(f"{'operation':<12}{'count':>9}{'p50 ms':>10}{'p90 ms':>10}"
+          f"{'p99 ms':>10}{'max ms':>10}")
+    for op, stats in result["operations"].items():
+        print(f"{op:<12}{stats['count']:>9}{stats['p50_ms']:>10.3f}{stats['p90_ms']:>10.3f}"
+              f"{stats['p99_ms']:>10.3f}{stats['max_ms']:>10.3f}")
+    print(f"throughput  {result['throughput_ops_s']:.0f} ops/s")
+    print(f"memory      {result['memory_per_session_bytes'] / 1024:.1f} KiB per session")
+
+
+# Operations whose p99 is over budget, as (op, p99_ms, budget_ms)
+def over_budget(result, budgets):
+    failures = []
+    for op, limit in budgets.items():
+        p99 = result["operations"][op]["p99_ms"]
+        if p99 > limit:
+            failures.append((op, p99, limit))
+    return failures
+
+
+def _parse_budget(text):
+    op, _, ms = text.partition("=")
+    if op not in OPERATIONS or not ms:
+        raise argparse.ArgumentTypeError(f"expected OP=MS with OP one of {', '.join(OPERATIONS)}")
+    return op, float(ms)
+
+
+# python -m benchmarks.load_test [--clients 1000] [--actions 50] [--workers 8]
+#                                [--mode local|socket] [--script game.record]
+#                                [--output report.json] [--budget make_move=5]
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load_test")
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--actions", type=int, default=50, help="actions per session")
+    parser.add_argument("--workers", type=int, default=8, help="driver threads")
+    parser.add_argument("--mode", choices=("local", "socket"), default="local")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--script", help="replay this .record game instead of random moves")
+    parser.add_argument("--undo-rate", type=float, default=0.05)
+    parser.add_argument("--save-rate", type=float, default=0.02)
+    parser.add_argument("--output", help="write the report as JSON to this file")
+    parser.add_argument("--budget", type=_parse_budget, action="append", default=[],
+                        metavar="OP=MS", help="fail if the p99 of OP exceeds MS")
+    args = parser.parse_args(argv)
+
+    script = GameState.replay_history(args.script) if args.script else None
+    result = run(args.clients, args.actions, args.workers, args.mode, args.seed, script,
+                 args.undo_rate, args.save_rate)
+    print_report(result)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+
+    failures = over_budget(result, dict(args.budget))
+    for op, p99, limit in failures:
+        print(f"OVER BUDGET {op}: p99 {p99:.3f} ms > {limit:.3f} ms")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
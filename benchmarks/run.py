@@ -0,0 +1,53 @@
+import argparse
+import os
+import sys
+
+from benchmarks import harness
+from benchmarks import bench_model  # noqa: F401  (registers benchmarks)
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+# python -m benchmarks.run [--output results.json] [--tolerance 0.25]
+#                          [--update-baseline] [name ...]
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run")
+    parser.add_argument("names", nargs="*", help="only run these benchmarks")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown relative to baseline (0.25 = 25%%)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="store these results as the new baseline")
+    args = parser.parse_args(argv)
+
+    report = harness.run_all(args.names)
+
+    if args.output:
+        harness.save(report, args.output)
+
+    if args.update_baseline:
+        if args.names and os.path.exists(args.baseline):
+            merged = harness.load(args.baseline)
+            merged["results"].update(report["results"])
+            report = merged
+        harness.save(report, args.baseline)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}, skipping comparison")
+        return 0
+
+    regressions = harness.compare(report, harness.load(args.baseline), args.tolerance)
+    for name, base, current, ratio in regressions:
+        print(f"REGRESSION {name}: {base * 1e3:.3f} ms -> {current * 1e3:.3f} ms "
+              f"({ratio:.2f}x)")
+    if regressions:
+        return 1
+    print(f"No regressions beyond {args.tolerance:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
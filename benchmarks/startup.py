@@ -0,0 +1,86 @@
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+# Cold-start benchmark built on `python -X importtime`.
+#
+# Each target module is imported in a fresh interpreter, several times; we
+# report the median wall time of the whole process, the median cumulative
+# import time of the target itself and the slowest imports it pulled in.
+
+TARGETS = [
+    "jungle_game.model.game_state",
+    "jungle_game.controller.game_controller",
+    "jungle_game.engine.engine",
+    "jungle_game.main",
+]
+
+
+# Returns {module: (self_us, cumulative_us)} parsed from -X importtime output
+def parse_importtime(stderr):
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except ValueError:
+            continue   # column header
+        times[fields[2].strip()] = (self_us, cumulative_us)
+    return times
+
+
+def measure(module, repeat=5):
+    walls = []
+    cumulative = []
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True, text=True, check=True
+        )
+        walls.append(time.perf_counter() - start)
+        times = parse_importtime(proc.stderr)
+        cumulative.append(times[module][1])
+        runs.append(times)
+    # slowest imports of the median run
+    median_run = runs[cumulative.index(sorted(cumulative)[len(cumulative) // 2])]
+    slowest = sorted(median_run.items(), key=lambda kv: kv[1][0], reverse=True)[:5]
+    return {
+        "wall": statistics.median(walls),
+        "import_us": statistics.median(cumulative),
+        "modules": sorted(median_run),
+        "slowest": [(name, self_us) for name, (self_us, _) in slowest],
+    }
+
+
+# python -m benchmarks.startup [--repeat 5] [--output startup.json] [module ...]
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.startup")
+    parser.add_argument("modules", nargs="*", help="modules to import (default: all targets)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for module in args.modules or TARGETS:
+        result = measure(module, args.repeat)
+        results[module] = result
+        print(f"{module:<40}{result['wall'] * 1e3:>10.1f} ms wall"
+              f"{result['import_us'] / 1e3:>10.1f} ms import")
+        for name, self_us in result["slowest"]:
+            print(f"    {name:<36}{self_us / 1e3:>10.1f} ms")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from jungle_game.model.encoding import square_of
+from jungle_game.engine import features
+
+# Bot players backed by a local (CPU) policy/value model.
+#
+# Many games share one BatchedEvaluator: each game submits its position and
+# waits on a Future while a worker thread gathers up to batch_size positions
+# (or whatever arrived within max_wait seconds) into a single model call.
+#
+# A model is any callable taking the encoded batch and returning
+# (policies, values), one row per position; policies are indexed by
+# features.move_index. The default encoder builds the NumPy planes from
+# engine/features.py; pass another encoder to feed a different input format.
+
+
+def encode_samples(samples):
+    codes, sides, undos = zip(*samples)
+    return features.encode_batch(codes, sides, undos)
+
+
+def state_sample(state):
+    return (features.state_codes(state), state.current_player,
+            (state.undo_used[1], state.undo_used[-1]))
+
+
+class BatchedEvaluator:
+    def __init__(self, model, batch_size=32, max_wait=0.005, encoder=encode_samples):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.model = model
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self.encoder = encoder
+        self.batches = 0
+        self.positions = 0
+        self._queue = queue.Queue()
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name="batched-evaluator",
+                                        daemon=True)
+        self._worker.start()
+
+    # Returns a Future resolving to (policy, value); asyncio callers can use
+    # asyncio.wrap_future on it
+    def submit(self, state):
+        if self._closed:
+            raise RuntimeError("evaluator is closed")
+        future = Future()
+        self._queue.put((state_sample(state), future))
+        return future
+
+    def evaluate(self, state):
+        return self.submit(state).result()
+
+    def _collect(self):
+        first = self._queue.get()
+        if first is None:
+            return None
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 \
+                    else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                # finish this batch, then stop
+                self._queue.put(None)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            if batch is None:
+                return
+            futures = [future for _, future in batch]
+            try:
+                policies, values = self.model(self.encoder([sample for sample, _ in batch]))
+            except Exception as exc:
+                for future in futures:
+                    future.set_exception(exc)
+                continue
+            self.batches += 1
+            self.positions += len(batch)
+            for i, future in enumerate(futures):
+                future.set_result((policies[i], values[i]))
+
+    def close(self):
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._worker.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class InferenceBot:
+    def __init__(self, evaluator):
+        self.evaluator = evaluator
+        self.last_value = None
+
+    # Legal move with the highest policy score, or None if there is none
+    def choose_move(self, state):
+        moves = state.get_legal_moves(state.current_player)
+        if not moves:
+            return None
+        policy, self.last_value = self.evaluator.evaluate(state)
+        return max(
+            moves,
+            key=lambda move: policy[features.move_index(square_of(move[0]), square_of(move[1]))]
+        )
+
+
+# Wraps an ONNX model file as a model callable (needs onnxruntime). The
+# model takes the float32 planes and returns policy logits and values.
+def load_onnx_model(path, threads=None):
+    import onnxruntime
+
+    options = onnxruntime.SessionOptions()
+    if threads:
+        options.intra_op_num_threads = threads
+    session = onnxruntime.InferenceSession(path, options,
+                                           providers=["CPUExecutionProvider"])
+    input_name = session.get_inputs()[0].name
+
+    def model(batch):
+        policies, values = session.run(None, {input_name: batch.astype("float32")})
+        return policies, values.reshape(-1)
+    return model
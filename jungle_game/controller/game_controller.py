@@ -1,14 +1,41 @@
+import threading
+from array import array
+
 from jungle_game.model.game_state import GameState
 from jungle_game.model.position import Position
+from jungle_game.model.recorder import RecordWriter
+from jungle_game.model.encoding import POSITIONS
 
 
 class GameController:
     def __init__(self, game_state=None):
         self.game_state = game_state or GameState()
+        self._listeners = []
+        self._pondering = None   # bot thinking on the opponent's time
+
+    # Listeners stay registered when the game is reset or loaded; they get a
+    # STATE_LOADED event whenever the whole position is replaced
+    def add_listener(self, listener):
+        self._listeners.append(listener)
+        self.game_state.add_listener(listener)
+
+    def remove_listener(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+        self.game_state.remove_listener(listener)
+
+    def _replace_state(self, game_state):
+        self.stop_pondering()
+        for listener in self._listeners:
+            self.game_state.remove_listener(listener)
+        self.game_state = game_state
+        for listener in self._listeners:
+            game_state.add_listener(listener)
+        game_state.notify_state_loaded()
 
     @classmethod
-    def new_game(cls):
-        return cls(GameState())
+    def new_game(cls, ruleset=None):
+        return cls(GameState(ruleset))
     
     #Get Board Info
     def get_current_player(self):
@@ -53,16 +80,78 @@ class GameController:
         to_pos = Position(to_row, to_col)
         return self.game_state.make_move(from_pos, to_pos)
 
+    def is_legal_move(self, from_row, from_col, to_row, to_col):
+        from_pos = Position(from_row, from_col)
+        to_pos = Position(to_row, to_col)
+        return self.game_state.is_legal(from_pos, to_pos)
+
+    # Lets a bot (e.g. bot_player.InferenceBot or an Engine) play for the
+    # side to move. Returns the move played, or None if the bot had no move.
+    # With ponder=True a bot that supports it keeps searching in the
+    # background while the opponent thinks.
+    def make_bot_move(self, bot, ponder=False):
+        if self.game_state.is_game_over():
+            return None
+        self._hand_over_pondering(bot)
+        move = bot.choose_move(self.game_state)
+        if move is None or not self.game_state.make_move(*move):
+            return None
+        if ponder:
+            self.start_pondering(bot)
+        return move
+
+    # make_bot_move for an event loop: the bot searches a copy of the game
+    # in a worker thread. Poll the returned PendingBotMove until done() and
+    # pass it to finish_bot_move on the thread that owns the game.
+    def start_bot_move(self, bot):
+        if self.game_state.is_game_over():
+            return None
+        self._hand_over_pondering(bot)
+        return PendingBotMove(bot, self.game_state)
+
+    # Plays the move a PendingBotMove found, unless the game changed while
+    # the bot was thinking (undo, load, reset). Returns the move or None.
+    def finish_bot_move(self, pending, ponder=False):
+        move = pending.move
+        if move is None or pending.stale(self.game_state) or \
+                not self.game_state.make_move(*move):
+            return None
+        if ponder:
+            self.start_pondering(pending.bot)
+        return move
+
+    # Returns the reply the bot is pondering on, or None if it cannot ponder
+    def start_pondering(self, bot):
+        self.stop_pondering()
+        if not hasattr(bot, "start_pondering") or self.game_state.is_game_over():
+            return None
+        self._pondering = bot
+        return bot.start_pondering(self.game_state)
+
+    def stop_pondering(self):
+        if self._pondering is not None:
+            self._pondering.stop_pondering()
+            self._pondering = None
+
+    # Before a bot moves: its own search takes over its pondering session
+    # (ponder hit or miss); any other bot's pondering is stopped
+    def _hand_over_pondering(self, bot):
+        if bot is self._pondering:
+            self._pondering = None
+        else:
+            self.stop_pondering()
+
     def undo(self):
         # No moves made → nothing to undo
         if not self.game_state.move_history:
             return False
 
         # The player who made the last move (stored in history)
-        last_player = self.game_state.move_history[-1][3]
+        last_player = self.game_state.move_history.last_player()
 
         # Check if that player is allowed to undo
         if self.game_state.can_undo(last_player):
+            self.stop_pondering()
             return self.game_state.undo_last_move()
 
         return False
@@ -77,7 +166,23 @@ class GameController:
         self.game_state.save_record(filename)
 
     def load_game(self, filename):
-        self.game_state = GameState.load_game(filename)
+        self.stop_recording()
+        self._replace_state(GameState.load_game(filename))
+
+    # Append moves to a .record file as they are played (crash-safe logging).
+    # The file is started over unless resume=True, which continues a record
+    # of this same game.
+    def start_recording(self, filename, flush_every=1, flush_interval=None, resume=False):
+        self.stop_recording()
+        self.game_state.attach_recorder(
+            RecordWriter(filename, flush_every=flush_every, flush_interval=flush_interval,
+                         resume=resume)
+        )
+
+    def stop_recording(self):
+        recorder = self.game_state.detach_recorder()
+        if recorder is not None:
+            recorder.close()
 
     def replay_game(self, filename):
         self.reset_game()
@@ -89,8 +194,50 @@ class GameController:
         to_pos = Position(r2, c2)
         self.game_state.make_move(from_pos, to_pos)
 
+    # Apply many moves in one call. moves is an iterable of (r1, c1, r2, c2)
+    # tuples (a NumPy (N, 4) array works too), or a bytes, bytearray,
+    # memoryview or array('B') of (from_square, to_square) byte pairs.
+    # Listeners are skipped during the loop and get one STATE_LOADED at the
+    # end; an attached recorder still receives every applied move. Any
+    # pondering is stopped.
+    # Returns (number applied, index of the first illegal move or None).
+    def apply_moves(self, moves, stop_on_illegal=True):
+        self.stop_pondering()
+        state = self.game_state
+        if isinstance(moves, (bytes, bytearray, memoryview)) or \
+                (isinstance(moves, array) and moves.typecode == "B"):
+            moves = _unpack_moves(moves)
+
+        listeners = state.take_listeners()
+        start_ply = len(state.move_history)
+        applied = 0
+        first_failure = None
+        make_move = state.make_move
+        try:
+            for index, (r1, c1, r2, c2) in enumerate(moves):
+                if 0 <= r1 < 9 and 0 <= c1 < 7 and 0 <= r2 < 9 and 0 <= c2 < 7 and \
+                        make_move(POSITIONS[r1 * 7 + c1], POSITIONS[r2 * 7 + c2]):
+                    applied += 1
+                    continue
+                if first_failure is None:
+                    first_failure = index
+                if stop_on_illegal:
+                    break
+        finally:
+            state.restore_listeners(listeners)
+            if state.recorder is not None:
+                history = state.move_history
+                for ply in range(start_ply, len(history)):
+                    from_sq, to_sq, code, player = history.raw(ply)
+                    state.recorder.write_move(from_sq, to_sq, code or None, player)
+            if applied:
+                state.notify_state_loaded()
+        return applied, first_failure
+
     def reset_game(self):
-        self.game_state = GameState()
+        self.stop_recording()
+        # a new game keeps the variant being played
+        self._replace_state(GameState(self.game_state.board.ruleset))
 
 
     #Game State Info
@@ -99,3 +246,39 @@ class GameController:
 
     def get_winner(self):
         return self.game_state.get_winner()
+
+
+class PendingBotMove:
+    def __init__(self, bot, game_state):
+        self.bot = bot
+        self.move = None
+        self._game_state = game_state
+        self._position = game_state.to_bytes()
+        self._thread = threading.Thread(
+            target=self._run, args=(GameState.from_bytes(self._position),),
+            name="bot-move", daemon=True)
+        self._thread.start()
+
+    def _run(self, position):
+        self.move = self.bot.choose_move(position)
+
+    def done(self):
+        return not self._thread.is_alive()
+
+    def wait(self, timeout=None):
+        self._thread.join(timeout)
+        return self.done()
+
+    # True if game_state is no longer the position the bot was asked about
+    def stale(self, game_state):
+        return game_state is not self._game_state or \
+            game_state.to_bytes() != self._position
+
+
+def _unpack_moves(buffer):
+    data = bytes(buffer)
+    if len(data) % 2:
+        raise ValueError("packed moves must be (from_square, to_square) byte pairs")
+    it = iter(data)
+    for from_sq, to_sq in zip(it, it):
+        yield from_sq // 7, from_sq % 7, to_sq // 7, to_sq % 7
@@ -0,0 +1,188 @@
+import argparse
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from jungle_game.model.game_state import GameState
+from jungle_game.model.position import Position
+from jungle_game.engine.search import Searcher
+from jungle_game.engine.evaluation import WIN_SCORE
+from jungle_game.engine.transposition import TranspositionTable
+from jungle_game.engine.cache import EvaluationCache, cached_search, cache_key
+
+# Batch analysis of .record files.
+#
+# Every ply is searched to a fixed depth; the played move is compared with
+# the engine's choice and labelled by how much evaluation it gave away.
+# Results go to a JSON sidecar next to the record (<name>.record.analysis).
+# Games run in parallel in a process pool; the transposition table is
+# shared between the plies of one game, and an optional EvaluationCache
+# carries results over to later runs.
+
+SIDECAR_SUFFIX = ".analysis"
+
+# evaluation loss thresholds, in evaluation units (a cat is worth 200)
+INACCURACY = 60
+MISTAKE = 150
+BLUNDER = 350
+
+
+def label_for(delta):
+    if delta >= BLUNDER:
+        return "blunder"
+    if delta >= MISTAKE:
+        return "mistake"
+    if delta >= INACCURACY:
+        return "inaccuracy"
+    return None
+
+
+def _move_list(move):
+    fr, to = move
+    return [fr.row, fr.col, to.row, to.col]
+
+
+def _played_score(searcher, state, from_pos, to_pos, depth, cache):
+    child = GameState.from_bytes(state.to_bytes())
+    if not child.make_move(from_pos, to_pos):
+        return None
+    if child.game_over:
+        return WIN_SCORE
+    return -cached_search(searcher, child, depth - 1, cache).score
+
+
+# Cache keys of every position in the game (including the one after each
+# move), so a cache can load them in one go
+def game_position_keys(moves, quiescence=True):
+    state = GameState()
+    keys = [cache_key(state, quiescence)]
+    for r1, c1, r2, c2 in moves:
+        if not state.make_move(Position(r1, c1), Position(r2, c2)):
+            break
+        keys.append(cache_key(state, quiescence))
+        if state.is_game_over():
+            break
+    return keys
+
+
+def analyse_moves(moves, depth=3, max_nodes=None, tt=None, cache=None):
+    state = GameState()
+    searcher = Searcher(tt if tt is not None else TranspositionTable(), max_nodes=max_nodes)
+    plies = []
+    if cache is not None:
+        cache.prefetch(game_position_keys(moves, searcher.quiescence))
+
+    for ply, (r1, c1, r2, c2) in enumerate(moves):
+        if state.is_game_over():
+            break
+        from_pos, to_pos = Position(r1, c1), Position(r2, c2)
+        best = cached_search(searcher, state, depth, cache)
+
+        entry = {
+            "ply": ply,
+            "player": 1 if state.current_player == 1 else 2,
+            "move": [r1, c1, r2, c2],
+            "best_move": None if best.move is None else _move_list(best.move),
+            "best_score": best.score,
+        }
+
+        if best.move is not None and _move_list(best.move) == entry["move"]:
+            played_score = best.score
+        else:
+            played_score = _played_score(searcher, state, from_pos, to_pos, depth, cache)
+
+        if played_score is None:
+            entry["label"] = "illegal"
+            plies.append(entry)
+            break
+
+        delta = max(0, best.score - played_score)
+        entry["played_score"] = played_score
+        entry["delta"] = delta
+        entry["label"] = label_for(delta)
+        plies.append(entry)
+
+        state.make_move(from_pos, to_pos)
+
+    return plies
+
+
+def analyse_record(filename, depth=3, max_nodes=None, write_sidecar=True, cache=None):
+    moves = GameState.replay_history(filename)
+    plies = analyse_moves(moves, depth=depth, max_nodes=max_nodes, cache=cache)
+    result = {
+        "record": filename,
+        "depth": depth,
+        "plies": plies,
+        "summary": summarise(plies)
+    }
+    if write_sidecar:
+        with open(filename + SIDECAR_SUFFIX, "w") as f:
+            json.dump(result, f, indent=2)
+    return result
+
+
+def summarise(plies):
+    summary = {}
+    for player in (1, 2):
+        labels = [p["label"] for p in plies if p["player"] == player]
+        summary[str(player)] = {
+            "moves": len(labels),
+            "inaccuracies": labels.count("inaccuracy"),
+            "mistakes": labels.count("mistake"),
+            "blunders": labels.count("blunder"),
+        }
+    return summary
+
+
+def _analyse_job(args):
+    filename, depth, max_nodes, cache_path = args
+    cache = EvaluationCache(cache_path) if cache_path else None
+    try:
+        result = analyse_record(filename, depth=depth, max_nodes=max_nodes, cache=cache)
+        return filename, result["summary"], None
+    except (OSError, ValueError) as exc:
+        return filename, None, str(exc)
+    finally:
+        if cache is not None:
+            cache.close()
+
+
+def analyse_records(filenames, depth=3, workers=None, max_nodes=None, cache_path=None):
+    jobs = [(name, depth, max_nodes, cache_path) for name in filenames]
+    if workers == 1:
+        return [_analyse_job(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_analyse_job, jobs))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m jungle_game.engine.analysis",
+        description="Annotate .record files with engine analysis."
+    )
+    parser.add_argument("records", nargs="+")
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="processes to use (default: one per CPU)")
+    parser.add_argument("--max-nodes", type=int, default=None,
+                        help="node budget per searched position")
+    parser.add_argument("--cache", default=None,
+                        help="SQLite file with results from earlier runs")
+    args = parser.parse_args(argv)
+
+    failed = 0
+    for filename, summary, error in analyse_records(
+            args.records, args.depth, args.workers, args.max_nodes, args.cache):
+        if error is not None:
+            failed += 1
+            print(f"{filename}: FAILED ({error})")
+        else:
+            p1, p2 = summary["1"], summary["2"]
+            print(f"{filename}: P1 {p1['mistakes']} mistakes / {p1['blunders']} blunders, "
+                  f"P2 {p2['mistakes']} mistakes / {p2['blunders']} blunders")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+import hashlib
+from functools import lru_cache
+
+from jungle_game.model.encoding import move_code, move_from_code
+from jungle_game.engine.search import SearchResult
+from jungle_game.engine.evaluation import EVAL_VERSION
+from jungle_game.engine.transposition import position_key
+
+# Persistent search cache shared across runs.
+#
+# Keyed by cache_key(): the Zobrist position key mixed with the ruleset and
+# the search settings, since the same pieces score differently under other
+# rules, with quiescence off or with another evaluation. Each row keeps the
+# depth, score and best move of the deepest search seen for that key; a
+# shallower result never replaces a deeper one, even from another process.
+# A use counter gives LRU-style trimming once the table grows past
+# max_entries. Reads can be served from an in-memory dict filled in bulk by
+# prefetch().
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS positions (
+    key INTEGER PRIMARY KEY,
+    depth INTEGER NOT NULL,
+    score INTEGER NOT NULL,
+    best_move INTEGER,
+    used INTEGER NOT NULL
+)
+"""
+_CHUNK = 500
+# flushes between exact row counts when the table looks small enough
+TRIM_EVERY = 100
+
+
+# Stable across processes and runs (unlike hash()), so a shared file stays
+# consistent
+@lru_cache(maxsize=None)
+def _context_key(ruleset_name, quiescence):
+    text = f"{ruleset_name}|quiescence={int(bool(quiescence))}|eval={EVAL_VERSION}"
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "little")
+
+
+def cache_key(state, quiescence=True):
+    return position_key(state) ^ _context_key(state.board.ruleset.name, quiescence)
+
+
+def _db_key(key):
+    # SQLite integers are signed 64-bit
+    return key - (1 << 64) if key >= (1 << 63) else key
+
+
+class EvaluationCache:
+    def __init__(self, path, max_entries=1000000, flush_every=1000):
+        self.path = path
+        self.max_entries = max_entries
+        self.flush_every = flush_every
+        import sqlite3
+        # several analysis processes may share one file
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(_SCHEMA)
+        self.conn.commit()
+        row = self.conn.execute("SELECT MAX(used), COUNT(*) FROM positions").fetchone()
+        self._clock = row[0] or 0
+        # upper bound on the row count: the last exact count plus rows
+        # written since (other processes' rows show up at the next count)
+        self._rows = row[1]
+        self._flushes = 0
+        self._memory = {}      # key -> (depth, score, best_move)
+        self._pending = {}     # key -> (depth, score, best_move, used) not written yet
+        self._touched = {}     # key -> used, for rows that were only read
+        self.hits = 0
+        self.misses = 0
+
+    def _tick(self):
+        self._clock += 1
+        return self._clock
+
+    def prefetch(self, keys):
+        wanted = [_db_key(k) for k in set(keys) if k not in self._memory]
+        for start in range(0, len(wanted), _CHUNK):
+            chunk = wanted[start:start + _CHUNK]
+            marks = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT key, depth, score, best_move FROM positions WHERE key IN ({marks})",
+                chunk
+            )
+            for key, depth, score, best_move in rows:
+                self._memory[key % (1 << 64)] = (depth, score, best_move)
+
+    def get(self, key, min_depth=0):
+        entry = self._pending.get(key)
+        if entry is not None:
+            entry = entry[:3]
+        else:
+            entry = self._memory.get(key)
+        if entry is None:
+            row = self.conn.execute(
+                "SELECT depth, score, best_move FROM positions WHERE key = ?",
+                (_db_key(key),)
+            ).fetchone()
+            if row is not None:
+                entry = tuple(row)
+                self._memory[key] = entry
+        if entry is None or entry[0] < min_depth:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._touched[key] = self._tick()
+        return entry
+
+    def put(self, key, depth, score, best_move):
+        current = self._pending.get(key) or self._memory.get(key)
+        if current is not None and current[0] > depth:
+            return
+        self._pending[key] = (depth, score, best_move, self._tick())
+        self._memory[key] = (depth, score, best_move)
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        if self._pending:
+            self.conn.executemany(
+                "INSERT INTO positions (key, depth, score, best_move, used) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET depth = excluded.depth, "
+                "score = excluded.score, best_move = excluded.best_move, "
+                "used = excluded.used WHERE excluded.depth >= positions.depth",
+                [(_db_key(k),) + v for k, v in self._pending.items()]
+            )
+            self._rows += len(self._pending)
+            self._pending.clear()
+        if self._touched:
+            self.conn.executemany(
+                "UPDATE positions SET used = ? WHERE key = ?",
+                [(used, _db_key(k)) for k, used in self._touched.items()]
+            )
+            self._touched.clear()
+        self._trim()
+        self.conn.commit()
+
+    # COUNT(*) scans the table, so it only runs once the estimate passes
+    # max_entries or every TRIM_EVERY flushes
+    def _trim(self):
+        self._flushes += 1
+        if self._rows <= self.max_entries and self._flushes % TRIM_EVERY:
+            return
+        self._rows = self.conn.execute("SELECT COUNT(*) FROM positions").fetchone()[0]
+        excess = self._rows - self.max_entries
+        if excess > 0:
+            self.conn.execute(
+                "DELETE FROM positions WHERE key IN "
+                "(SELECT key FROM positions ORDER BY used LIMIT ?)",
+                (excess,)
+            )
+            self._rows -= excess
+            self._memory.clear()
+
+    def __len__(self):
+        self.flush()
+        return self.conn.execute("SELECT COUNT(*) FROM positions").fetchone()[0]
+
+    def close(self):
+        if self.conn is not None:
+            self.flush()
+            self.conn.close()
+            self.conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def cached_search(searcher, state, depth, cache):
+    if cache is None:
+        return searcher.search(state, depth)
+    key = cache_key(state, searcher.quiescence)
+    entry = cache.get(key, min_depth=depth)
+    if entry is not None:
+        stored_depth, score, best_move = entry
+        move = None if best_move is None else move_from_code(best_move)
+        return SearchResult(move, score, stored_depth, 0)
+    result = searcher.search(state, depth)
+    if result.depth >= depth:
+        best_move = None if result.move is None else move_code(*result.move)
+        cache.put(key, result.depth, result.score, best_move)
+    return result
@@ -0,0 +1,102 @@
+from jungle_game.engine.search import Searcher
+from jungle_game.engine.transposition import TranspositionTable, SharedTranspositionTable
+from jungle_game.engine.cache import EvaluationCache, cached_search
+
+
+class Engine:
+    def __init__(self, depth=3, workers=1, tt_entries=1 << 16, max_nodes=None,
+                 time_limit=None, cache=None, quiescence=True):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.depth = depth
+        self.workers = workers
+        self.tt_entries = tt_entries
+        self.max_nodes = max_nodes
+        self.time_limit = time_limit
+        # resolve captures past the nominal depth (see search.py)
+        self.quiescence = quiescence
+        # optional persistent cache: an EvaluationCache or a path to one
+        self._owns_cache = isinstance(cache, str)
+        self.cache = EvaluationCache(cache) if self._owns_cache else cache
+        self._tt = None
+        self._ponder = None
+
+    @property
+    def tt(self):
+        # kept between searches so later moves reuse earlier work
+        if self._tt is None:
+            if self.workers > 1:
+                self._tt = SharedTranspositionTable(self.tt_entries)
+            else:
+                self._tt = TranspositionTable(self.tt_entries)
+        return self._tt
+
+    def search(self, state, depth=None):
+        depth = depth or self.depth
+        if self._ponder is not None:
+            ponder, self._ponder = self._ponder, None
+            result = ponder.finish(state, depth)
+            if result is not None:
+                return result
+        if self.workers > 1:
+            searcher = _ParallelSearcher(self)
+        else:
+            searcher = Searcher(self.tt, max_nodes=self.max_nodes,
+                                time_limit=self.time_limit, quiescence=self.quiescence)
+        return cached_search(searcher, state, depth, self.cache)
+
+    def best_move(self, state, depth=None):
+        return self.search(state, depth).move
+
+    # lets an Engine act as a bot for GameController.make_bot_move
+    choose_move = best_move
+
+    # Starts searching the expected reply in the background; call it with
+    # the opponent to move, right after the engine's own move. The next
+    # search() picks the work up (see ponder.py).
+    def start_pondering(self, state, depth=None):
+        from jungle_game.engine.ponder import Ponderer
+        self.stop_pondering()
+        if state.is_game_over():
+            return None
+        self._ponder = Ponderer(self, state, depth or self.depth)
+        return self._ponder.move
+
+    def stop_pondering(self):
+        if self._ponder is not None:
+            self._ponder.stop()
+            self._ponder = None
+
+    @property
+    def pondering(self):
+        return self._ponder is not None and self._ponder.active
+
+    def close(self):
+        self.stop_pondering()
+        if isinstance(self._tt, SharedTranspositionTable):
+            self._tt.close()
+        self._tt = None
+        if self._owns_cache and self.cache is not None:
+            self.cache.close()
+            self.cache = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class _ParallelSearcher:
+    def __init__(self, engine):
+        self.engine = engine
+        self.quiescence = engine.quiescence
+
+    def search(self, state, depth):
+        # imported on first use so single-worker engines skip multiprocessing
+        from jungle_game.engine.parallel import parallel_search
+        engine = self.engine
+        return parallel_search(state, depth, engine.workers, tt=engine.tt,
+                               max_nodes=engine.max_nodes,
+                               time_limit=engine.time_limit,
+                               quiescence=engine.quiescence)
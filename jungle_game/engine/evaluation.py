@@ -0,0 +1,57 @@
+# Static evaluation, always from the point of view of the side to move.
+
+WIN_SCORE = 100000
+# anything above this is a forced win / loss found by search
+WIN_THRESHOLD = WIN_SCORE - 1000
+
+# material by rank; the rat is worth more than its rank because it is the
+# only piece that can take the elephant and the only one that swims
+PIECE_VALUES = {
+    8: 1000,  # Elephant
+    7: 900,   # Lion
+    6: 800,   # Tiger
+    5: 450,   # Leopard
+    4: 400,   # Wolf
+    3: 300,   # Dog
+    2: 200,   # Cat
+    1: 350,   # Rat
+}
+
+ADVANCE_BONUS = 6
+DEN_APPROACH_BONUS = 60
+
+# bump whenever evaluate() changes, so persistent caches drop older scores
+EVAL_VERSION = 1
+
+
+def _den_distance(row, col, goal):
+    return abs(row - goal // 7) + abs(col - goal % 7)
+
+
+def evaluate(state):
+    if state.game_over:
+        if state.winner is None:
+            return 0
+        return WIN_SCORE if state.winner == state.current_player else -WIN_SCORE
+
+    score = 0
+    pieces = state.board.pieces
+    goal = state.board.ruleset.goal
+    for row in range(9):
+        for col in range(7):
+            piece = pieces[row][col]
+            if piece is None:
+                continue
+            value = PIECE_VALUES[piece.animal_type.rank]
+            advance = 8 - row if piece.player == 1 else row
+            value += advance * ADVANCE_BONUS
+            if _den_distance(row, col, goal[piece.player]) <= 2:
+                value += DEN_APPROACH_BONUS
+            score += value if piece.player == 1 else -value
+
+    return score if state.current_player == 1 else -score
+
+
+def is_win_score(score):
+    return abs(score) >= WIN_THRESHOLD
+
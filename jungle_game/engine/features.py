@@ -0,0 +1,271 @@
+import argparse
+import sys
+
+from jungle_game.model.board import LAND, RIVER, TRAP_P1, TRAP_P2, DEN_P1, DEN_P2
+from jungle_game.model.encoding import ROWS, COLS, NUM_SQUARES, EMPTY, piece_code
+from jungle_game.model.rules import STANDARD
+from jungle_game.model.game_state import GameState
+from jungle_game.model.recorder import UNDO_MARKER
+
+# Fixed-size network inputs and policy indices for training on self-play.
+#
+# Input planes, each 9x7 (uint8):
+#   0..15   occupancy, one plane per piece code 1..16 (P1 ranks, then P2)
+#   16..21  tile type one-hot: land, river, P1 trap, P2 trap, P1 den, P2 den
+#   22      side to move (all ones when player 1 is to move)
+#   23, 24  undos used by player 1 / player 2 (constant plane)
+#
+# Policy: 8 slots per square, index = from_sq * 8 + direction * 2 + is_jump,
+# direction in DIRECTIONS order. The index helpers are plain Python; the
+# array paths need NumPy, which is imported on first use.
+#
+# Tile planes and jump slots follow the standard layout (.record files do
+# not name a ruleset), so encode_state refuses games of other rulesets.
+
+OCCUPANCY_PLANES = 16
+TILE_TYPES = (LAND, RIVER, TRAP_P1, TRAP_P2, DEN_P1, DEN_P2)
+SIDE_PLANE = OCCUPANCY_PLANES + len(TILE_TYPES)
+UNDO_PLANES = (SIDE_PLANE + 1, SIDE_PLANE + 2)
+NUM_PLANES = SIDE_PLANE + 3
+
+DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+POLICY_SIZE = NUM_SQUARES * len(DIRECTIONS) * 2
+
+_STEP = {}
+for _sq in range(NUM_SQUARES):
+    _row, _col = divmod(_sq, COLS)
+    for _d, (_dr, _dc) in enumerate(DIRECTIONS):
+        _r, _c = _row + _dr, _col + _dc
+        if 0 <= _r < ROWS and 0 <= _c < COLS:
+            _STEP[(_sq, _r * COLS + _c)] = _d
+# (from_sq, to_sq) -> policy index, for every geometrically possible move
+_INDEX = {}
+# policy index -> (from_sq, to_sq); None for slots that go off the board
+_MOVES = [None] * POLICY_SIZE
+for (_from, _to), _d in _STEP.items():
+    _INDEX[(_from, _to)] = _from * 8 + _d * 2
+for _from in range(NUM_SQUARES):
+    for _land, _over in STANDARD.jumps[_from]:
+        _d = _STEP[(_from, _over[0])]
+        _INDEX[(_from, _land)] = _from * 8 + _d * 2 + 1
+for (_from, _to), _index in _INDEX.items():
+    _MOVES[_index] = (_from, _to)
+
+
+def move_index(from_sq, to_sq):
+    index = _INDEX.get((from_sq, to_sq))
+    if index is None:
+        raise ValueError(f"no policy slot for move {from_sq} -> {to_sq}")
+    return index
+
+
+def index_move(index):
+    move = _MOVES[index]
+    if move is None:
+        raise ValueError(f"policy index {index} is not a move")
+    return move
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("tensor export needs NumPy (pip install numpy)") from None
+    return numpy
+
+
+_static_planes = None
+
+
+def _tile_planes(np):
+    global _static_planes
+    if _static_planes is None:
+        tiles = np.array(STANDARD.flat_tiles, dtype=np.uint8)
+        _static_planes = np.stack([
+            (tiles == t).astype(np.uint8) for t in TILE_TYPES
+        ]).reshape(len(TILE_TYPES), ROWS, COLS)
+    return _static_planes
+
+
+# Batched encoder: codes (N, 63), sides (N,) as 1/-1, undos (N, 2)
+# -> uint8 array (N, NUM_PLANES, 9, 7). out may be a preallocated slice.
+def encode_batch(codes, sides, undos, out=None):
+    np = _numpy()
+    codes = np.asarray(codes, dtype=np.uint8).reshape(-1, NUM_SQUARES)
+    n = codes.shape[0]
+    if out is None:
+        out = np.empty((n, NUM_PLANES, ROWS, COLS), dtype=np.uint8)
+    flat = out.reshape(n, NUM_PLANES, NUM_SQUARES)
+    flat[:, :OCCUPANCY_PLANES] = (
+        codes[:, None, :] == np.arange(1, OCCUPANCY_PLANES + 1, dtype=np.uint8)[None, :, None]
+    )
+    out[:, OCCUPANCY_PLANES:SIDE_PLANE] = _tile_planes(np)
+    out[:, SIDE_PLANE] = (np.asarray(sides).reshape(n) == 1)[:, None, None]
+    undos = np.asarray(undos, dtype=np.uint8).reshape(n, 2)
+    out[:, UNDO_PLANES[0]] = undos[:, 0, None, None]
+    out[:, UNDO_PLANES[1]] = undos[:, 1, None, None]
+    return out
+
+
+def state_codes(state):
+    return [piece_code(p) for row in state.board.pieces for p in row]
+
+
+def encode_state(state):
+    if state.board.ruleset is not STANDARD:
+        raise ValueError(f"features cover the standard rules, not {state.board.ruleset.name!r}")
+    planes = encode_batch(
+        [state_codes(state)], [state.current_player],
+        [(state.undo_used[1], state.undo_used[-1])]
+    )
+    return planes[0]
+
+
+# -------- .record archives --------
+
+# Replays one .record file on flat codes. Returns (samples, winner) where
+# samples are (codes, side, undo_p1, undo_p2, policy_index) for every move
+# still on the board at the end (taken-back moves are dropped) and winner is
+# 1, -1 or 0 if the game did not finish.
+def record_samples(filename):
+    game = GameState()
+    codes = state_codes(game)
+    side = 1
+    undo_used = {1: 0, -1: 0}
+    samples = []
+    undo_stack = []   # (from_sq, to_sq, captured code, side) per played move
+    winner = 0
+    with open(filename) as f:
+        next(f, None)   # header row
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if line == UNDO_MARKER:
+                if undo_stack:
+                    from_sq, to_sq, captured, side = undo_stack.pop()
+                    codes[from_sq] = codes[to_sq]
+                    codes[to_sq] = captured
+                    undo_used[side] += 1
+                    samples.pop()
+                    winner = 0
+                continue
+            r1, c1, r2, c2, _, _ = map(int, line.split())
+            from_sq, to_sq = r1 * COLS + c1, r2 * COLS + c2
+            samples.append((bytes(codes), side, undo_used[1], undo_used[-1],
+                            move_index(from_sq, to_sq)))
+            captured = codes[to_sq]
+            undo_stack.append((from_sq, to_sq, captured, side))
+            codes[to_sq] = codes[from_sq]
+            codes[from_sq] = EMPTY
+            if STANDARD.flat_tiles[to_sq] == (DEN_P2 if side == 1 else DEN_P1):
+                winner = side
+            elif captured != EMPTY and not any(
+                code != EMPTY and (code <= 8) != (side == 1) for code in codes
+            ):
+                winner = side
+            else:
+                side = -side
+    return samples, winner
+
+
+# Appends rows to a .npy file whose length is only known at the end: the
+# header is reserved up front and rewritten with the final shape by close()
+class _NpyAppender:
+    HEADER_SIZE = 128   # magic + header, room for any row count
+
+    def __init__(self, np, filename, dtype, row_shape):
+        self.np = np
+        self.dtype = np.dtype(dtype)
+        self.row_shape = tuple(row_shape)
+        self.rows = 0
+        self.file = open(filename, "wb")
+        self._write_header()
+
+    def _write_header(self):
+        from numpy.lib import format as npy_format
+        header = repr({
+            "descr": npy_format.dtype_to_descr(self.dtype),
+            "fortran_order": False,
+            "shape": (self.rows,) + self.row_shape,
+        })
+        magic = npy_format.magic(1, 0)
+        size = self.HEADER_SIZE - len(magic) - 2
+        self.file.write(magic + size.to_bytes(2, "little")
+                        + header.encode("latin1").ljust(size - 1) + b"\n")
+
+    def append(self, rows):
+        self.file.write(self.np.ascontiguousarray(rows, dtype=self.dtype).tobytes())
+        self.rows += len(rows)
+
+    def close(self):
+        self.file.seek(0)
+        self._write_header()
+        self.file.close()
+
+
+# Streams .record files into three .npy files without holding the corpus in
+# memory: <prefix>_planes.npy (N, NUM_PLANES, 9, 7) uint8, <prefix>_policy.npy
+# (N,) int16 and <prefix>_value.npy (N,) int8 (+1 if the side to move went on
+# to win, -1 if it lost, 0 if unfinished). Each record is parsed once; rows
+# are encoded chunk by chunk and appended, and the headers get the final
+# count at the end.
+def export_records(filenames, prefix, chunk=4096):
+    np = _numpy()
+
+    planes = _NpyAppender(np, f"{prefix}_planes.npy", np.uint8, (NUM_PLANES, ROWS, COLS))
+    policy = _NpyAppender(np, f"{prefix}_policy.npy", np.int16, ())
+    value = _NpyAppender(np, f"{prefix}_value.npy", np.int8, ())
+
+    codes = np.empty((chunk, NUM_SQUARES), dtype=np.uint8)
+    sides = np.empty(chunk, dtype=np.int8)
+    undos = np.empty((chunk, 2), dtype=np.uint8)
+    indices = np.empty(chunk, dtype=np.int16)
+    values = np.empty(chunk, dtype=np.int8)
+    out = np.empty((chunk, NUM_PLANES, ROWS, COLS), dtype=np.uint8)
+    pending = 0
+
+    def flush(count):
+        planes.append(encode_batch(codes[:count], sides[:count], undos[:count],
+                                   out=out[:count]))
+        policy.append(indices[:count])
+        value.append(values[:count])
+
+    try:
+        for name in filenames:
+            samples, winner = record_samples(name)
+            for position, side, undo_p1, undo_p2, index in samples:
+                codes[pending] = np.frombuffer(position, dtype=np.uint8)
+                sides[pending] = side
+                undos[pending] = (undo_p1, undo_p2)
+                indices[pending] = index
+                values[pending] = 0 if winner == 0 else (1 if winner == side else -1)
+                pending += 1
+                if pending == chunk:
+                    flush(pending)
+                    pending = 0
+        if pending:
+            flush(pending)
+    finally:
+        for appender in (planes, policy, value):
+            appender.close()
+    return planes.rows
+
+
+# python -m jungle_game.engine.features OUTPUT_PREFIX game.record [...]
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m jungle_game.engine.features",
+        description="Convert .record files into memory-mapped .npy training data."
+    )
+    parser.add_argument("prefix", help="output prefix for the .npy files")
+    parser.add_argument("records", nargs="+")
+    parser.add_argument("--chunk", type=int, default=4096)
+    args = parser.parse_args(argv)
+    count = export_records(args.records, args.prefix, args.chunk)
+    print(f"wrote {count} positions to {args.prefix}_*.npy")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+import multiprocessing
+import queue
+
+from jungle_game.model.game_state import GameState
+from jungle_game.model.encoding import move_code, move_from_code
+from jungle_game.engine.search import Searcher, SearchResult
+from jungle_game.engine.transposition import SharedTranspositionTable
+
+# Lazy SMP: every worker searches the same root with its own depth offset and
+# root move order, and they cooperate only through a shared transposition
+# table. The calling process runs worker 0 itself; once it finishes, the
+# helpers are told to stop and the deepest completed result wins.
+
+# seconds between checks for helpers that died without a result
+RESULT_POLL = 0.5
+
+
+def _helper(state_bytes, depth, tt_name, tt_entries, worker_id, max_nodes,
+            time_limit, stop_event, results, quiescence=True):
+    tt = SharedTranspositionTable(tt_entries, name=tt_name)
+    try:
+        searcher = Searcher(tt, max_nodes=max_nodes, time_limit=time_limit,
+                            stop_event=stop_event, quiescence=quiescence)
+        searcher.root_shift = worker_id
+        state = GameState.from_bytes(state_bytes)
+        result = searcher.search(state, depth + worker_id % 2)
+        move = None if result.move is None else move_code(*result.move)
+        results.put((worker_id, move, result.score, result.depth, result.nodes))
+    finally:
+        tt.close()
+
+
+def merge_results(results):
+    # deepest completed search wins; among equal depths prefer the lowest
+    # worker id (worker 0 searched the nominal depth with normal ordering)
+    best = None
+    for worker_id, result in sorted(results, key=lambda item: item[0]):
+        if result.move is None:
+            continue
+        if best is None or result.depth > best.depth:
+            best = result
+    return best
+
+
+# Results of the helpers still able to send one; a helper that died
+# without posting (killed, crashed) is skipped instead of waited for
+def _helper_results(results, helpers, poll=RESULT_POLL):
+    pending = set(range(1, len(helpers) + 1))
+    while pending:
+        try:
+            item = results.get(timeout=poll)
+        except queue.Empty:
+            alive = {worker_id for worker_id in pending
+                     if helpers[worker_id - 1].exitcode is None}
+            if alive == pending:
+                continue
+            # a helper exited; give anything it posted a moment to arrive
+            pending = alive
+            try:
+                item = results.get(timeout=poll)
+            except queue.Empty:
+                continue
+        pending.discard(item[0])
+        yield item
+
+
+def parallel_search(state, depth, workers, tt=None, max_nodes=None,
+                    time_limit=None, mp_context=None, quiescence=True):
+    own_tt = tt is None
+    if own_tt:
+        tt = SharedTranspositionTable()
+    ctx = mp_context or multiprocessing.get_context()
+    stop_event = ctx.Event()
+    results = ctx.Queue()
+    state_bytes = state.to_bytes()
+
+    helpers = []
+    try:
+        for worker_id in range(1, workers):
+            proc = ctx.Process(
+                target=_helper,
+                args=(state_bytes, depth, tt.name, tt.num_entries, worker_id,
+                      max_nodes, time_limit, stop_event, results, quiescence),
+                daemon=True
+            )
+            proc.start()
+            helpers.append(proc)
+
+        main = Searcher(tt, max_nodes=max_nodes, time_limit=time_limit,
+                        quiescence=quiescence)
+        collected = [(0, main.search(state, depth))]
+        stop_event.set()
+
+        nodes = collected[0][1].nodes
+        for worker_id, move, score, done_depth, worker_nodes in _helper_results(results, helpers):
+            nodes += worker_nodes
+            move = None if move is None else move_from_code(move)
+            collected.append((worker_id, SearchResult(move, score, done_depth, worker_nodes)))
+        for proc in helpers:
+            proc.join()
+    finally:
+        stop_event.set()
+        for proc in helpers:
+            if proc.is_alive():
+                proc.terminate()
+        if own_tt:
+            tt.close()
+
+    best = merge_results(collected) or collected[0][1]
+    return SearchResult(best.move, best.score, best.depth, nodes)
@@ -0,0 +1,98 @@
+import random
+
+from jungle_game.model.encoding import EMPTY, piece_code
+from jungle_game.model.rules import STANDARD, RIVER, RAT_RANK, JUMPS_RIVER
+
+# Fast random playouts for MCTS rollouts and data generation.
+#
+# Works on a flat list of 63 piece codes (see model/encoding.py) with the
+# precomputed tables of a Ruleset (model/rules.py): no Position or Piece
+# objects, no history and no undo bookkeeping. Rules match
+# Board.is_legal_move.
+
+
+def flat_board(state):
+    return [piece_code(p) for row in state.board.pieces for p in row]
+
+
+# Returns (moves, captures) as lists of (from_sq, to_sq)
+def generate_moves(board, player, rules=STANDARD):
+    moves = []
+    captures = []
+    tiles = rules.flat_tiles
+    neighbours = rules.neighbours
+    capture = rules.capture
+    attacker_water = rules.attacker_water_bit
+    defender_terrain = rules.defender_bits[-player]
+    own_den = rules.own_den[player]
+    enemy_offset = 8 if player == 1 else 0
+    own_offset = 8 - enemy_offset
+    lo, hi = (1, 8) if player == 1 else (9, 16)
+    for sq, code in enumerate(board):
+        if not lo <= code <= hi:
+            continue
+        rank = code - own_offset
+        targets = neighbours[sq]
+        if JUMPS_RIVER[rank]:
+            targets = targets + tuple(
+                land for land, over in rules.jumps[sq]
+                if not any(board[s] for s in over)   # only rats can be in the river
+            )
+        for to in targets:
+            tile = tiles[to]
+            if tile == own_den:
+                continue
+            if tile == RIVER and rank != RAT_RANK:
+                continue
+            target = board[to]
+            if target == EMPTY:
+                moves.append((sq, to))
+                continue
+            if lo <= target <= hi:
+                continue
+            # capture matrix lookup, see rules.capture_index
+            if capture[(rank * 9 + target - enemy_offset) * 8
+                       + attacker_water[sq] + defender_terrain[to]]:
+                moves.append((sq, to))
+                captures.append((sq, to))
+    return moves, captures
+
+
+def _has_pieces(board, player):
+    if player == 1:
+        return any(0 < code <= 8 for code in board)
+    return any(code > 8 for code in board)
+
+
+# Plays uniformly random legal moves (or, with capture_bias > 0, a capture
+# with that probability whenever one exists) until someone wins or max_plies
+# is reached. A side with no legal move loses. board is modified in place.
+# Returns (winner or None, plies played).
+def random_playout(board, player=1, rng=None, max_plies=400, capture_bias=0.0,
+                   rules=STANDARD):
+    rng = rng or random.Random()
+    choice = rng.choice
+    goal = rules.goal
+    for ply in range(max_plies):
+        moves, captures = generate_moves(board, player, rules)
+        if not moves:
+            return -player, ply
+        if captures and capture_bias and rng.random() < capture_bias:
+            from_sq, to_sq = choice(captures)
+        else:
+            from_sq, to_sq = choice(moves)
+        captured = board[to_sq]
+        board[to_sq] = board[from_sq]
+        board[from_sq] = EMPTY
+        if to_sq == goal[player]:
+            return player, ply + 1
+        if captured and not _has_pieces(board, -player):
+            return player, ply + 1
+        player = -player
+    return None, max_plies
+
+
+def playout_from_state(state, seed=None, max_plies=400, capture_bias=0.0):
+    rng = random.Random(seed)
+    return random_playout(flat_board(state), state.current_player, rng,
+                          max_plies, capture_bias, state.board.ruleset)
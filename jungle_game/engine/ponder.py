@@ -0,0 +1,81 @@
+import threading
+
+from jungle_game.model.game_state import GameState
+from jungle_game.model.encoding import move_from_code
+from jungle_game.model import movegen
+from jungle_game.engine.search import Searcher
+from jungle_game.engine.transposition import position_key, NO_MOVE
+
+# Pondering: thinking on the opponent's time.
+#
+# Once the engine has moved, a background thread plays the reply it expects
+# (the hash move of the position, which the engine's own search just stored)
+# and searches the resulting position with the engine's transposition table.
+# If the opponent then plays that reply, Engine.search takes over the running
+# search instead of starting a new one; otherwise the ponder search is
+# stopped and the real search starts with a table warmed by it.
+#
+# The thread works on its own copy of the game, so the caller may keep
+# using (and changing) its GameState while it runs.
+
+
+# The reply the engine expects in this position: the hash move if it is
+# legal, otherwise the first move of the staged generator (captures first)
+def predict_reply(state, tt):
+    entry = tt.probe(position_key(state))
+    if entry is not None and entry[3] != NO_MOVE:
+        fr, to = move_from_code(entry[3])
+        piece = state.board.get_piece(fr)
+        if piece is not None and state.board.is_legal_move(piece, to, state.current_player):
+            return fr, to
+    return next(movegen.iter_moves(state), None)
+
+
+class Ponderer:
+    def __init__(self, engine, state, depth):
+        self.engine = engine
+        self.depth = depth
+        self.result = None
+        self.stop_event = threading.Event()
+        position = GameState.from_bytes(state.to_bytes())
+        self.move = predict_reply(position, engine.tt)
+        self.key = None
+        self._thread = None
+        if self.move is None or not position.make_move(*self.move) or position.game_over:
+            return
+        self.key = position_key(position)
+        # the same node budget as a normal move; the time limit only starts
+        # counting once the predicted move is played (see finish)
+        self.searcher = Searcher(engine.tt, max_nodes=engine.max_nodes,
+                                 stop_event=self.stop_event,
+                                 quiescence=engine.quiescence)
+        self._thread = threading.Thread(target=self._run, args=(position,),
+                                        name="ponder", daemon=True)
+        self._thread.start()
+
+    def _run(self, position):
+        self.result = self.searcher.search(position, self.depth)
+
+    @property
+    def active(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    # Result for the position actually reached, or None if the opponent
+    # played something else (the ponder search is stopped either way)
+    def finish(self, state, depth):
+        if self._thread is None:
+            return None
+        if depth != self.depth or position_key(state) != self.key:
+            self.stop()
+            return None
+        # ponder hit: let the search run on within the normal time limit
+        self._thread.join(self.engine.time_limit)
+        self.stop()
+        if self.result is None or self.result.move is None:
+            return None
+        return self.result
+
+    def stop(self):
+        self.stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
@@ -0,0 +1,284 @@
+import time
+
+from jungle_game.model.game_state import GameState
+from jungle_game.model.encoding import move_code, move_from_code
+from jungle_game.model.position import Position
+from jungle_game.model.rules import TRAP_P1, TRAP_P2
+from jungle_game.model import movegen
+from jungle_game.engine.evaluation import evaluate, WIN_SCORE, PIECE_VALUES
+from jungle_game.engine.transposition import (
+    TranspositionTable, position_key, EXACT, LOWER, UPPER, NO_MOVE
+)
+
+INFINITY = WIN_SCORE + 1
+# how often (in nodes) the stop flag and time limit are checked
+CHECK_EVERY = 512
+
+# Quiescence search past the horizon (see Searcher._quiesce)
+QS_MAX_PLY = 8          # plies of captures below a leaf
+QS_THREAT_PLY = 2       # trap entries and den threats only this close to it
+QS_MAX_NODES = 2000     # quiescence nodes per leaf
+DELTA_MARGIN = 200      # positional slack allowed on top of a capture
+
+
+class SearchAborted(Exception):
+    pass
+
+
+class SearchResult:
+    def __init__(self, move, score, depth, nodes):
+        self.move = move      # (from_pos, to_pos) or None
+        self.score = score    # from the side to move's point of view
+        self.depth = depth    # last fully completed depth
+        self.nodes = nodes
+
+    def __repr__(self):
+        move = None
+        if self.move is not None:
+            fr, to = self.move
+            move = (fr.row, fr.col, to.row, to.col)
+        return f"SearchResult(move={move}, score={self.score}, depth={self.depth}, nodes={self.nodes})"
+
+
+# Iterative deepening negamax with alpha-beta and a transposition table.
+#
+# The searcher works on its own copy of the state, so make/undo inside the
+# tree never touches the caller's undo counters or history.
+#
+# Leaves are resolved by a quiescence search: Jungle has long capture chains
+# (trapped pieces, rats taking elephants, lions jumping the river), so the
+# static evaluation is only trusted once no capture is pending. Quiescence
+# nodes count towards max_nodes but are never stored in the table.
+class Searcher:
+    def __init__(self, tt=None, max_nodes=None, time_limit=None, stop_event=None,
+                 quiescence=True, qs_max_ply=QS_MAX_PLY, qs_max_nodes=QS_MAX_NODES):
+        self.tt = tt if tt is not None else TranspositionTable()
+        self.max_nodes = max_nodes
+        self.time_limit = time_limit
+        self.stop_event = stop_event
+        self.quiescence = quiescence
+        self.qs_max_ply = qs_max_ply
+        self.qs_max_nodes = qs_max_nodes
+        self.nodes = 0
+        self.qs_nodes = 0
+        self._qs_budget = 0
+        self._deadline = None
+        # rotates root move order; helper processes use different values
+        self.root_shift = 0
+
+    def search(self, state, depth, start_depth=1):
+        root = GameState.from_bytes(state.to_bytes())
+        self.nodes = 0
+        self.qs_nodes = 0
+        self._deadline = None
+        if self.time_limit is not None:
+            self._deadline = time.perf_counter() + self.time_limit
+
+        result = SearchResult(None, evaluate(root), 0, 0)
+        if root.game_over:
+            return result
+
+        for current in range(start_depth, depth + 1):
+            try:
+                score, move = self._search_root(root, current)
+            except SearchAborted:
+                break
+            result = SearchResult(move, score, current, self.nodes)
+            if move is None or abs(score) >= WIN_SCORE - current:
+                break
+        result.nodes = self.nodes
+        return result
+
+    def _check_limits(self):
+        if self.max_nodes is not None and self.nodes >= self.max_nodes:
+            raise SearchAborted()
+        if self.stop_event is not None and self.stop_event.is_set():
+            raise SearchAborted()
+        if self._deadline is not None and time.perf_counter() >= self._deadline:
+            raise SearchAborted()
+
+    def _ordered_moves(self, state, tt_move):
+        if tt_move is not None and tt_move != NO_MOVE:
+            fr, to = move_from_code(tt_move)
+            piece = state.board.get_piece(fr)
+            if piece is not None and state.board.is_legal_move(piece, to, state.current_player):
+                yield fr, to
+            for fr2, to2 in movegen.iter_moves(state):
+                if move_code(fr2, to2) != tt_move:
+                    yield fr2, to2
+        else:
+            yield from movegen.iter_moves(state)
+
+    def _search_root(self, state, depth):
+        key = position_key(state)
+        entry = self.tt.probe(key)
+        moves = list(self._ordered_moves(state, entry[3] if entry else None))
+        if not moves:
+            return -WIN_SCORE, None
+        if self.root_shift and len(moves) > 1:
+            # keep the hash move first, vary the rest
+            shift = 1 + self.root_shift % (len(moves) - 1)
+            moves = moves[:1] + moves[shift:] + moves[1:shift]
+
+        alpha, beta = -INFINITY, INFINITY
+        best_move = moves[0]
+        for fr, to in moves:
+            score = self._child_score(state, fr, to, depth, alpha, beta, 0)
+            if score > alpha:
+                alpha = score
+                best_move = (fr, to)
+        self.tt.store(key, depth, alpha, EXACT, move_code(*best_move))
+        return alpha, best_move
+
+    def _child_score(self, state, fr, to, depth, alpha, beta, ply):
+        if not state.make_move(fr, to):
+            # rejected (e.g. a stale hash move): nothing to search or undo
+            return -INFINITY
+        try:
+            if state.game_over:
+                # the move just played won the game
+                return WIN_SCORE - (ply + 1)
+            return -self._negamax(state, depth - 1, -beta, -alpha, ply + 1)
+        finally:
+            state.undo_last_move()
+
+    def _negamax(self, state, depth, alpha, beta, ply):
+        self.nodes += 1
+        if self.nodes % CHECK_EVERY == 0:
+            self._check_limits()
+
+        if depth <= 0:
+            return self.leaf_score(state, alpha, beta, ply)
+
+        key = position_key(state)
+        entry = self.tt.probe(key)
+        tt_move = None
+        if entry is not None:
+            e_depth, e_score, e_flag, tt_move = entry
+            if e_depth >= depth:
+                if e_flag == EXACT:
+                    return e_score
+                if e_flag == LOWER and e_score >= beta:
+                    return e_score
+                if e_flag == UPPER and e_score <= alpha:
+                    return e_score
+
+        original_alpha = alpha
+        best_score = -INFINITY
+        best_move = NO_MOVE
+        for fr, to in self._ordered_moves(state, tt_move):
+            score = self._child_score(state, fr, to, depth, alpha, beta, ply)
+            if score > best_score:
+                best_score = score
+                best_move = move_code(fr, to)
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        if best_score == -INFINITY:
+            # no legal moves: the side to move loses
+            return -(WIN_SCORE - ply)
+
+        if best_score <= original_alpha:
+            flag = UPPER
+        elif best_score >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.tt.store(key, depth, best_score, flag, best_move)
+        return best_score
+
+    def leaf_score(self, state, alpha, beta, ply):
+        if not self.quiescence:
+            return evaluate(state)
+        self._qs_budget = self.qs_max_nodes
+        return self._quiesce(state, alpha, beta, ply, 0)
+
+    # Searches only captures and den entries (plus trap entries and den
+    # threats in the first QS_THREAT_PLY plies), standing pat on the static
+    # evaluation. A side whose den is about to be entered may not stand pat:
+    # only capturing the intruder or winning first saves it.
+    def _quiesce(self, state, alpha, beta, ply, qply):
+        self.nodes += 1
+        self.qs_nodes += 1
+        self._qs_budget -= 1
+        if self.nodes % CHECK_EVERY == 0:
+            self._check_limits()
+
+        if qply >= self.qs_max_ply or self._qs_budget <= 0:
+            return evaluate(state)
+        threatened = self._den_threatened(state)
+        if threatened:
+            # the intruder walks in next move unless we do something
+            best = stand_pat = -(WIN_SCORE - (ply + 1))
+        else:
+            best = stand_pat = evaluate(state)
+            if stand_pat >= beta:
+                return stand_pat
+        if stand_pat > alpha:
+            alpha = stand_pat
+
+        board = state.board
+        player = state.current_player
+        if threatened or qply >= QS_THREAT_PLY:
+            stages = (movegen.CAPTURES, movegen.DEN_ENTRIES)
+        else:
+            stages = (movegen.CAPTURES, movegen.DEN_ENTRIES, movegen.TRAP_MOVES)
+        for fr, to in movegen.iter_moves(state, stages):
+            victim = board.pieces[to.row][to.col]
+            if victim is not None:
+                # delta pruning; captures come biggest victim first, but the
+                # generator also holds the den entries, so skip, not break
+                if not threatened and \
+                        stand_pat + PIECE_VALUES[victim.animal_type.rank] + DELTA_MARGIN <= alpha:
+                    continue
+            elif not board.is_den_for_player(to, player) and \
+                    not self._is_threat_square(state, to):
+                continue
+            if self._qs_budget <= 0:
+                if best == stand_pat and threatened:
+                    # out of budget before every defence was tried: not a
+                    # proven loss, so fall back to the static evaluation
+                    return evaluate(state)
+                break
+            score = self._quiet_child_score(state, fr, to, alpha, beta, ply, qply)
+            if score > best:
+                best = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+        return best
+
+    def _quiet_child_score(self, state, fr, to, alpha, beta, ply, qply):
+        if not state.make_move(fr, to):
+            return -INFINITY
+        try:
+            if state.game_over:
+                return WIN_SCORE - (ply + 1)
+            return -self._quiesce(state, -beta, -alpha, ply + 1, qply + 1)
+        finally:
+            state.undo_last_move()
+
+    # Trap squares and the squares next to the opponent's den
+    @staticmethod
+    def _is_threat_square(state, to):
+        rules = state.board.ruleset
+        sq = to.row * 7 + to.col
+        return rules.flat_tiles[sq] in (TRAP_P1, TRAP_P2) or \
+            sq in rules.neighbours[rules.goal[state.current_player]]
+
+    # True if the opponent could enter the side to move's den next move
+    @staticmethod
+    def _den_threatened(state):
+        board = state.board
+        opponent = -state.current_player
+        den = board.ruleset.goal[opponent]
+        den_pos = Position(den // 7, den % 7)
+        for sq in board.ruleset.neighbours[den]:
+            piece = board.pieces[sq // 7][sq % 7]
+            if piece is not None and piece.player == opponent and \
+                    board.is_legal_move(piece, den_pos, opponent):
+                return True
+        return False
@@ -0,0 +1,117 @@
+import random
+import struct
+
+from jungle_game.model.encoding import NUM_SQUARES, piece_code
+
+# Zobrist hashing and transposition tables.
+#
+# Entries are (depth, score, flag, move code). The local table is a plain
+# dict; the shared table lives in a multiprocessing.shared_memory block so
+# several search processes can use it at once.
+
+EXACT = 0
+LOWER = 1   # score is a lower bound (fail high)
+UPPER = 2   # score is an upper bound (fail low)
+
+NO_MOVE = 0xFFFF
+
+_rng = random.Random(0x4A554E474C45)  # fixed seed: keys are stable across processes
+ZOBRIST = [[_rng.getrandbits(64) for _ in range(17)] for _ in range(NUM_SQUARES)]
+SIDE_TO_MOVE = _rng.getrandbits(64)
+
+
+def position_key(state):
+    key = 0
+    pieces = state.board.pieces
+    for row in range(9):
+        for col in range(7):
+            piece = pieces[row][col]
+            if piece is not None:
+                key ^= ZOBRIST[row * 7 + col][piece_code(piece)]
+    if state.current_player == -1:
+        key ^= SIDE_TO_MOVE
+    return key
+
+
+class TranspositionTable:
+    def __init__(self, max_entries=1 << 18):
+        self.max_entries = max_entries
+        self.entries = {}
+
+    def probe(self, key):
+        return self.entries.get(key)
+
+    def store(self, key, depth, score, flag, move):
+        existing = self.entries.get(key)
+        if existing is not None and existing[0] > depth:
+            return
+        if existing is None and len(self.entries) >= self.max_entries:
+            # crude but cheap: start over when full
+            self.entries.clear()
+        self.entries[key] = (depth, score, flag, move)
+
+    def clear(self):
+        self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
+
+# Each slot is two 64-bit words: (key ^ data, data). A reader only accepts a
+# slot whose words still xor back to its key, so a write torn by another
+# process is seen as a miss instead of a wrong entry (no locks needed).
+_SLOT = struct.Struct("<QQ")
+_DATA = struct.Struct("<ihBB")
+
+
+def _pack_data(depth, score, flag, move):
+    raw = _DATA.pack(score, move if move != NO_MOVE else -1, depth, flag)
+    return int.from_bytes(raw, "little")
+
+
+def _unpack_data(data):
+    score, move, depth, flag = _DATA.unpack(data.to_bytes(8, "little"))
+    return depth, score, flag, (NO_MOVE if move < 0 else move)
+
+
+class SharedTranspositionTable:
+    def __init__(self, num_entries=1 << 16, name=None):
+        # multiprocessing is slow to import; single-process engines never need it
+        from multiprocessing import shared_memory
+        self.num_entries = num_entries
+        size = num_entries * _SLOT.size
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+            self.shm.buf[:size] = bytes(size)
+            self.owner = True
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            self.owner = False
+        self.buf = self.shm.buf
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def probe(self, key):
+        stored_key, data = _SLOT.unpack_from(self.buf, (key % self.num_entries) * _SLOT.size)
+        if data == 0 or stored_key ^ data != key:
+            return None
+        return _unpack_data(data)
+
+    def store(self, key, depth, score, flag, move):
+        offset = (key % self.num_entries) * _SLOT.size
+        stored_key, data = _SLOT.unpack_from(self.buf, offset)
+        if data != 0 and stored_key ^ data == key and _unpack_data(data)[0] > depth:
+            return
+        data = _pack_data(depth, score, flag, move)
+        _SLOT.pack_into(self.buf, offset, key ^ data, data)
+
+    def clear(self):
+        self.buf[:] = bytes(len(self.buf))
+
+    def close(self):
+        self.buf = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
@@ -1,6 +1,3 @@
-from jungle_game.view.gui import JungleGameApp
-
-
 def main():
     print("====================================")
     print("   Welcome to the Jungle Game! 🐯")
@@ -12,6 +9,8 @@ def main():
 
         if answer in ("y", "yes"):
             print("Starting GUI... (close the window to exit the game)")
+            # imported here so tkinter is only loaded when a window is opened
+            from jungle_game.view.gui import JungleGameApp
             app = JungleGameApp()
             app.mainloop()
             print("Thanks for playing!")
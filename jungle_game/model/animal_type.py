@@ -1,20 +1,28 @@
 class AnimalType:
-    def __init__(self, name, rank):
+    def __init__(self, name, rank, swims=False, jumps_river=False):
         self.name = name
         self.rank = rank
+        self.swims = swims
+        self.jumps_river = jumps_river
+        # exceptions to the rank rule, filled in below
+        self.also_captures = ()     # may take these despite a lower rank
+        self.never_captures = ()    # may not take these despite a higher rank
 
     def can_enter_water(self):
-        return self.name == "Rat"
+        return self.swims
 
     def can_jump_river(self):
-        return self.name == "Lion" or self.name == "Tiger"
+        return self.jumps_river
 
 
 ELEPHANT = AnimalType("Elephant", 8)
-LION = AnimalType("Lion", 7)
-TIGER = AnimalType("Tiger", 6)
+LION = AnimalType("Lion", 7, jumps_river=True)
+TIGER = AnimalType("Tiger", 6, jumps_river=True)
 LEOPARD = AnimalType("Leopard", 5)
 WOLF = AnimalType("Wolf", 4)
 DOG = AnimalType("Dog", 3)
 CAT = AnimalType("Cat", 2)
-RAT = AnimalType("Rat", 1)
+RAT = AnimalType("Rat", 1, swims=True)
+
+RAT.also_captures = (ELEPHANT,)
+ELEPHANT.never_captures = (RAT,)
@@ -0,0 +1,181 @@
+from jungle_game.model.rules import JUMPS_RIVER
+from jungle_game.model.encoding import NUM_SQUARES, COLS, EMPTY, piece_code
+from jungle_game.model.events import MOVE_MADE, UNDO, STATE_LOADED
+
+# Attack maps: which pieces could move onto each square, per side.
+#
+# A piece attacks every square it could step or jump to if that square held
+# an enemy piece: adjacent squares (water only for rats, never its own den)
+# plus, for lions and tigers, river jumps not blocked by a rat. Whether an
+# attack actually captures depends on the defender and is decided by the
+# ruleset's can_capture() (rank, trap, rat/elephant and water rules). All
+# terrain comes from the board's Ruleset, so variant layouts work unchanged.
+#
+# After a move only a few pieces need recomputing: the moved piece, the
+# captured one and lions/tigers sharing a row or column with the from/to
+# squares (a rat entering or leaving the river may block or open a jump).
+# Steps ignore occupancy, so no other piece's squares change. The hanging
+# flag is refreshed for every square whose occupant or attackers changed,
+# so is_hanging() is a single lookup.
+
+ELEPHANT_RANK = 8
+RAT_RANK = 1
+
+
+def _rank(code):
+    return code if code <= 8 else code - 8
+
+
+def _player(code):
+    return 1 if code <= 8 else -1
+
+
+# Squares the piece with this code on sq attacks, given the board codes
+def attacked_squares(codes, sq, code, rules):
+    rank = _rank(code)
+    own_den = rules.own_den[_player(code)]
+    tiles = rules.flat_tiles
+    is_river = rules.is_river
+    squares = [
+        to for to in rules.neighbours[sq]
+        if tiles[to] != own_den and (rank == RAT_RANK or not is_river[to])
+    ]
+    if JUMPS_RIVER[rank]:
+        for land, over in rules.jumps[sq]:
+            # only rats can be in the river, so any piece there blocks
+            if not any(codes[s] for s in over):
+                squares.append(land)
+    return squares
+
+
+# Lion/tiger squares whose jumps can cross any of the given squares
+def _jump_lanes(squares, is_river):
+    lanes = set()
+    for sq in squares:
+        if not is_river[sq]:
+            continue
+        row, col = divmod(sq, COLS)
+        lanes.update(row * COLS + c for c in range(COLS))
+        lanes.update(r * COLS + col for r in range(9))
+    return lanes
+
+
+class AttackMap:
+    def __init__(self, board):
+        self.board = board
+        self.rules = board.ruleset
+        self.refresh()
+
+    @classmethod
+    def for_state(cls, state):
+        # follows the game through its events (make_move, undo, load)
+        attack_map = cls(state.board)
+        state.add_listener(attack_map.on_event)
+        return attack_map
+
+    def refresh(self, board=None):
+        if board is not None:
+            self.board = board
+            self.rules = board.ruleset
+        self.codes = [piece_code(p) for row in self.board.pieces for p in row]
+        self.attackers = [set() for _ in range(NUM_SQUARES)]
+        self.targets = [() for _ in range(NUM_SQUARES)]
+        self.hanging = bytearray(NUM_SQUARES)
+        for sq, code in enumerate(self.codes):
+            if code != EMPTY:
+                self._add(sq)
+        for sq in range(NUM_SQUARES):
+            self._update_hanging(sq)
+
+    def _add(self, sq):
+        targets = attacked_squares(self.codes, sq, self.codes[sq], self.rules)
+        self.targets[sq] = targets
+        for to in targets:
+            self.attackers[to].add(sq)
+        return targets
+
+    def _remove(self, sq):
+        targets = self.targets[sq]
+        for to in targets:
+            self.attackers[to].discard(sq)
+        self.targets[sq] = ()
+        return targets
+
+    def _update_hanging(self, sq):
+        self.hanging[sq] = self._capturable(sq)
+
+    def _capturable(self, sq):
+        code = self.codes[sq]
+        if code == EMPTY:
+            return False
+        player = _player(code)
+        rank = _rank(code)
+        can_capture = self.rules.can_capture
+        for attacker_sq in self.attackers[sq]:
+            attacker = self.codes[attacker_sq]
+            if _player(attacker) != player and \
+                    can_capture(_rank(attacker), rank, player, attacker_sq, sq):
+                return True
+        return False
+
+    # Applies a move to the map: the piece on from_sq goes to to_sq and
+    # left_behind (a piece code, for undo) is put on from_sq
+    def move(self, from_sq, to_sq, left_behind=EMPTY):
+        codes = self.codes
+        dirty = {from_sq, to_sq}
+        for sq in (from_sq, to_sq):
+            if codes[sq] != EMPTY:
+                dirty.update(self._remove(sq))
+        codes[to_sq] = codes[from_sq]
+        codes[from_sq] = left_behind
+
+        # jumps across the changed squares may have opened or closed
+        jumpers = [
+            sq for sq in _jump_lanes((from_sq, to_sq), self.rules.is_river)
+            if codes[sq] != EMPTY and JUMPS_RIVER[_rank(codes[sq])]
+            and sq not in (from_sq, to_sq)
+        ]
+        for sq in jumpers:
+            dirty.update(self._remove(sq))
+
+        for sq in jumpers + [from_sq, to_sq]:
+            if codes[sq] != EMPTY:
+                dirty.update(self._add(sq))
+        for sq in dirty:
+            self._update_hanging(sq)
+
+    def on_event(self, event):
+        if event.kind == MOVE_MADE:
+            self.move(*event.squares)
+        elif event.kind == UNDO:
+            from_sq, to_sq = event.squares
+            self.move(to_sq, from_sq, event.captured)
+        elif event.kind == STATE_LOADED:
+            self.refresh()
+
+    # -------- queries --------
+
+    def is_hanging(self, square):
+        return bool(self.hanging[square])
+
+    def attackers_of(self, square, player):
+        return [sq for sq in self.attackers[square] if _player(self.codes[sq]) == player]
+
+    # (rank, square) of the highest-ranked piece of player attacking the
+    # square, or None. Rank alone does not decide captures (see can_capture).
+    def strongest_attacker(self, square, player):
+        best = None
+        for sq in self.attackers_of(square, player):
+            rank = _rank(self.codes[sq])
+            if best is None or rank > best[0]:
+                best = (rank, sq)
+        return best
+
+    def is_attacked(self, square, player):
+        return any(_player(self.codes[sq]) == player for sq in self.attackers[square])
+
+    def hanging_pieces(self, player):
+        return [
+            sq for sq in range(NUM_SQUARES)
+            if self.hanging[sq] and _player(self.codes[sq]) == player
+        ]
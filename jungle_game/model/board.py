@@ -1,29 +1,15 @@
 from jungle_game.model.position import Position
 from jungle_game.model.piece import Piece
-from jungle_game.model.animal_type import (
-    ELEPHANT, LION, TIGER, LEOPARD, WOLF, DOG, CAT, RAT
+from jungle_game.model.rules import (
+    STANDARD, LAND, RIVER, TRAP_P1, TRAP_P2, DEN_P1, DEN_P2  # noqa: F401
 )
-LAND = 0
-RIVER = 1
-TRAP_P1 = 2
-TRAP_P2 = 3
-DEN_P1 = 4
-DEN_P2 = 5
 
 
 class Board:
-    def __init__(self):
-        self.tiles = [
-            [LAND, LAND, TRAP_P2, DEN_P2, TRAP_P2, LAND, LAND],
-            [LAND, LAND, LAND, TRAP_P2, LAND, LAND, LAND],
-            [LAND, LAND, LAND, LAND, LAND, LAND, LAND],
-            [LAND, RIVER, RIVER, LAND, RIVER, RIVER, LAND],
-            [LAND, RIVER, RIVER, LAND, RIVER, RIVER, LAND],
-            [LAND, RIVER, RIVER, LAND, RIVER, RIVER, LAND],
-            [LAND, LAND, LAND, LAND, LAND, LAND, LAND],
-            [LAND, LAND, LAND, TRAP_P1, LAND, LAND, LAND],
-            [LAND, LAND, TRAP_P1, DEN_P1, TRAP_P1, LAND, LAND]
-        ]
+    def __init__(self, ruleset=None):
+        # layout, setup and house rules (see rules.py)
+        self.ruleset = ruleset or STANDARD
+        self.tiles = self.ruleset.new_tiles()
         self.pieces = [
             [None for _ in range(7)]
             for _ in range(9)
@@ -31,29 +17,9 @@ class Board:
         self.setup_initial_positions()
 
     def setup_initial_positions(self):
-        # ---- Player 2 (TOP of your board) ----
-        self.pieces[0][0] = Piece(LION, -1, Position(0, 0))
-        self.pieces[0][6] = Piece(TIGER, -1, Position(0, 6))
-
-        self.pieces[1][1] = Piece(DOG, -1, Position(1, 1))
-        self.pieces[1][5] = Piece(CAT, -1, Position(1, 5))
-
-        self.pieces[2][0] = Piece(RAT, -1, Position(2, 0))
-        self.pieces[2][2] = Piece(LEOPARD, -1, Position(2, 2))
-        self.pieces[2][4] = Piece(WOLF, -1, Position(2, 4))
-        self.pieces[2][6] = Piece(ELEPHANT, -1, Position(2, 6))
-
-        # ---- Player 1 (BOTTOM of your board) ----
-        self.pieces[8][0] = Piece(TIGER, 1, Position(8, 0))
-        self.pieces[8][6] = Piece(LION, 1, Position(8, 6))
-
-        self.pieces[7][1] = Piece(CAT, 1, Position(7, 1))
-        self.pieces[7][5] = Piece(DOG, 1, Position(7, 5))
-
-        self.pieces[6][0] = Piece(ELEPHANT, 1, Position(6, 0))
-        self.pieces[6][2] = Piece(WOLF, 1, Position(6, 2))
-        self.pieces[6][4] = Piece(LEOPARD, 1, Position(6, 4))
-        self.pieces[6][6] = Piece(RAT, 1, Position(6, 6))
+        # Player 2 at the top, player 1 at the bottom for the standard setup
+        for animal_type, player, row, col in self.ruleset.setup:
+            self.pieces[row][col] = Piece(animal_type, player, Position(row, col))
 
     def get_piece(self, position):
         return self.pieces[position.row][position.col]
@@ -68,10 +34,7 @@ class Board:
         return self.tiles[position.row][position.col] == RIVER
 
     def is_trap_for_player(self, position, player):
-        if player == 1:
-            return self.tiles[position.row][position.col] == TRAP_P2
-        else:
-            return self.tiles[position.row][position.col] == TRAP_P1
+        return self.ruleset.trapped[player][position.row * 7 + position.col]
 
     def is_den_for_player(self, position, player):
         if player == 1:
@@ -153,7 +116,7 @@ class Board:
                     return False
                 mid_piece = self.get_piece(pos)
                 # jump blocked if any rat (friend or enemy) is in the river
-                if mid_piece is not None and mid_piece.animal_type.name == "Rat":
+                if mid_piece is not None and mid_piece.animal_type.swims:
                     return False
                 r += step_r
                 c += step_c
@@ -175,37 +138,16 @@ class Board:
         if target_piece.player == piece.player:
             return False
 
-        attacker = piece
-        defender = target_piece
-        attacker_pos = start
-        defender_pos = target_pos
-
-        # 1. elephant can NEVER capture rat
-        if attacker.animal_type.name == "Elephant" and defender.animal_type.name == "Rat":
-            return False
-
-        # 2. rat capturing elephant (not from water)
-        if attacker.animal_type.name == "Rat" and defender.animal_type.name == "Elephant":
-            if self.is_river(attacker_pos):
-                return False
-            return True
-
-        # 3. if defender is in attacker's trap, attacker can capture regardless of rank
-        if self.is_trap_for_player(defender_pos, defender.player):
-            return True
-
-        # rat vs rat water rule:
-        if attacker.animal_type.name == "Rat" and defender.animal_type.name == "Rat":
-            attacker_in_water = self.is_river(attacker_pos)
-            defender_in_water = self.is_river(defender_pos)
-            # cannot attack from water to land or land to water
-            if attacker_in_water != defender_in_water:
-                return False
-            # same environment (both land or both water) → allowed (same rank)
-            return True
-
-        # general rank rule (no traps): attacker rank must be >= defender rank
-        return attacker.animal_type.rank >= defender.animal_type.rank
+        # rank, trap, rat/elephant and water rules are all precomputed in
+        # the ruleset's capture matrix (see rules.py)
+        ruleset = self.ruleset
+        from_sq = start.row * 7 + start.col
+        to_sq = target_pos.row * 7 + target_pos.col
+        return ruleset.capture[
+            (piece.animal_type.rank * 9 + target_piece.animal_type.rank) * 8
+            + ruleset.attacker_water_bit[from_sq]
+            + ruleset.defender_bits[target_piece.player][to_sq]
+        ] != 0
 
     def can_jump_river(self, piece, from_pos, to_pos):
         # Only lion or tiger can jump
@@ -239,7 +181,7 @@ class Board:
                 return False
 
             mid_piece = self.get_piece(intermediate)
-            if mid_piece is not None and mid_piece.animal_type.name == "Rat":
+            if mid_piece is not None and mid_piece.animal_type.swims:
                 # Rats block jumps
                 return False
 
@@ -0,0 +1,67 @@
+from jungle_game.model.position import Position
+from jungle_game.model.piece import Piece
+from jungle_game.model.animal_type import (
+    ELEPHANT, LION, TIGER, LEOPARD, WOLF, DOG, CAT, RAT
+)
+
+# Compact integer encoding shared by serialisation, history and search.
+#
+# square: row * 7 + col  (0..62)
+# piece code: 0 = empty, rank (1..8) for player 1, rank + 8 (9..16) for player 2
+
+ROWS = 9
+COLS = 7
+NUM_SQUARES = ROWS * COLS
+EMPTY = 0
+
+ANIMALS_BY_RANK = {
+    animal.rank: animal
+    for animal in (ELEPHANT, LION, TIGER, LEOPARD, WOLF, DOG, CAT, RAT)
+}
+ANIMALS_BY_NAME = {animal.name: animal for animal in ANIMALS_BY_RANK.values()}
+
+
+# Shared read-only Position per square, for hot loops that would otherwise
+# allocate a new Position for every move
+POSITIONS = tuple(Position(sq // COLS, sq % COLS) for sq in range(NUM_SQUARES))
+
+
+def square_of(position):
+    return position.row * COLS + position.col
+
+
+def position_of(square):
+    return Position(square // COLS, square % COLS)
+
+
+def code_of(animal_type, player):
+    return animal_type.rank if player == 1 else animal_type.rank + 8
+
+
+def piece_code(piece):
+    if piece is None:
+        return EMPTY
+    return code_of(piece.animal_type, piece.player)
+
+
+def code_player(code):
+    return 1 if code <= 8 else -1
+
+
+def code_animal(code):
+    return ANIMALS_BY_RANK[code if code <= 8 else code - 8]
+
+
+def piece_from_code(code, square):
+    if code == EMPTY:
+        return None
+    return Piece(code_animal(code), code_player(code), position_of(square))
+
+
+def move_code(from_pos, to_pos):
+    return square_of(from_pos) * NUM_SQUARES + square_of(to_pos)
+
+
+def move_from_code(code):
+    from_sq, to_sq = divmod(code, NUM_SQUARES)
+    return position_of(from_sq), position_of(to_sq)
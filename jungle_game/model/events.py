@@ -0,0 +1,15 @@
+from collections import namedtuple
+
+# Events a GameState sends to its listeners.
+#
+# squares are board squares (row * 7 + col) whose contents changed or that
+# the event is about; captured is the piece code of a captured piece (0 if
+# none). Listeners are plain callables taking one GameEvent.
+
+MOVE_MADE = "move_made"            # squares: (from, to)
+PIECE_CAPTURED = "piece_captured"  # squares: (to,)
+UNDO = "undo"                      # squares: (from, to) of the move taken back
+GAME_OVER = "game_over"            # squares: (final square,), player: winner
+STATE_LOADED = "state_loaded"      # squares: (), whole position replaced
+
+GameEvent = namedtuple("GameEvent", ["kind", "squares", "player", "captured"])
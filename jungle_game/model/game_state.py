@@ -1,15 +1,50 @@
 from .position import Position
+from .piece import Piece
 from .board import Board, DEN_P1, DEN_P2
+from .rules import get_ruleset, STANDARD, CUSTOM_ID, FINGERPRINT_SIZE
+from .encoding import (
+    NUM_SQUARES, EMPTY, ANIMALS_BY_NAME, square_of, position_of, piece_code, piece_from_code,
+    move_code
+)
+from .move_history import MoveHistory
+from .recorder import RECORD_HEADER, UNDO_MARKER
+from .events import (
+    GameEvent, MOVE_MADE, PIECE_CAPTURED, UNDO, GAME_OVER, STATE_LOADED
+)
 import json
+import os
+import struct
+
+# current_player, winner (0 = none), flags, undo used by P1 / P2,
+# number of pieces, number of recorded plies
+_HEADER = struct.Struct("<bbBHHBI")
+_FLAG_GAME_OVER = 1
+# the upper four bits of the flags byte hold the ruleset id; CUSTOM_ID
+# means the ruleset's fingerprint follows the header
+_RULESET_SHIFT = 4
 
 class GameState:
-    def __init__(self):
-        self.board = Board()
+    def __init__(self, ruleset=None):
+        self.board = Board(ruleset)
         self.current_player = 1   # 1 for Player 1, -1 for Player 2
-        self.move_history = []    # list of moves (from, to, captured piece, etc.)
+        self.move_history = MoveHistory()    # packed (from, to, captured piece, player) per ply
         self.undo_used = {1: 0, -1: 0}   # how many undos each player used
         self.game_over = False
         self.winner = None        # 1, -1, or None
+        # player -> (moves, move codes, copy of board.pieces) for the
+        # current position; see _cached_moves
+        self._legal_cache = {}
+        self.recorder = None      # optional RecordWriter streaming moves to disk
+        self._listeners = []      # callables receiving GameEvent
+
+    @property
+    def move_history(self):
+        return self._history
+
+    @move_history.setter
+    def move_history(self, moves):
+        # accepts a MoveHistory or any iterable of (from, to, captured, player)
+        self._history = moves if isinstance(moves, MoveHistory) else MoveHistory(moves)
 
     def make_move(self, from_pos, to_pos):
         if self.game_over:
@@ -19,38 +54,82 @@ class GameState:
             return False
         if piece.player != self.current_player:
             return False
-        if not self.board.is_legal_move(piece, to_pos, self.current_player):
+        cached = self._cached_moves(self.current_player)
+        if cached is not None:
+            # moves for this position were already generated: O(1) lookup
+            if not self.board.is_inside(to_pos):
+                return False
+            if move_code(from_pos, to_pos) not in cached[1]:
+                return False
+        elif not self.board.is_legal_move(piece, to_pos, self.current_player):
             return False
         captured_piece = self.board.get_piece(to_pos)
+        self._legal_cache.clear()
         self.board.move_piece(from_pos, to_pos)
         piece.position = to_pos
-        self.move_history.append((from_pos, to_pos, captured_piece, self.current_player))
+        from_sq = square_of(from_pos)
+        to_sq = square_of(to_pos)
+        self._history.push(from_sq, to_sq, captured_piece, self.current_player)
+        if self._listeners:
+            captured = piece_code(captured_piece)
+            self._emit(GameEvent(MOVE_MADE, (from_sq, to_sq), self.current_player, captured))
+            if captured_piece is not None:
+                self._emit(GameEvent(PIECE_CAPTURED, (to_sq,), self.current_player, captured))
         dest_tile = self.board.get_tile_type(to_pos)
         if self.current_player == 1 and dest_tile == DEN_P2:
-            self.game_over = True
-            self.winner = 1
+            self._end_game(1, to_sq)
             return True
         if self.current_player == -1 and dest_tile == DEN_P1:
-            self.game_over = True
-            self.winner = -1
+            self._end_game(-1, to_sq)
             return True
         opponent = -self.current_player
         opponent_has_piece = False
-        for row in range(9):
-            for col in range(7):
-                p = self.board.pieces[row][col]
+        for row in self.board.pieces:
+            for p in row:
                 if p is not None and p.player == opponent:
                     opponent_has_piece = True
                     break
             if opponent_has_piece:
                 break
         if not opponent_has_piece:
-            self.game_over = True
-            self.winner = self.current_player
+            self._end_game(self.current_player, to_sq)
             return True
         self.switch_player()
         return True
 
+    def _end_game(self, winner, square):
+        self.game_over = True
+        self.winner = winner
+        if self._listeners:
+            self._emit(GameEvent(GAME_OVER, (square,), winner, 0))
+
+    # -------- observers --------
+    def add_listener(self, listener):
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    # Detach every listener, e.g. around a batch of moves; hand the result
+    # back to restore_listeners() afterwards
+    def take_listeners(self):
+        listeners = self._listeners
+        self._listeners = []
+        return listeners
+
+    def restore_listeners(self, listeners):
+        self._listeners = listeners + self._listeners
+
+    def _emit(self, event):
+        for listener in list(self._listeners):
+            listener(event)
+
+    # Tell listeners the whole position was replaced (load, reset, ...)
+    def notify_state_loaded(self):
+        if self._listeners:
+            self._emit(GameEvent(STATE_LOADED, (), self.current_player, 0))
+
     def switch_player(self):
         self.current_player *= -1
 
@@ -64,11 +143,11 @@ class GameState:
         if self.game_over:
             return False
 
-        if not self.move_history:
+        if not self._history:
             return False
 
-            # Check who made the last move
-        _, _, _, last_move_player = self.move_history[-1]
+        # Check who made the last move
+        last_move_player = self._history.last_player()
 
         if last_move_player != player:
             return False
@@ -79,11 +158,13 @@ class GameState:
         return True
 
     def undo_last_move(self):
-        if not self.move_history:
+        if not self._history:
             return False  # nothing to undo
 
-            # Extract last recorded move
-        from_pos, to_pos, captured_piece, player = self.move_history.pop()
+        # Extract last recorded move
+        from_sq, to_sq, captured_piece, player = self._history.pop_raw()
+        from_pos = position_of(from_sq)
+        to_pos = position_of(to_sq)
 
         # We will undo the move made by 'player'
         moved_piece = self.board.get_piece(to_pos)
@@ -95,6 +176,7 @@ class GameState:
         self.board.pieces[to_pos.row][to_pos.col] = None
         self.board.pieces[from_pos.row][from_pos.col] = moved_piece
         moved_piece.position = from_pos
+        self._legal_cache.clear()
 
         if captured_piece is not None:
             self.board.pieces[to_pos.row][to_pos.col] = captured_piece
@@ -108,9 +190,60 @@ class GameState:
         self.game_over = False
         self.winner = None
 
+        if self._listeners:
+            self._emit(GameEvent(UNDO, (from_sq, to_sq), player, piece_code(captured_piece)))
+
         return True
 
+    # Stream every following move (and undo) to a RecordWriter; moves already
+    # played are written first so the file is a complete record (unless the
+    # writer resumes a record that already has them)
+    def attach_recorder(self, recorder):
+        if not recorder.resume:
+            recorder.write_history(self._history)
+        self.recorder = recorder
+        self.add_listener(recorder.on_event)
+
+    def detach_recorder(self):
+        recorder = self.recorder
+        if recorder is not None:
+            self.remove_listener(recorder.on_event)
+        self.recorder = None
+        return recorder
+
+    # Drops cached moves. Direct edits of board.pieces are noticed anyway
+    # (see _cached_moves); this is for other edits such as tile changes.
+    def invalidate_legal_moves(self):
+        self._legal_cache.clear()
+
+    # Cached moves of player, or None if board.pieces changed since they
+    # were generated. make_move and undo drop the cache themselves; the
+    # comparison (row by row, identity first, in C) catches direct edits.
+    def _cached_moves(self, player):
+        cached = self._legal_cache.get(player)
+        if cached is not None and cached[2] == self.board.pieces:
+            return cached
+        return None
+
+    def legal_move_codes(self, player):
+        cached = self._cached_moves(player)
+        if cached is None:
+            self.get_legal_moves(player)
+            cached = self._legal_cache[player]
+        return cached[1]
+
+    def is_legal(self, from_pos, to_pos):
+        if self.game_over:
+            return False
+        if not (self.board.is_inside(from_pos) and self.board.is_inside(to_pos)):
+            return False
+        return move_code(from_pos, to_pos) in self.legal_move_codes(self.current_player)
+
     def get_legal_moves(self, player):
+        cached = self._cached_moves(player)
+        if cached is not None:
+            return list(cached[0])
+
         moves = []
 
         # Directions for orthogonal movement
@@ -153,7 +286,12 @@ class GameState:
                         target_pos = Position(row2, col)
                         if self.board.is_legal_move(piece, target_pos, player):
                             moves.append((from_pos, target_pos))
-        return moves
+
+        self._legal_cache[player] = (
+            moves, {move_code(fr, to) for fr, to in moves},
+            [row[:] for row in self.board.pieces]
+        )
+        return list(moves)
     
     def get_current_player(self):
         return self.current_player
@@ -166,14 +304,14 @@ class GameState:
 
     #Save into .record format
     def save_record(self, filename):
+        lines = [RECORD_HEADER]
+        for fr, to, cap, pl in self._history.iter_raw():
+            captured = 0 if cap == EMPTY else 1
+            pl = 1 if pl == 1 else 2
+            lines.append(f"{fr // 7} {fr % 7} {to // 7} {to % 7} {captured} {pl}\n")
+        # one buffer, one write
         with open(filename, "w") as f:
-            f.write("row_from column_from row_to column_to Captured_piece Player_move\n")
-            for fr, to, cap, pl in self.move_history:
-                r1, c1 = fr.get_pos()
-                r2, c2 = to.get_pos()
-                captured = 0 if cap is None else 1
-                pl = 1 if pl == 1 else 2
-                f.write(f"{r1} {c1} {r2} {c2} {captured} {pl}\n")
+            f.write("".join(lines))
 
     def to_dict(self):
         pieces_data = []
@@ -191,7 +329,7 @@ class GameState:
                     })
             pieces_data.append(row_data)
 
-        return {
+        data = {
             "current_player": self.current_player,
             "undo_used": {
                 "1": self.undo_used[1],
@@ -199,6 +337,9 @@ class GameState:
             },
             "pieces": pieces_data
         }
+        if self.board.ruleset is not STANDARD:
+            data["ruleset"] = self.board.ruleset.name
+        return data
 
     # Load from .jungle format
     @classmethod
@@ -209,7 +350,8 @@ class GameState:
     
     @classmethod
     def from_dict(cls, data):
-        state = cls()  # create a fresh game
+        # create a fresh game under the saved rules
+        state = cls(get_ruleset(data.get("ruleset", "standard")))
 
         state.current_player = data["current_player"]
         state.undo_used = {
@@ -233,25 +375,7 @@ class GameState:
                 player = entry["player"]
 
                 # find correct AnimalType instance
-                from .animal_type import (
-                    ELEPHANT, LION, TIGER, LEOPARD,
-                    WOLF, DOG, CAT, RAT
-                )
-                type_map = {
-                    "Elephant": ELEPHANT,
-                    "Lion": LION,
-                    "Tiger": TIGER,
-                    "Leopard": LEOPARD,
-                    "Wolf": WOLF,
-                    "Dog": DOG,
-                    "Cat": CAT,
-                    "Rat": RAT
-                }
-
-                animal_type = type_map[piece_type]
-
-                from .position import Position
-                from .piece import Piece
+                animal_type = ANIMALS_BY_NAME[piece_type]
 
                 pos = Position(row, col)
                 piece_obj = Piece(animal_type, player, pos)
@@ -260,6 +384,81 @@ class GameState:
 
         return state
     
+    # Compact binary encoding: header, the ruleset fingerprint for custom
+    # rulesets, then (square, code) per piece, then (from, to, captured
+    # code, player) per recorded ply
+    def to_bytes(self):
+        cells = bytearray()
+        for row in range(9):
+            for col in range(7):
+                piece = self.board.pieces[row][col]
+                if piece is not None:
+                    cells.append(row * 7 + col)
+                    cells.append(piece_code(piece))
+
+        plies = self._history.to_bytes()
+        ruleset = self.board.ruleset
+
+        header = _HEADER.pack(
+            self.current_player,
+            self.winner or 0,
+            (_FLAG_GAME_OVER if self.game_over else 0)
+            | (ruleset.id << _RULESET_SHIFT),
+            self.undo_used[1],
+            self.undo_used[-1],
+            len(cells) // 2,
+            len(plies) // 4
+        )
+        if ruleset.id == CUSTOM_ID:
+            header += ruleset.fingerprint
+        return header + bytes(cells) + plies
+
+    @classmethod
+    def from_bytes(cls, data):
+        (current_player, winner, flags, undo_p1, undo_p2,
+         num_pieces, num_plies) = _HEADER.unpack_from(data, 0)
+
+        offset = _HEADER.size
+        ruleset_id = flags >> _RULESET_SHIFT
+        if ruleset_id == CUSTOM_ID:
+            fingerprint = bytes(data[offset:offset + FINGERPRINT_SIZE])
+            offset += FINGERPRINT_SIZE
+            if len(fingerprint) != FINGERPRINT_SIZE:
+                raise ValueError("corrupt position encoding")
+            # a ruleset this process never created: decoding it under any
+            # other rules would silently change the game
+            ruleset = get_ruleset(fingerprint)
+        else:
+            ruleset = get_ruleset(ruleset_id)
+        state = cls(ruleset)
+        state.current_player = current_player
+        state.winner = winner or None
+        state.game_over = bool(flags & _FLAG_GAME_OVER)
+        state.undo_used = {1: undo_p1, -1: undo_p2}
+
+        pieces = state.board.pieces
+        for row in range(9):
+            for col in range(7):
+                pieces[row][col] = None
+
+        for _ in range(num_pieces):
+            square = data[offset]
+            code = data[offset + 1]
+            if square >= NUM_SQUARES or code == EMPTY:
+                raise ValueError("corrupt position encoding")
+            pieces[square // 7][square % 7] = piece_from_code(code, square)
+            offset += 2
+
+        plies = data[offset:offset + num_plies * 4]
+        if len(plies) != num_plies * 4:
+            raise ValueError("corrupt position encoding")
+        state.move_history = MoveHistory.from_bytes(plies)
+
+        return state
+
+    def __reduce__(self):
+        return (self.__class__.from_bytes, (self.to_bytes(),))
+
     @classmethod
     def replay_history(cls, filename):  
         moves = []
@@ -269,14 +468,19 @@ class GameState:
                 if first:
                     first = False   # skip header row
                     continue
+                line = line.strip()
+                if not line:
+                    continue
+                if line == UNDO_MARKER:
+                    # written by a streaming recorder when a move was taken back
+                    if moves:
+                        moves.pop()
+                    continue
                 r1, c1, r2, c2, captured, pl = map(int, line.split())
                 moves.append((r1, c1, r2, c2))
         return moves
-        
-        
-        
-
-
-
 
 
+# opt-in hot path instrumentation, see instrumentation.py
+if os.environ.get("JUNGLE_INSTRUMENT", "") not in ("", "0"):
+    from . import instrumentation  # noqa: E402,F401
@@ -0,0 +1,147 @@
+import os
+import time
+from contextlib import contextmanager
+
+from jungle_game.model.board import Board
+from jungle_game.model.game_state import GameState
+
+# Opt-in timing of the model hot paths.
+#
+# Nothing is wrapped until enable() (or the instrumented() context manager)
+# runs, so the disabled case has no overhead at all. Setting the environment
+# variable JUNGLE_INSTRUMENT=1 enables it when the model is imported.
+
+ENV_VAR = "JUNGLE_INSTRUMENT"
+
+TARGETS = [
+    (Board, "is_legal_move"),
+    (GameState, "get_legal_moves"),
+    (GameState, "make_move"),
+    (GameState, "undo_last_move"),
+]
+
+
+class CallStats:
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.total_ns = 0
+        # bucket b counts calls that took [2**(b-1), 2**b) microseconds,
+        # bucket 0 is everything under one microsecond
+        self.histogram = {}
+
+    def record(self, elapsed_ns):
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        bucket = (elapsed_ns // 1000).bit_length()
+        self.histogram[bucket] = self.histogram.get(bucket, 0) + 1
+
+    def mean_ns(self):
+        if self.calls == 0:
+            return 0
+        return self.total_ns / self.calls
+
+    def to_dict(self):
+        return {
+            "calls": self.calls,
+            "total_ns": self.total_ns,
+            "mean_ns": self.mean_ns(),
+            "histogram": {bucket_label(b): n for b, n in sorted(self.histogram.items())}
+        }
+
+
+STATS = {}
+_originals = {}
+_enabled_depth = 0
+
+
+def bucket_label(bucket):
+    if bucket == 0:
+        return "<1us"
+    return f"{2 ** (bucket - 1)}-{2 ** bucket}us"
+
+
+def _wrap(func, stats):
+    clock = time.perf_counter_ns
+
+    def wrapper(*args, **kwargs):
+        start = clock()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stats.record(clock() - start)
+
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__wrapped__ = func
+    return wrapper
+
+
+def is_enabled():
+    return _enabled_depth > 0
+
+
+def enable():
+    global _enabled_depth
+    _enabled_depth += 1
+    if _enabled_depth > 1:
+        return
+    for cls, attr in TARGETS:
+        name = f"{cls.__name__}.{attr}"
+        stats = STATS.setdefault(name, CallStats(name))
+        original = cls.__dict__[attr]
+        _originals[(cls, attr)] = original
+        setattr(cls, attr, _wrap(original, stats))
+
+
+def disable():
+    global _enabled_depth
+    if _enabled_depth == 0:
+        return
+    _enabled_depth -= 1
+    if _enabled_depth > 0:
+        return
+    for (cls, attr), original in _originals.items():
+        setattr(cls, attr, original)
+    _originals.clear()
+
+
+def reset():
+    STATS.clear()
+
+
+@contextmanager
+def instrumented(fresh=True):
+    if fresh:
+        reset()
+    enable()
+    try:
+        yield STATS
+    finally:
+        disable()
+
+
+def snapshot():
+    return {name: stats.to_dict() for name, stats in STATS.items()}
+
+
+def report():
+    lines = [f"{'function':<28}{'calls':>10}{'total ms':>12}{'mean us':>10}"]
+    for name, stats in sorted(STATS.items()):
+        lines.append(
+            f"{name:<28}{stats.calls:>10}{stats.total_ns / 1e6:>12.2f}"
+            f"{stats.mean_ns() / 1e3:>10.2f}"
+        )
+    for name, stats in sorted(STATS.items()):
+        if not stats.histogram:
+            continue
+        lines.append("")
+        lines.append(f"{name} latency histogram")
+        for bucket, count in sorted(stats.histogram.items()):
+            lines.append(f"  {bucket_label(bucket):>14} {count:>10}")
+    return "\n".join(lines)
+
+
+if os.environ.get(ENV_VAR, "") not in ("", "0"):
+    enable()
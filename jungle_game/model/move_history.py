@@ -0,0 +1,127 @@
+import re
+from array import array
+
+from jungle_game.model.encoding import (
+    EMPTY, square_of, position_of, piece_code, piece_from_code
+)
+
+# a non-empty captured code (searched for in the code column of the plies)
+_CAPTURE = re.compile(rb"[^\x00]")
+
+
+# Move history packed into a byte array, four bytes per ply:
+#   from square, to square, captured piece code (0 = none), mover (1 or 2)
+#
+# Captured Piece objects are kept in a separate stack (one entry per
+# capturing ply, so at most a handful) so undo can put the very same object
+# back on the board.
+class MoveHistory:
+    def __init__(self, moves=()):
+        self.plies = array("B")
+        self.captured = []
+        for move in moves:
+            self.append(move)
+
+    # fast path used by GameState.make_move
+    def push(self, from_sq, to_sq, captured_piece, player):
+        self.plies.extend((from_sq, to_sq, piece_code(captured_piece), 1 if player == 1 else 2))
+        if captured_piece is not None:
+            self.captured.append(captured_piece)
+
+    def append(self, move):
+        from_pos, to_pos, captured_piece, player = move
+        self.push(square_of(from_pos), square_of(to_pos), captured_piece, player)
+
+    # Returns (from_sq, to_sq, captured piece or None, player)
+    def pop_raw(self):
+        if not self.plies:
+            raise IndexError("pop from empty move history")
+        plies = self.plies
+        from_sq, to_sq, code, player = plies[-4:]
+        del plies[-4:]
+        captured_piece = self.captured.pop() if code != EMPTY else None
+        return from_sq, to_sq, captured_piece, 1 if player == 1 else -1
+
+    def pop(self):
+        from_sq, to_sq, captured_piece, player = self.pop_raw()
+        return position_of(from_sq), position_of(to_sq), captured_piece, player
+
+    def last_player(self):
+        if not self.plies:
+            return None
+        return 1 if self.plies[-1] == 1 else -1
+
+    # Drops every ply after the first n
+    def truncate(self, n):
+        dropped = self.plies[n * 4 + 2::4]
+        captures = len(dropped) - dropped.count(EMPTY)
+        del self.plies[n * 4:]
+        if captures:
+            del self.captured[-captures:]
+
+    # Appends plies packed as by to_bytes(). Only the captures (a handful
+    # per game) are looked at one by one, so long stretches of plain
+    # moves cost a byte copy.
+    def extend_bytes(self, data):
+        data = bytes(data)
+        if len(data) % 4:
+            raise ValueError("move history length must be a multiple of 4")
+        self.plies.frombytes(data)
+        codes = data[2::4]
+        for match in _CAPTURE.finditer(codes):
+            ply = match.start()
+            piece = piece_from_code(codes[ply], data[ply * 4 + 1])
+            piece.alive = False
+            self.captured.append(piece)
+
+    def clear(self):
+        del self.plies[:]
+        self.captured.clear()
+
+    def __len__(self):
+        return len(self.plies) // 4
+
+    def __bool__(self):
+        return len(self.plies) > 0
+
+    def raw(self, index):
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("move history index out of range")
+        offset = index * 4
+        from_sq, to_sq, code, player = self.plies[offset:offset + 4]
+        return from_sq, to_sq, code, 1 if player == 1 else -1
+
+    def __getitem__(self, index):
+        from_sq, to_sq, code, player = self.raw(index)
+        if index < 0:
+            index += len(self)
+        captured_piece = None
+        if code != EMPTY:
+            # position of this capture in the captured stack
+            earlier = self.plies[2:index * 4:4]
+            captured_piece = self.captured[len(earlier) - earlier.count(EMPTY)]
+        return position_of(from_sq), position_of(to_sq), captured_piece, player
+
+    def __iter__(self):
+        captured = iter(self.captured)
+        it = iter(self.plies)
+        for from_sq, to_sq, code, player in zip(it, it, it, it):
+            captured_piece = next(captured) if code != EMPTY else None
+            yield position_of(from_sq), position_of(to_sq), captured_piece, 1 if player == 1 else -1
+
+    def iter_raw(self):
+        it = iter(self.plies)
+        for from_sq, to_sq, code, player in zip(it, it, it, it):
+            yield from_sq, to_sq, code, 1 if player == 1 else -1
+
+    def to_bytes(self):
+        return self.plies.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data):
+        history = cls()
+        history.extend_bytes(data)
+        return history
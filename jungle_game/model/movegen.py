@@ -0,0 +1,93 @@
+from jungle_game.model.position import Position
+from jungle_game.model.rules import RIVER
+
+# Staged, lazy move generation for search.
+#
+# Moves come out as (from_pos, to_pos) tuples like GameState.get_legal_moves,
+# grouped by stage so a search that cuts off early never pays for the rest:
+#   CAPTURES     most valuable victim first, then least valuable attacker
+#   DEN_ENTRIES  moves into the opponent's den (these win the game)
+#   TRAP_MOVES   moves onto or next to a trap
+#   QUIET        everything else
+# Candidates are found and sorted into stages in one pass over the board;
+# legality is decided by Board.is_legal_move only as each stage is reached.
+
+CAPTURES = 0
+DEN_ENTRIES = 1
+TRAP_MOVES = 2
+QUIET = 3
+ALL = (CAPTURES, DEN_ENTRIES, TRAP_MOVES, QUIET)
+
+DIRECTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+
+
+def candidate_targets(board, row, col, piece):
+    targets = []
+    jumper = piece.animal_type.can_jump_river()
+    for dr, dc in DIRECTIONS:
+        r, c = row + dr, col + dc
+        if not (0 <= r <= 8 and 0 <= c <= 6):
+            continue
+        targets.append((r, c))
+        if jumper and board.tiles[r][c] == RIVER:
+            # walk over the river to the landing square
+            while 0 <= r <= 8 and 0 <= c <= 6 and board.tiles[r][c] == RIVER:
+                r += dr
+                c += dc
+            if 0 <= r <= 8 and 0 <= c <= 6:
+                targets.append((r, c))
+    return targets
+
+
+def classify(board, piece, r, c):
+    target = board.pieces[r][c]
+    if target is not None and target.player != piece.player:
+        return CAPTURES
+    if board.is_den_for_player(Position(r, c), piece.player):
+        return DEN_ENTRIES
+    if (r, c) in board.ruleset.trap_zone:
+        return TRAP_MOVES
+    return QUIET
+
+
+def _own_pieces(board, player):
+    for row in range(9):
+        for col in range(7):
+            piece = board.pieces[row][col]
+            if piece is not None and piece.player == player:
+                yield row, col, piece
+
+
+# Candidate (piece, row, col) moves of the wanted stages, one list per stage
+def _bucket_candidates(board, player, stages):
+    buckets = {stage: [] for stage in stages}
+    for row, col, piece in _own_pieces(board, player):
+        for r, c in candidate_targets(board, row, col, piece):
+            bucket = buckets.get(classify(board, piece, r, c))
+            if bucket is not None:
+                bucket.append((piece, r, c))
+    return buckets
+
+
+def capture_order_key(attacker, victim):
+    # MVV/LVA: biggest victim first, cheapest attacker among equals
+    return (-victim.animal_type.rank, attacker.animal_type.rank)
+
+
+def iter_moves(state, stage=ALL, player=None):
+    board = state.board
+    if player is None:
+        player = state.current_player
+    stages = (stage,) if isinstance(stage, int) else stage
+    buckets = _bucket_candidates(board, player, stages)
+
+    for current in stages:
+        candidates = buckets[current]
+        if current == CAPTURES:
+            candidates.sort(
+                key=lambda item: capture_order_key(item[0], board.pieces[item[1]][item[2]])
+            )
+        for piece, r, c in candidates:
+            to_pos = Position(r, c)
+            if board.is_legal_move(piece, to_pos, player):
+                yield piece.position, to_pos
@@ -1,5 +1,17 @@
 from jungle_game.model.animal_type import RAT, CAT, DOG, WOLF, TIGER, LION, ELEPHANT, LEOPARD
 
+_NAMES = {
+    RAT: 'Rat',
+    CAT: 'Cat',
+    DOG: 'Dog',
+    WOLF: 'Wolf',
+    LEOPARD: 'Leopard',
+    TIGER: 'Tiger',
+    LION: 'Lion',
+    ELEPHANT: 'Elephant'
+}
+
+
 class Piece:
     def __init__(self, animal_type, player, position):
         self.animal_type = animal_type
@@ -8,15 +20,5 @@ class Piece:
         self.alive = True
 
     def get_name(self):
-        symbol_map = {
-            RAT: 'Rat',
-            CAT: 'Cat',
-            DOG: 'Dog',
-            WOLF: 'Wolf',
-            LEOPARD: 'Leopard',
-            TIGER: 'Tiger',
-            LION: 'Lion',
-            ELEPHANT: 'Elephant'
-        }
-        symbol = symbol_map.get(self.animal_type, '?')
+        symbol = _NAMES.get(self.animal_type, '?')
         return symbol.lower() if self.player == -1 else symbol.upper()
@@ -0,0 +1,165 @@
+import os
+import struct
+import time
+from contextlib import contextmanager
+
+from jungle_game.model.game_state import GameState
+
+# Pool of live games in one multiprocessing.shared_memory block.
+#
+# Every slot holds one game as GameState.to_bytes() (a few hundred bytes, see
+# game_state.py) behind a small header:
+#   version  seqlock counter, odd while a writer is updating the slot
+#   length   size of the encoded game, 0 for a free slot
+#
+# Any process that has the pool (pass it to the worker like any other
+# Process argument) can check a game out by index, play on the ordinary
+# GameState it gets back (a GameController works on top of it) and write it
+# back on release, instead of pickling whole object graphs between workers.
+# Writers serialise on a striped process lock; read() takes no lock and
+# retries while a writer is active.
+
+_SLOT_HEADER = struct.Struct("<II")
+
+
+class PoolFull(Exception):
+    pass
+
+
+class GamePool:
+    def __init__(self, num_slots=1024, slot_size=2048, lock_stripes=64, mp_context=None):
+        import multiprocessing
+        from multiprocessing import shared_memory
+        if slot_size <= _SLOT_HEADER.size:
+            raise ValueError("slot_size too small")
+        self.num_slots = num_slots
+        self.slot_size = slot_size
+        ctx = mp_context or multiprocessing.get_context()
+        self._locks = [ctx.Lock() for _ in range(min(lock_stripes, num_slots))]
+        self._alloc_lock = ctx.Lock()
+        self.shm = shared_memory.SharedMemory(create=True, size=num_slots * slot_size)
+        self.shm.buf[:] = bytes(num_slots * slot_size)
+        self.buf = self.shm.buf
+        # forked workers inherit this object as is, so ownership is by pid
+        self._owner_pid = os.getpid()
+
+    # Only the owner unlinks the block; worker copies just attach to it
+    def __getstate__(self):
+        return {
+            "name": self.shm.name,
+            "num_slots": self.num_slots,
+            "slot_size": self.slot_size,
+            "locks": self._locks,
+            "alloc_lock": self._alloc_lock,
+        }
+
+    def __setstate__(self, state):
+        from multiprocessing import shared_memory
+        self.num_slots = state["num_slots"]
+        self.slot_size = state["slot_size"]
+        self._locks = state["locks"]
+        self._alloc_lock = state["alloc_lock"]
+        self.shm = shared_memory.SharedMemory(name=state["name"])
+        self.buf = self.shm.buf
+        self._owner_pid = None
+
+    @property
+    def capacity(self):
+        # largest encoded game a slot can hold
+        return self.slot_size - _SLOT_HEADER.size
+
+    def _offset(self, index):
+        if not 0 <= index < self.num_slots:
+            raise IndexError(f"pool slot {index} out of range")
+        return index * self.slot_size
+
+    def _lock(self, index):
+        return self._locks[index % len(self._locks)]
+
+    # -------- raw slot access --------
+
+    def _write(self, index, data):
+        if len(data) > self.capacity:
+            raise ValueError(f"game needs {len(data)} bytes, slot holds {self.capacity}")
+        offset = self._offset(index)
+        version, _ = _SLOT_HEADER.unpack_from(self.buf, offset)
+        _SLOT_HEADER.pack_into(self.buf, offset, version + 1, 0)
+        start = offset + _SLOT_HEADER.size
+        self.buf[start:start + len(data)] = data
+        _SLOT_HEADER.pack_into(self.buf, offset, version + 2, len(data))
+
+    def _read(self, index):
+        offset = self._offset(index)
+        while True:
+            version, length = _SLOT_HEADER.unpack_from(self.buf, offset)
+            if version & 1:
+                time.sleep(0)
+                continue
+            start = offset + _SLOT_HEADER.size
+            data = bytes(self.buf[start:start + length])
+            if _SLOT_HEADER.unpack_from(self.buf, offset)[0] == version:
+                return data
+
+    def is_free(self, index):
+        return _SLOT_HEADER.unpack_from(self.buf, self._offset(index))[1] == 0
+
+    # -------- games --------
+
+    # Puts a game into the first free slot and returns its index
+    def add(self, state):
+        data = state.to_bytes()
+        with self._alloc_lock:
+            for index in range(self.num_slots):
+                if self.is_free(index):
+                    with self._lock(index):
+                        self._write(index, data)
+                    return index
+        raise PoolFull(f"all {self.num_slots} pool slots are in use")
+
+    def store(self, index, state):
+        with self._lock(index):
+            self._write(index, state.to_bytes())
+
+    # Consistent snapshot of a game without taking its lock
+    def read(self, index):
+        data = self._read(index)
+        if not data:
+            raise KeyError(f"pool slot {index} is free")
+        return GameState.from_bytes(data)
+
+    # with pool.checkout(i) as state: ... -- the slot stays locked until the
+    # block ends and the (possibly changed) game is written back then.
+    # Changes are discarded if the block raises.
+    @contextmanager
+    def checkout(self, index, timeout=None):
+        lock = self._lock(index)
+        if not lock.acquire(True, timeout):
+            raise TimeoutError(f"pool slot {index} is busy")
+        try:
+            data = self._read(index)
+            if not data:
+                raise KeyError(f"pool slot {index} is free")
+            state = GameState.from_bytes(data)
+            yield state
+            self._write(index, state.to_bytes())
+        finally:
+            lock.release()
+
+    def remove(self, index):
+        with self._alloc_lock, self._lock(index):
+            self._write(index, b"")
+
+    def __len__(self):
+        return sum(not self.is_free(index) for index in range(self.num_slots))
+
+    def close(self):
+        self.buf = None
+        self.shm.close()
+        if self._owner_pid == os.getpid():
+            self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -8,5 +8,16 @@ class Position:
         c = abs(self.col - other.col)
         return r + c == 1
     
+    def __eq__(self, other):
+        if not isinstance(other, Position):
+            return NotImplemented
+        return self.row == other.row and self.col == other.col
+
+    def __hash__(self):
+        return hash((self.row, self.col))
+
+    def __repr__(self):
+        return f"Position({self.row}, {self.col})"
+
     def get_pos(self):
         return self.row, self.col
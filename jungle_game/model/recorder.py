@@ -0,0 +1,105 @@
+import os
+import threading
+
+from jungle_game.model.events import MOVE_MADE, UNDO
+
+# Streaming .record writer.
+#
+# Attached to a GameState (as an event listener), it appends one line per move
+# as make_move succeeds and an undo marker line when undo_last_move runs,
+# instead of rewriting the whole file from move_history.
+#
+# By default every line is flushed as it is written, so a crash loses at
+# most the move being played. Long automated games can trade that for
+# speed: with flush_every=N lines are buffered and flushed every N writes,
+# and flush_interval=S also flushes S seconds after the oldest unflushed
+# line, from a timer, so buffered moves reach the file even if the game then
+# sits idle. close() always flushes; fsync=True also syncs to disk.
+#
+# A new writer starts the file over (GameState.attach_recorder then writes
+# the moves already played). With resume=True it appends to a record that
+# already holds the game so far, and the history is not written again.
+
+RECORD_HEADER = "row_from column_from row_to column_to Captured_piece Player_move\n"
+UNDO_MARKER = "undo"
+
+
+class RecordWriter:
+    def __init__(self, filename, flush_every=1, flush_interval=None, fsync=False,
+                 resume=False):
+        self.filename = filename
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.resume = resume
+        if resume:
+            new_file = not os.path.exists(filename) or os.path.getsize(filename) == 0
+            self.file = open(filename, "a")
+        else:
+            new_file = True
+            self.file = open(filename, "w")
+        if new_file:
+            self.file.write(RECORD_HEADER)
+        self._unflushed = 0
+        self._timer = None
+        # the flush timer runs on its own thread
+        self._lock = threading.Lock()
+
+    def write_move(self, from_sq, to_sq, captured, player):
+        captured = 0 if captured is None else 1
+        pl = 1 if player == 1 else 2
+        self._write(f"{from_sq // 7} {from_sq % 7} {to_sq // 7} {to_sq % 7} {captured} {pl}\n")
+
+    def on_event(self, event):
+        if event.kind == MOVE_MADE:
+            from_sq, to_sq = event.squares
+            self.write_move(from_sq, to_sq, event.captured or None, event.player)
+        elif event.kind == UNDO:
+            self.write_undo()
+
+    def write_undo(self):
+        self._write(UNDO_MARKER + "\n")
+
+    # Writes plies already played before the recorder was attached
+    def write_history(self, history):
+        for from_sq, to_sq, code, player in history.iter_raw():
+            self.write_move(from_sq, to_sq, code or None, player)
+
+    def _write(self, line):
+        with self._lock:
+            self.file.write(line)
+            self._unflushed += 1
+            if self.flush_every and self._unflushed >= self.flush_every:
+                self._flush()
+            elif self.flush_interval is not None and self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self.file is None or not self._unflushed:
+            return
+        self.file.flush()
+        if self.fsync:
+            os.fsync(self.file.fileno())
+        self._unflushed = 0
+
+    def close(self):
+        with self._lock:
+            if self.file is not None:
+                self._flush()
+                self.file.close()
+                self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
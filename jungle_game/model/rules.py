@@ -0,0 +1,284 @@
+import hashlib
+import weakref
+
+from jungle_game.model.animal_type import (
+    ELEPHANT, LION, TIGER, LEOPARD, WOLF, DOG, CAT, RAT
+)
+
+# Rule variants compiled into lookup tables.
+#
+# A Ruleset is described by a board layout (one string per row), a starting
+# setup and a few house-rule flags; on construction it precomputes what move
+# generation needs so variants cost no more than the standard game:
+#   tiles, flat_tiles, is_river   terrain per square
+#   neighbours, jumps             step targets and lion/tiger river jumps
+#   trapped[player][sq]           a defender of player is weakened there
+#   goal[player]                  den square player is trying to reach
+#   capture                       capture matrix, see capture_index()
+#
+# Squares are row * 7 + col as in encoding.py. A serialised GameState has
+# to say which rules it was played by, in a way every process agrees on:
+#   - the built-in rulesets have fixed small ids (BUILTIN_NAMES order)
+#   - any other Ruleset has id CUSTOM_ID and is identified by its
+#     fingerprint, a stable hash of its name, layout, setup and flags
+# Every Ruleset registers itself on construction. Names must be unique (a
+# second Ruleset with the same name must have the same definition); custom
+# rulesets stay registered while something still uses them. Decoding a
+# custom ruleset this process has not created raises ValueError.
+
+LAND = 0
+RIVER = 1
+TRAP_P1 = 2
+TRAP_P2 = 3
+DEN_P1 = 4
+DEN_P2 = 5
+
+ROWS = 9
+COLS = 7
+
+# layout characters; upper case belongs to player 1 (bottom), lower case to
+# player 2 (top)
+LAYOUT_CHARS = {
+    ".": LAND,
+    "~": RIVER,
+    "T": TRAP_P1,
+    "t": TRAP_P2,
+    "D": DEN_P1,
+    "d": DEN_P2,
+}
+
+STANDARD_LAYOUT = (
+    "..tdt..",
+    "...t...",
+    ".......",
+    ".~~.~~.",
+    ".~~.~~.",
+    ".~~.~~.",
+    ".......",
+    "...T...",
+    "..TDT..",
+)
+
+# (animal, player, row, col)
+STANDARD_SETUP = (
+    (LION, -1, 0, 0),
+    (TIGER, -1, 0, 6),
+    (DOG, -1, 1, 1),
+    (CAT, -1, 1, 5),
+    (RAT, -1, 2, 0),
+    (LEOPARD, -1, 2, 2),
+    (WOLF, -1, 2, 4),
+    (ELEPHANT, -1, 2, 6),
+    (TIGER, 1, 8, 0),
+    (LION, 1, 8, 6),
+    (CAT, 1, 7, 1),
+    (DOG, 1, 7, 5),
+    (ELEPHANT, 1, 6, 0),
+    (WOLF, 1, 6, 2),
+    (LEOPARD, 1, 6, 4),
+    (RAT, 1, 6, 6),
+)
+
+ANIMALS = (ELEPHANT, LION, TIGER, LEOPARD, WOLF, DOG, CAT, RAT)
+RAT_RANK = RAT.rank
+ELEPHANT_RANK = ELEPHANT.rank
+# JUMPS_RIVER[rank]: whether that animal may jump the river
+JUMPS_RIVER = [False] + [
+    animal.can_jump_river()
+    for animal in (RAT, CAT, DOG, WOLF, LEOPARD, TIGER, LION, ELEPHANT)
+]
+DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+# The capture matrix holds one byte per (attacker, defender, attacker in
+# water, defender in water, defender trapped); animals are identified by
+# rank, which is unique. Checking a capture is a single indexed lookup.
+def capture_index(attacker_rank, defender_rank, attacker_in_water,
+                  defender_in_water, defender_trapped):
+    return ((attacker_rank * 9 + defender_rank) * 8 + attacker_in_water * 4
+            + defender_in_water * 2 + defender_trapped)
+
+
+class Ruleset:
+    def __init__(self, name, layout=STANDARD_LAYOUT, setup=STANDARD_SETUP,
+                 water_captures=True, traps_weaken_owner=False):
+        self.name = name
+        self.layout = tuple(layout)
+        self.setup = tuple(setup)
+        # False: nothing may be captured by a piece standing in the river
+        self.water_captures = water_captures
+        # True: a trap weakens any piece on it, not only the opponent's
+        self.traps_weaken_owner = traps_weaken_owner
+        self.id = None
+        self._compile()
+        self.fingerprint = hashlib.blake2b(
+            repr(self._definition()).encode(), digest_size=FINGERPRINT_SIZE
+        ).digest()
+        register(self)
+
+    def _definition(self):
+        setup = tuple((animal.name, player, row, col) for animal, player, row, col in self.setup)
+        return (self.name, self.layout, setup, self.water_captures, self.traps_weaken_owner)
+
+    def _compile(self):
+        if len(self.layout) != ROWS or any(len(row) != COLS for row in self.layout):
+            raise ValueError(f"layout must be {ROWS} rows of {COLS} squares")
+        try:
+            self.tiles = [[LAYOUT_CHARS[ch] for ch in row] for row in self.layout]
+        except KeyError as exc:
+            raise ValueError(f"unknown layout character {exc.args[0]!r}") from None
+        flat = [tile for row in self.tiles for tile in row]
+        if flat.count(DEN_P1) != 1 or flat.count(DEN_P2) != 1:
+            raise ValueError("layout needs exactly one den per player")
+        self.flat_tiles = flat
+        self.is_river = [tile == RIVER for tile in flat]
+        self.own_den = {1: DEN_P1, -1: DEN_P2}
+        self.goal = {1: flat.index(DEN_P2), -1: flat.index(DEN_P1)}
+
+        # trap tiles that weaken each player's pieces
+        enemy_trap = {1: TRAP_P2, -1: TRAP_P1}
+        self.trapped = {}
+        for player in (1, -1):
+            self.trapped[player] = [
+                tile == enemy_trap[player]
+                or (self.traps_weaken_owner and tile in (TRAP_P1, TRAP_P2))
+                for tile in flat
+            ]
+
+        self.neighbours = []
+        self.jumps = []   # (landing square, squares jumped over)
+        for sq in range(ROWS * COLS):
+            row, col = divmod(sq, COLS)
+            adjacent = []
+            jumps = []
+            for dr, dc in DIRECTIONS:
+                r, c = row + dr, col + dc
+                if not (0 <= r < ROWS and 0 <= c < COLS):
+                    continue
+                adjacent.append(r * COLS + c)
+                over = []
+                while 0 <= r < ROWS and 0 <= c < COLS and self.is_river[r * COLS + c]:
+                    over.append(r * COLS + c)
+                    r += dr
+                    c += dc
+                if over and 0 <= r < ROWS and 0 <= c < COLS:
+                    jumps.append((r * COLS + c, tuple(over)))
+            self.neighbours.append(tuple(adjacent))
+            self.jumps.append(tuple(jumps))
+
+        # traps and the squares next to them, for move ordering
+        zone = set()
+        for sq, tile in enumerate(flat):
+            if tile in (TRAP_P1, TRAP_P2):
+                zone.add(divmod(sq, COLS))
+                zone.update(divmod(n, COLS) for n in self.neighbours[sq])
+        self.trap_zone = frozenset(zone)
+
+        self.capture = bytes(self._capture_matrix())
+        # for inline lookups: capture_index() of a rank pair, plus the
+        # terrain bits below
+        self.attacker_water_bit = [4 if river else 0 for river in self.is_river]
+        self.defender_water_bit = [2 if river else 0 for river in self.is_river]
+        self.defender_bits = {   # water and trap bits for a defender of player
+            player: [water + trapped for water, trapped in
+                     zip(self.defender_water_bit, self.trapped[player])]
+            for player in (1, -1)
+        }
+
+    def _capture_matrix(self):
+        matrix = bytearray(capture_index(9, 0, 0, 0, 0))
+        for attacker in ANIMALS:
+            for defender in ANIMALS:
+                for terrain in range(8):
+                    in_water = terrain >> 2
+                    defender_in_water = (terrain >> 1) & 1
+                    trapped = terrain & 1
+                    index = capture_index(attacker.rank, defender.rank,
+                                          in_water, defender_in_water, trapped)
+                    matrix[index] = self._captures(
+                        attacker, defender, in_water, defender_in_water, trapped
+                    )
+        return matrix
+
+    # The capture rules, from the AnimalType definitions and house-rule flags;
+    # only used to fill the matrix
+    def _captures(self, attacker, defender, in_water, defender_in_water, trapped):
+        if in_water and not self.water_captures:
+            return False
+        # elephant can never capture rat
+        if defender in attacker.never_captures:
+            return False
+        # rat captures elephant, but not from the water
+        if defender in attacker.also_captures:
+            return not in_water
+        # a trapped defender can be taken by anything
+        if trapped:
+            return True
+        # swimmers only fight each other in the same element
+        if attacker.swims and defender.swims:
+            return in_water == defender_in_water
+        return attacker.rank >= defender.rank
+
+    def can_capture(self, attacker_rank, defender_rank, defender_player, from_sq, to_sq):
+        return self.capture[
+            (attacker_rank * 9 + defender_rank) * 8 + self.attacker_water_bit[from_sq]
+            + self.defender_bits[defender_player][to_sq]
+        ] != 0
+
+    def new_tiles(self):
+        return [list(row) for row in self.tiles]
+
+    def __repr__(self):
+        return f"Ruleset({self.name!r})"
+
+
+# ids are stored in encodings: only ever append to this list
+BUILTIN_NAMES = ("standard", "no-water-capture", "open-traps")
+CUSTOM_ID = 15
+FINGERPRINT_SIZE = 8
+
+RULESETS = []                               # built-ins, by id
+_BY_NAME = weakref.WeakValueDictionary()
+_BY_FINGERPRINT = weakref.WeakValueDictionary()
+
+
+# Called by Ruleset itself. A ruleset with the same definition as a
+# registered one is accepted; lookups keep returning the first.
+def register(ruleset):
+    known = _BY_NAME.get(ruleset.name)
+    if known is not None:
+        if known.fingerprint != ruleset.fingerprint:
+            raise ValueError(f"ruleset {ruleset.name!r} is already defined differently")
+        ruleset.id = known.id
+        return known
+    if ruleset.name in BUILTIN_NAMES:
+        ruleset.id = BUILTIN_NAMES.index(ruleset.name)
+        RULESETS.append(ruleset)
+    else:
+        ruleset.id = CUSTOM_ID
+    _BY_NAME[ruleset.name] = ruleset
+    _BY_FINGERPRINT[ruleset.fingerprint] = ruleset
+    return ruleset
+
+
+# key: a built-in id, a name or a fingerprint
+def get_ruleset(key):
+    if isinstance(key, int):
+        ruleset = RULESETS[key] if 0 <= key < len(RULESETS) else None
+    elif isinstance(key, bytes):
+        ruleset = _BY_FINGERPRINT.get(key)
+    else:
+        ruleset = _BY_NAME.get(key)
+    if ruleset is None:
+        raise ValueError(f"unknown ruleset {key!r}")
+    return ruleset
+
+
+# Every ruleset currently registered, built-ins first
+def registered_rulesets():
+    return RULESETS + [r for r in _BY_NAME.values() if r.id == CUSTOM_ID]
+
+
+STANDARD = Ruleset("standard")
+NO_WATER_CAPTURE = Ruleset("no-water-capture", water_captures=False)
+OPEN_TRAPS = Ruleset("open-traps", traps_weaken_owner=True)
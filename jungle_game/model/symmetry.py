@@ -0,0 +1,153 @@
+from jungle_game.model.game_state import GameState
+from jungle_game.model.encoding import (
+    ROWS, COLS, NUM_SQUARES, EMPTY, piece_code, piece_from_code, square_of, position_of
+)
+from jungle_game.model.rules import TRAP_P1, TRAP_P2, DEN_P1, DEN_P2
+
+# Board symmetries of Jungle.
+#
+# The standard tile layout is left-right mirror symmetric, and rotating it by
+# 180 degrees swaps the two sides' traps and dens. So a position is
+# equivalent to
+#   MIRROR       columns reflected
+#   ROTATE_SWAP  rotated 180 degrees with the players (and side to move) swapped
+#   FLIP_SWAP    rows reflected with the players swapped (the two above combined)
+# Every transform is its own inverse. A variant layout may lack some of these
+# symmetries; layout_transforms() gives the ones its ruleset supports.
+
+IDENTITY = 0
+MIRROR = 1
+ROTATE_SWAP = 2
+FLIP_SWAP = 3
+TRANSFORMS = (IDENTITY, MIRROR, ROTATE_SWAP, FLIP_SWAP)
+
+
+def _map_square(square, transform):
+    row, col = divmod(square, COLS)
+    if transform in (MIRROR, ROTATE_SWAP):
+        col = COLS - 1 - col
+    if transform in (ROTATE_SWAP, FLIP_SWAP):
+        row = ROWS - 1 - row
+    return row * COLS + col
+
+
+SQUARE_MAPS = [
+    [_map_square(sq, t) for sq in range(NUM_SQUARES)]
+    for t in TRANSFORMS
+]
+
+
+def swaps_players(transform):
+    return transform in (ROTATE_SWAP, FLIP_SWAP)
+
+
+_SWAPPED_TILE = {TRAP_P1: TRAP_P2, TRAP_P2: TRAP_P1, DEN_P1: DEN_P2, DEN_P2: DEN_P1}
+_LAYOUT_TRANSFORMS = {}   # layout -> transforms that map it onto itself
+
+
+def layout_transforms(ruleset):
+    transforms = _LAYOUT_TRANSFORMS.get(ruleset.layout)
+    if transforms is None:
+        tiles = ruleset.flat_tiles
+        transforms = tuple(
+            t for t in TRANSFORMS
+            if all(
+                tiles[SQUARE_MAPS[t][sq]] == (
+                    _SWAPPED_TILE.get(tiles[sq], tiles[sq]) if swaps_players(t) else tiles[sq]
+                )
+                for sq in range(NUM_SQUARES)
+            )
+        )
+        _LAYOUT_TRANSFORMS[ruleset.layout] = transforms
+    return transforms
+
+
+def inverse(transform):
+    return transform
+
+
+def transform_code(code, transform):
+    if code == EMPTY or not swaps_players(transform):
+        return code
+    return code + 8 if code <= 8 else code - 8
+
+
+def transform_square(square, transform):
+    return SQUARE_MAPS[transform][square]
+
+
+def transform_position(position, transform):
+    return position_of(SQUARE_MAPS[transform][square_of(position)])
+
+
+def transform_move(move, transform):
+    from_pos, to_pos = move
+    return transform_position(from_pos, transform), transform_position(to_pos, transform)
+
+
+def board_codes(state):
+    codes = []
+    for row in state.board.pieces:
+        for piece in row:
+            codes.append(piece_code(piece))
+    return codes
+
+
+def position_key(codes, side_to_move, transform):
+    out = bytearray(NUM_SQUARES + 1)
+    square_map = SQUARE_MAPS[transform]
+    for square, code in enumerate(codes):
+        if code != EMPTY:
+            out[square_map[square]] = transform_code(code, transform)
+    if swaps_players(transform):
+        side_to_move = -side_to_move
+    out[NUM_SQUARES] = 1 if side_to_move == 1 else 2
+    return bytes(out)
+
+
+# Returns (key, transform): key is the smallest position key over all
+# symmetric images the ruleset allows, transform maps this position onto
+# that representative. Moves found in the canonical frame map back with transform_move(move,
+# inverse(transform)).
+def canonicalize(state):
+    codes = board_codes(state)
+    best_key, best_transform = None, IDENTITY
+    for transform in layout_transforms(state.board.ruleset):
+        key = position_key(codes, state.current_player, transform)
+        if best_key is None or key < best_key:
+            best_key, best_transform = key, transform
+    return best_key, best_transform
+
+
+def canonical_key(state):
+    return canonicalize(state)[0]
+
+
+# New state (without move history) holding the transformed position, under
+# the same rules
+def transform_state(state, transform):
+    ruleset = state.board.ruleset
+    if transform not in layout_transforms(ruleset):
+        raise ValueError(f"the {ruleset.name} layout has no symmetry {transform}")
+    result = GameState(ruleset)
+    pieces = result.board.pieces
+    for row in range(ROWS):
+        for col in range(COLS):
+            pieces[row][col] = None
+    for square, code in enumerate(board_codes(state)):
+        if code != EMPTY:
+            target = SQUARE_MAPS[transform][square]
+            pieces[target // COLS][target % COLS] = piece_from_code(
+                transform_code(code, transform), target
+            )
+
+    swap = swaps_players(transform)
+    result.current_player = -state.current_player if swap else state.current_player
+    if swap:
+        result.undo_used = {1: state.undo_used[-1], -1: state.undo_used[1]}
+    else:
+        result.undo_used = dict(state.undo_used)
+    result.game_over = state.game_over
+    if state.winner is not None:
+        result.winner = -state.winner if swap else state.winner
+    return result
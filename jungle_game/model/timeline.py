@@ -0,0 +1,193 @@
+from array import array
+
+from jungle_game.model.encoding import (
+    NUM_SQUARES, POSITIONS, square_of, piece_code, piece_from_code
+)
+
+# Review timeline: seek to any ply, step back and forward, branch variations.
+#
+# Each line (the main game or a variation) stores only its own moves, packed
+# four bytes per ply like MoveHistory, plus the line and ply it branched
+# from. Every checkpoint_every plies a line also keeps a position snapshot
+# (63 piece codes + side + winner), so seek() restores the nearest snapshot
+# and replays at most checkpoint_every - 1 moves. The state's move history
+# is cut back or extended to the new ply rather than rebuilt: a byte copy
+# of the plies in between plus one step per capture among them, so a
+# long seek costs little more than a short one.
+#
+# The timeline drives an ordinary GameState (self.state) whose move_history
+# is the path from the first position to the cursor. Stepping through the
+# timeline never touches undo_used; per-player undo limits are for
+# GameState.undo_last_move callers to enforce.
+
+
+class Line:
+    def __init__(self, parent=None, fork=0):
+        self.parent = parent
+        self.fork = fork          # plies shared with the parent line
+        self.moves = array("B")   # from, to, captured code, mover (1/2) per ply
+        self.checkpoints = {}     # ply -> snapshot bytes
+        self.children = []        # variations branching off this line
+
+    @property
+    def end(self):
+        return self.fork + len(self.moves) // 4
+
+    # line owning the given ply of this line's path
+    def owner(self, ply):
+        line = self
+        while ply <= line.fork and line.parent is not None:
+            line = line.parent
+        return line
+
+    def move_at(self, ply):
+        # the move leading to position `ply` (1-based)
+        line = self.owner(ply)
+        offset = (ply - line.fork - 1) * 4
+        return tuple(line.moves[offset:offset + 4])
+
+    # packed moves of plies start + 1 .. ply along this line's path
+    def path_bytes(self, ply, start=0):
+        parts = []
+        line = self
+        while line is not None and ply > start:
+            if ply > line.fork:
+                low = max(start, line.fork)
+                parts.append(line.moves[(low - line.fork) * 4:(ply - line.fork) * 4].tobytes())
+                ply = low
+            line = line.parent
+        return b"".join(reversed(parts))
+
+
+def _snapshot(state):
+    codes = bytes(piece_code(p) for row in state.board.pieces for p in row)
+    winner = {None: 0, 1: 1, -1: 2}[state.winner]
+    return codes + bytes((1 if state.current_player == 1 else 2, winner))
+
+
+class Timeline:
+    def __init__(self, state=None, checkpoint_every=16):
+        from jungle_game.model.game_state import GameState
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be at least 1")
+        self.state = state if state is not None else GameState()
+        self.checkpoint_every = checkpoint_every
+        # plies already in the state's history stay as a fixed prefix
+        self._prefix = self.state.move_history.to_bytes()
+        self.main = Line()
+        self.main.checkpoints[0] = _snapshot(self.state)
+        self.line = self.main
+        self.ply = 0
+
+    @property
+    def end(self):
+        return self.line.end
+
+    # -------- moving the cursor --------
+
+    def back(self):
+        if self.ply == 0:
+            return False
+        undo_used = dict(self.state.undo_used)
+        self.state.undo_last_move()
+        self.state.undo_used = undo_used
+        self.ply -= 1
+        return True
+
+    def forward(self):
+        if self.ply >= self.line.end:
+            return False
+        from_sq, to_sq, _, _ = self.line.move_at(self.ply + 1)
+        self.state.make_move(POSITIONS[from_sq], POSITIONS[to_sq])
+        self.ply += 1
+        return True
+
+    redo = forward
+
+    def seek(self, ply):
+        if not 0 <= ply <= self.line.end:
+            raise IndexError(f"ply {ply} outside 0..{self.line.end}")
+        distance = ply - self.ply
+        if 0 <= distance < self.checkpoint_every:
+            for _ in range(distance):
+                self.forward()
+            return
+        if -self.checkpoint_every < distance < 0:
+            for _ in range(-distance):
+                self.back()
+            return
+        checkpoint = ply - ply % self.checkpoint_every
+        self._restore(checkpoint)
+        for _ in range(ply - checkpoint):
+            self.forward()
+
+    def _restore(self, ply):
+        snapshot = self.line.owner(ply).checkpoints[ply]
+        state = self.state
+        board = state.board
+        for sq in range(NUM_SQUARES):
+            board.pieces[sq // 7][sq % 7] = piece_from_code(snapshot[sq], sq)
+        state.current_player = 1 if snapshot[NUM_SQUARES] == 1 else -1
+        state.winner = {0: None, 1: 1, 2: -1}[snapshot[NUM_SQUARES + 1]]
+        state.game_over = state.winner is not None
+        # the history holds the path to self.ply on this line; keep the
+        # part shared with the path to ply
+        shared = min(ply, self.ply)
+        history = state.move_history
+        history.truncate(len(self._prefix) // 4 + shared)
+        history.extend_bytes(self.line.path_bytes(ply, shared))
+        state.invalidate_legal_moves()
+        state.notify_state_loaded()
+        self.ply = ply
+
+    # -------- playing moves --------
+
+    # Plays a move at the cursor. At the end of the line it extends the line;
+    # otherwise it follows the existing next move, enters a variation that
+    # starts with this move, or opens a new one.
+    def play(self, from_pos, to_pos):
+        from_sq, to_sq = square_of(from_pos), square_of(to_pos)
+        if self.ply < self.line.end:
+            if self.line.move_at(self.ply + 1)[:2] == (from_sq, to_sq):
+                return self.forward()
+            for variation in self.variations():
+                if tuple(variation.moves[:2]) == (from_sq, to_sq):
+                    self.line = variation
+                    return self.forward()
+        captured = self.state.board.get_piece(to_pos)
+        player = self.state.current_player
+        if not self.state.make_move(from_pos, to_pos):
+            return False
+        if self.ply < self.line.end:
+            parent = self.line.owner(self.ply)
+            variation = Line(parent, self.ply)
+            parent.children.append(variation)
+            self.line = variation
+        self.line.moves.extend((from_sq, to_sq, piece_code(captured),
+                                1 if player == 1 else 2))
+        self.ply += 1
+        if self.ply % self.checkpoint_every == 0:
+            self.line.checkpoints[self.ply] = _snapshot(self.state)
+        return True
+
+    # Variations branching at the cursor (alternatives to the next move)
+    def variations(self):
+        lines = []
+        line = self.line
+        while line is not None:
+            lines.extend(child for child in line.children
+                         if child.fork == self.ply and child is not self.line)
+            if self.ply > line.fork:
+                break
+            line = line.parent
+        return lines
+
+    # Leaves the current variation for the line it branched from, keeping
+    # the cursor where it is if that ply is shared, else at the branch point
+    def exit_variation(self):
+        if self.line.parent is None:
+            return False
+        if self.ply > self.line.fork:
+            self.seek(self.line.fork)
+        self.line = self.line.parent
+        return True
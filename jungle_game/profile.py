@@ -0,0 +1,74 @@
+import argparse
+import cProfile
+import io
+import pstats
+import random
+import sys
+
+from jungle_game.model.game_state import GameState
+from jungle_game.model import instrumentation
+
+
+# Canned self-play workload: random legal moves, with an undo + replay every
+# few plies so undo_last_move shows up in the profile as well.
+def play_random_game(rng, max_plies=300, undo_every=8):
+    state = GameState()
+    plies = 0
+    while not state.is_game_over() and plies < max_plies:
+        moves = state.get_legal_moves(state.get_current_player())
+        if not moves:
+            break
+        from_pos, to_pos = rng.choice(moves)
+        state.make_move(from_pos, to_pos)
+        plies += 1
+        if undo_every and plies % undo_every == 0:
+            state.undo_last_move()
+            state.make_move(from_pos, to_pos)
+    return state
+
+
+def run_workload(games, seed, max_plies):
+    rng = random.Random(seed)
+    for _ in range(games):
+        play_random_game(rng, max_plies)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m jungle_game.profile",
+        description="Profile the model layer on a canned self-play workload."
+    )
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--max-plies", type=int, default=300)
+    parser.add_argument("--sort", default="cumulative",
+                        help="pstats sort key (default: cumulative)")
+    parser.add_argument("--limit", type=int, default=25,
+                        help="number of pstats rows to print")
+    parser.add_argument("--output", help="also dump raw cProfile stats to this file")
+    args = parser.parse_args(argv)
+
+    profiler = cProfile.Profile()
+    with instrumentation.instrumented():
+        profiler.enable()
+        run_workload(args.games, args.seed, args.max_plies)
+        profiler.disable()
+        hot_paths = instrumentation.report()
+
+    if args.output:
+        profiler.dump_stats(args.output)
+
+    out = io.StringIO()
+    stats = pstats.Stats(profiler, stream=out)
+    stats.strip_dirs().sort_stats(args.sort).print_stats(args.limit)
+
+    print(f"Self-play workload: {args.games} games, seed {args.seed}")
+    print()
+    print(hot_paths)
+    print()
+    print(out.getvalue())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,19 +1,27 @@
 from jungle_game.controller.game_controller import GameController
+from jungle_game.model.events import STATE_LOADED
 import tkinter as tk
 from tkinter import filedialog
 
 
 class JungleGameApp (tk.Tk):
     #GUI itself
-    def __init__(self, screenName = None, baseName = None, className = "Tk", useTk = True, sync = False, use = None) -> None:
+    def __init__(self, screenName = None, baseName = None, className = "Tk", useTk = True, sync = False, use = None, bot = None) -> None:
         super().__init__(screenName, baseName, className, useTk, sync, use)
 
+        # Optional computer opponent for Player 2 (e.g. engine.Engine); it
+        # ponders on the human's time through the controller
+        self.bot = bot
+        self._bot_move = None   # the controller's PendingBotMove, if thinking
+
         # Window Settings
         self.title("Jungle Game")
         self.resizable (False,False)
 
         #Creating controller with new Game
         self.controller = GameController.new_game()
+        # redraw only the squares each move/undo touches
+        self.controller.add_listener(self.on_game_event)
 
         #Emoji Map
         self.emoji_map = {
@@ -144,6 +152,8 @@ class JungleGameApp (tk.Tk):
     def on_cell_click(self, row, col):
         if self.controller.is_game_over():
             return
+        if self.bot is not None and self.controller.get_current_player() == -1:
+            return
         if self.selected_cell is None:
             if self.controller.can_select_piece(row, col):
                 self.selected_cell = (row, col)
@@ -157,36 +167,59 @@ class JungleGameApp (tk.Tk):
                 self.after(2000, self.restore_player_turn)
         else:
             from_row, from_col = self.selected_cell
-            # Unselect
-            if from_row == row and from_col == col:
-                self.selected_cell = None
-                self.refresh_board()
-            
-            if self.controller.make_move(from_row, from_col, row, col):
-                self.selected_cell=None
-                self.status_label.config(text=f"Moved piece.")
-                self.refresh_board()
-            else:
-                self.status_label.config(text="Illegal move.")
-                self.selected_cell = None
-                self.refresh_board()
-
-            # Reset all cell backgrounds to base colors
-            for r in range(self.rows):
-                for c in range(self.cols):
-                    self.cell_labels[r][c].config(bg=self.base_bg[r][c])
-            self.refresh_board()
+            # Unselect (clears the highlight on the selected cell)
+            self.selected_cell = None
+            self.refresh_cell(from_row, from_col)
+
+            # squares changed by the move are redrawn by on_game_event
+            moved = self.controller.make_move(from_row, from_col, row, col)
+            self.refresh_status()
+            if moved:
+                self.play_bot_move()
+
+    # Starts the bot's search if it is Player 2's turn; the search runs in a
+    # worker thread so the window stays responsive
+    def play_bot_move(self):
+        if self.bot is None or self._bot_move is not None:
+            return
+        if self.controller.is_game_over() or self.controller.get_current_player() != -1:
+            return
+        self._bot_move = self.controller.start_bot_move(self.bot)
+        self.status_label.config(text="Player 2 is thinking...")
+        self.after(50, self.poll_bot_move)
+
+    def poll_bot_move(self):
+        if not self._bot_move.done():
+            self.after(50, self.poll_bot_move)
+            return
+        pending, self._bot_move = self._bot_move, None
+        # dropped if the game was undone, loaded or reset meanwhile
+        self.controller.finish_bot_move(pending, ponder=True)
+        self.refresh_status()
+        # after a dropped move it may still (again) be the bot's turn
+        self.play_bot_move()
 
     def on_undo(self):
-        if self.controller.undo():
+        if self.selected_cell is not None:
+            row, col = self.selected_cell
             self.selected_cell = None
+            self.refresh_cell(row, col)
+        if self.controller.undo():
+            self.refresh_status()
+            self.play_bot_move()
+
+    def on_game_event(self, event):
+        if event.kind == STATE_LOADED:
             self.refresh_board()
+            return
+        for square in event.squares:
+            self.refresh_cell(square // self.cols, square % self.cols)
 
     def reset_game(self):
-        self.controller = GameController.new_game()
         self.selected_cell = None
-        self.refresh_board()
+        self.controller.reset_game()
         self.status_label.config(text="New game started. Player 1's turn.")
+        self.play_bot_move()
 
     def save_game(self):
         filename = filedialog.asksaveasfilename(
@@ -214,11 +247,11 @@ class JungleGameApp (tk.Tk):
             self.after(2000, self.restore_player_turn)
             return
             
-        self.controller.load_game(filename)
         self.selected_cell = None
-        self.refresh_board()
+        self.controller.load_game(filename)
         self.status_label.config(text=f"Loaded game from {filename}")
         self.after(2000, self.restore_player_turn)
+        self.play_bot_move()
     
     def replay_moves(self, type=("Records", "*.record")):
         filename = self.open_file_dialog(type)
@@ -229,19 +262,19 @@ class JungleGameApp (tk.Tk):
             
         self.status_label.config(text=f"Replaing from {filename}")
 
+        self.selected_cell = None
         moves= self.controller.replay_game(filename)
-        self.refresh_board()
         self.after(1000, lambda: self.animate_replay(0, moves))
-        self.refresh_board()
 
     def animate_replay(self, index, moves):
         if index >= len(moves):
             self.status_label.config(text="Replay finished.")
             self.refresh_board()
+            self.play_bot_move()
             return
         move = moves[index]
         self.controller.apply_move_tuple(move)
-        self.refresh_board()
+        self.refresh_status()
 
         self.after(1000, lambda: self.animate_replay(index + 1, moves))
         
@@ -252,26 +285,31 @@ class JungleGameApp (tk.Tk):
         rows, cols = self.rows, self.cols
         for r in range(rows):
             for c in range(cols):
-                symbol = self.controller.get_piece_name(r, c)
-                if symbol==None:
-                    emoji = ""
-                else:
-                    base = symbol.upper()
-                    animal = self.emoji_map.get(base, "?")
-                    if symbol.isupper():
-                        emoji = animal + "⬆️"
-                    else:
-                        emoji = animal + "⬇️"
+                self.refresh_cell(r, c)
+        self.refresh_status()
 
-                # base background color from tile
-                bg = self.base_bg[r][c]
+    def refresh_cell(self, r, c) -> None:
+        symbol = self.controller.get_piece_name(r, c)
+        if symbol==None:
+            emoji = ""
+        else:
+            base = symbol.upper()
+            animal = self.emoji_map.get(base, "?")
+            if symbol.isupper():
+                emoji = animal + "⬆️"
+            else:
+                emoji = animal + "⬇️"
+
+        # base background color from tile
+        bg = self.base_bg[r][c]
 
-                # highlight selected cell
-                if self.selected_cell == (r, c):
-                    bg = "#ffff88"  # light yellow
+        # highlight selected cell
+        if self.selected_cell == (r, c):
+            bg = "#ffff88"  # light yellow
 
-                self.cell_labels[r][c].config(text=emoji, bg=bg)
+        self.cell_labels[r][c].config(text=emoji, bg=bg)
 
+    def refresh_status(self) -> None:
         # update status text
         if self.controller.is_game_over():
             winner = self.controller.get_winner()
@@ -288,6 +326,9 @@ class JungleGameApp (tk.Tk):
         self.status_label.config(text=text)
 
     def restore_player_turn(self):
+        if self._bot_move is not None:
+            self.status_label.config(text="Player 2 is thinking...")
+            return
         player = self.controller.get_current_player()
         self.status_label.config(text=f"Player {1 if player == 1 else 2}'s turn")
         return
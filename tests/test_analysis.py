@@ -0,0 +1,57 @@
+import json
+import os
+import random
+import tempfile
+import unittest
+
+from jungle_game.model.game_state import GameState
+from jungle_game.engine import analysis
+
+
+def write_random_record(directory, seed, plies):
+    rng = random.Random(seed)
+    gs = GameState()
+    for _ in range(plies):
+        if gs.is_game_over():
+            break
+        gs.make_move(*rng.choice(gs.get_legal_moves(gs.get_current_player())))
+    filename = os.path.join(directory, f"game{seed}.record")
+    gs.save_record(filename)
+    return filename, len(gs.move_history)
+
+
+class TestAnalysis(unittest.TestCase):
+    def test_labels(self):
+        self.assertIsNone(analysis.label_for(0))
+        self.assertEqual(analysis.label_for(analysis.INACCURACY), "inaccuracy")
+        self.assertEqual(analysis.label_for(analysis.MISTAKE), "mistake")
+        self.assertEqual(analysis.label_for(analysis.BLUNDER + 1), "blunder")
+
+    def test_analyse_record_writes_sidecar_for_every_ply(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            filename, plies = write_random_record(tmp, 5, 12)
+            result = analysis.analyse_record(filename, depth=1)
+
+            self.assertEqual(len(result["plies"]), plies)
+            with open(filename + analysis.SIDECAR_SUFFIX) as f:
+                data = json.load(f)
+            self.assertEqual(data["plies"][0]["ply"], 0)
+            for entry in data["plies"]:
+                self.assertGreaterEqual(entry["delta"], 0)
+                if entry["move"] == entry["best_move"]:
+                    self.assertEqual(entry["delta"], 0)
+
+    def test_analyse_records_in_process_pool(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            names = [write_random_record(tmp, seed, 6)[0] for seed in (1, 2)]
+            names.append(os.path.join(tmp, "missing.record"))
+            results = analysis.analyse_records(names, depth=1, workers=2)
+
+            self.assertEqual([r[0] for r in results], names)
+            self.assertIsNone(results[0][2])
+            self.assertIsNotNone(results[2][2])
+            self.assertTrue(os.path.exists(names[1] + analysis.SIDECAR_SUFFIX))
+
+
+if __name__ == "__main__":
+    unittest.main()
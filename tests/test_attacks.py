@@ -0,0 +1,148 @@
+import random
+import unittest
+
+from jungle_game.model.game_state import GameState
+from jungle_game.model.piece import Piece
+from jungle_game.model.position import Position
+from jungle_game.model.animal_type import LION, RAT, ELEPHANT, CAT
+from jungle_game.model.attacks import AttackMap
+from jungle_game.model.encoding import square_of
+from jungle_game.model.rules import Ruleset
+
+# wider river and extra traps, so no standard table would fit
+WIDE_RIVER = Ruleset("attacks-wide-river", layout=(
+    "..tdt..", "t..t..t", ".......", ".~~~~~.", ".~~.~~.",
+    ".~~~~~.", ".......", "T..T..T", "..TDT..",
+))
+
+
+def clear_board(gs):
+    for r in range(9):
+        for c in range(7):
+            gs.board.pieces[r][c] = None
+
+
+def place(gs, animal, player, r, c):
+    gs.board.pieces[r][c] = Piece(animal, player, Position(r, c))
+
+
+class TestAttackMap(unittest.TestCase):
+    def assertSameMap(self, incremental, board):
+        full = AttackMap(board)
+        self.assertEqual(incremental.codes, full.codes)
+        self.assertEqual(incremental.attackers, full.attackers)
+        self.assertEqual(incremental.hanging, full.hanging)
+
+    def test_incremental_matches_full_recompute(self):
+        rng = random.Random(7)
+        for _ in range(3):
+            gs = GameState()
+            attack_map = AttackMap.for_state(gs)
+            for _ in range(150):
+                if gs.is_game_over():
+                    break
+                moves = gs.get_legal_moves(gs.get_current_player())
+                if not moves:
+                    break
+                gs.make_move(*rng.choice(moves))
+                self.assertSameMap(attack_map, gs.board)
+                if rng.random() < 0.2:
+                    gs.undo_last_move()
+                    self.assertSameMap(attack_map, gs.board)
+
+    def assertHangingMatchesModel(self, gs, attack_map):
+        for r in range(9):
+            for c in range(7):
+                piece = gs.board.pieces[r][c]
+                if piece is None:
+                    continue
+                target = Position(r, c)
+                expected = any(
+                    gs.board.is_legal_move(other, target, -piece.player)
+                    for row in gs.board.pieces for other in row
+                    if other is not None and other.player != piece.player
+                )
+                self.assertEqual(attack_map.is_hanging(square_of(target)), expected,
+                                 (piece.get_name(), r, c))
+
+    def test_hanging_matches_is_legal_move(self):
+        rng = random.Random(11)
+        gs = GameState()
+        attack_map = AttackMap.for_state(gs)
+        for _ in range(80):
+            if gs.is_game_over():
+                break
+            self.assertHangingMatchesModel(gs, attack_map)
+            moves = gs.get_legal_moves(gs.get_current_player())
+            if not moves:
+                break
+            gs.make_move(*rng.choice(moves))
+
+        # traps: an enemy trap weakens a piece, its own trap does not
+        for player, (r, c) in ((-1, (7, 3)), (1, (7, 3)), (1, (1, 3)), (-1, (1, 3))):
+            gs = GameState()
+            clear_board(gs)
+            place(gs, ELEPHANT, player, r, c)
+            place(gs, CAT, -player, r, c - 1)
+            place(gs, CAT, -player, r, c + 1)
+            self.assertHangingMatchesModel(gs, AttackMap(gs.board))
+
+    def test_follows_the_board_ruleset(self):
+        rng = random.Random(5)
+        gs = GameState(WIDE_RIVER)
+        attack_map = AttackMap.for_state(gs)
+        for _ in range(120):
+            if gs.is_game_over():
+                break
+            self.assertHangingMatchesModel(gs, attack_map)
+            self.assertSameMap(attack_map, gs.board)
+            moves = gs.get_legal_moves(gs.get_current_player())
+            if not moves:
+                break
+            gs.make_move(*rng.choice(moves))
+
+        # a jump across the whole row and a trap the standard board lacks
+        gs = GameState(WIDE_RIVER)
+        clear_board(gs)
+        place(gs, LION, 1, 3, 0)
+        place(gs, CAT, -1, 3, 6)
+        place(gs, ELEPHANT, 1, 1, 0)
+        place(gs, CAT, -1, 2, 0)
+        attack_map = AttackMap(gs.board)
+        self.assertTrue(attack_map.is_hanging(3 * 7 + 6))
+        self.assertTrue(attack_map.is_hanging(1 * 7 + 0))
+        self.assertHangingMatchesModel(gs, attack_map)
+
+    def test_rat_in_river_blocks_jump(self):
+        gs = GameState()
+        clear_board(gs)
+        place(gs, LION, 1, 6, 1)
+        place(gs, CAT, -1, 2, 1)
+        place(gs, RAT, -1, 4, 1)
+        attack_map = AttackMap(gs.board)
+        lion_sq = 6 * 7 + 1
+        self.assertNotIn(lion_sq, attack_map.attackers[2 * 7 + 1])
+        self.assertFalse(attack_map.is_hanging(2 * 7 + 1))
+
+        # the rat leaves the river and the jump opens
+        gs.board.move_piece(Position(4, 1), Position(4, 0))
+        attack_map.move(4 * 7 + 1, 4 * 7 + 0)
+        self.assertIn(lion_sq, attack_map.attackers[2 * 7 + 1])
+        self.assertTrue(attack_map.is_hanging(2 * 7 + 1))
+        self.assertEqual(attack_map.strongest_attacker(2 * 7 + 1, 1), (7, lion_sq))
+
+    def test_rat_elephant_exceptions(self):
+        gs = GameState()
+        clear_board(gs)
+        place(gs, ELEPHANT, 1, 6, 0)
+        place(gs, RAT, -1, 5, 0)
+        place(gs, RAT, 1, 4, 1)
+        attack_map = AttackMap(gs.board)
+        # the elephant may not take the rat; the enemy rat may take the elephant
+        self.assertFalse(attack_map.is_hanging(5 * 7 + 0))
+        self.assertTrue(attack_map.is_hanging(6 * 7 + 0))
+        self.assertEqual(attack_map.hanging_pieces(1), [6 * 7 + 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
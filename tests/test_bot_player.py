@@ -0,0 +1,89 @@
+import threading
+import unittest
+
+from jungle_game.controller.game_controller import GameController
+from jungle_game.controller.bot_player import BatchedEvaluator, InferenceBot
+from jungle_game.model.game_state import GameState
+from jungle_game.model.encoding import square_of
+from jungle_game.engine import features
+
+
+# Encoder/model pair that needs no NumPy: the "batch" is the list of samples
+def list_encoder(samples):
+    return list(samples)
+
+
+class RecordingModel:
+    def __init__(self, preferred=None):
+        self.batch_sizes = []
+        self.preferred = preferred
+
+    def __call__(self, batch):
+        self.batch_sizes.append(len(batch))
+        policies = []
+        values = []
+        for codes, side, undos in batch:
+            policy = [0.0] * features.POLICY_SIZE
+            if self.preferred is not None:
+                policy[self.preferred] = 1.0
+            policies.append(policy)
+            values.append(float(side))
+        return policies, values
+
+
+class TestBatchedEvaluator(unittest.TestCase):
+    def test_concurrent_positions_share_batches(self):
+        model = RecordingModel()
+        results = {}
+        barrier = threading.Barrier(16)
+
+        with BatchedEvaluator(model, batch_size=8, max_wait=0.2,
+                              encoder=list_encoder) as evaluator:
+            def play(i):
+                state = GameState()
+                if i % 2:
+                    state.current_player = -1
+                barrier.wait()
+                results[i] = evaluator.evaluate(state)
+
+            threads = [threading.Thread(target=play, args=(i,)) for i in range(16)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        self.assertEqual(evaluator.positions, 16)
+        self.assertLess(evaluator.batches, 16)
+        self.assertLessEqual(max(model.batch_sizes), 8)
+        for i, (policy, value) in results.items():
+            self.assertEqual(value, -1.0 if i % 2 else 1.0)
+
+    def test_model_errors_reach_callers(self):
+        def broken(batch):
+            raise RuntimeError("model failed")
+
+        with BatchedEvaluator(broken, encoder=list_encoder) as evaluator:
+            with self.assertRaises(RuntimeError):
+                evaluator.evaluate(GameState())
+
+    def test_closed_evaluator_rejects_work(self):
+        evaluator = BatchedEvaluator(RecordingModel(), encoder=list_encoder)
+        evaluator.close()
+        with self.assertRaises(RuntimeError):
+            evaluator.submit(GameState())
+
+
+class TestInferenceBot(unittest.TestCase):
+    def test_bot_plays_highest_policy_legal_move(self):
+        # rat (6,6) -> (5,6)
+        preferred = features.move_index(6 * 7 + 6, 5 * 7 + 6)
+        with BatchedEvaluator(RecordingModel(preferred), encoder=list_encoder) as evaluator:
+            controller = GameController()
+            move = controller.make_bot_move(InferenceBot(evaluator))
+        self.assertEqual((square_of(move[0]), square_of(move[1])), (6 * 7 + 6, 5 * 7 + 6))
+        self.assertIsNotNone(controller.get_piece_at(5, 6))
+        self.assertEqual(controller.get_current_player(), -1)
+
+
+if __name__ == "__main__":
+    unittest.main()
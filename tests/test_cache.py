@@ -0,0 +1,119 @@
+import os
+import tempfile
+import unittest
+
+from jungle_game.model.game_state import GameState
+from jungle_game.model.position import Position
+from jungle_game.model.rules import NO_WATER_CAPTURE
+from jungle_game.engine.cache import EvaluationCache, cache_key
+from jungle_game.engine.engine import Engine
+from jungle_game.engine.transposition import position_key
+from jungle_game.engine import analysis
+
+
+class TestEvaluationCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "eval.sqlite")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_entries_persist_across_runs(self):
+        big_key = (1 << 64) - 5   # does not fit a signed SQLite integer as-is
+        with EvaluationCache(self.path) as cache:
+            cache.put(big_key, 3, -250, 1234)
+            cache.put(7, 2, 10, None)
+
+        with EvaluationCache(self.path) as cache:
+            self.assertEqual(cache.get(big_key), (3, -250, 1234))
+            self.assertEqual(cache.get(7), (2, 10, None))
+            self.assertIsNone(cache.get(7, min_depth=3))
+            self.assertIsNone(cache.get(8))
+
+    def test_shallower_result_does_not_replace_deeper_one(self):
+        with EvaluationCache(self.path) as cache:
+            cache.put(1, 4, 100, 5)
+            cache.put(1, 2, -100, 6)
+            self.assertEqual(cache.get(1), (4, 100, 5))
+
+    def test_shallow_result_from_another_process_keeps_deeper_row(self):
+        with EvaluationCache(self.path) as deep, EvaluationCache(self.path) as shallow:
+            deep.put(1, 4, 100, 5)
+            deep.flush()
+            shallow.put(1, 2, -100, 6)   # this handle has not seen the deep row
+            shallow.flush()
+        with EvaluationCache(self.path) as cache:
+            self.assertEqual(cache.get(1), (4, 100, 5))
+
+    def test_trims_least_recently_used(self):
+        with EvaluationCache(self.path, max_entries=2) as cache:
+            cache.put(1, 1, 0, None)
+            cache.put(2, 1, 0, None)
+            cache.flush()
+            cache.get(1)
+            cache.put(3, 1, 0, None)
+            cache.flush()
+            self.assertEqual(len(cache), 2)
+
+        with EvaluationCache(self.path) as cache:
+            self.assertIsNone(cache.get(2))
+            self.assertIsNotNone(cache.get(1))
+            self.assertIsNotNone(cache.get(3))
+
+    def test_prefetch_loads_in_bulk(self):
+        with EvaluationCache(self.path) as cache:
+            for key in range(1, 1200):
+                cache.put(key, 1, key, None)
+        with EvaluationCache(self.path) as cache:
+            cache.prefetch(range(1, 1200))
+            self.assertEqual(len(cache._memory), 1199)
+
+    def test_engine_reuses_cached_search(self):
+        state = GameState()
+        with Engine(depth=2, cache=self.path) as engine:
+            first = engine.search(state)
+            self.assertGreater(first.nodes, 0)
+        with Engine(depth=2, cache=self.path) as engine:
+            second = engine.search(state)
+            self.assertEqual(second.nodes, 0)
+            self.assertEqual(second.score, first.score)
+            self.assertEqual(engine.cache.get(cache_key(state))[0], 2)
+
+    def test_rules_and_settings_get_their_own_entries(self):
+        standard = GameState()
+        variant = GameState(NO_WATER_CAPTURE)
+        keys = {cache_key(standard), cache_key(standard, quiescence=False),
+                cache_key(variant)}
+        self.assertEqual(len(keys), 3)
+        self.assertNotIn(position_key(standard), keys)
+
+        with Engine(depth=2, cache=self.path) as engine:
+            engine.search(standard)
+        with Engine(depth=2, cache=self.path, quiescence=False) as engine:
+            self.assertGreater(engine.search(standard).nodes, 0)
+        with Engine(depth=2, cache=self.path) as engine:
+            self.assertGreater(engine.search(variant).nodes, 0)
+            self.assertEqual(engine.search(standard).nodes, 0)
+
+    def test_analysis_second_run_hits_cache(self):
+        record = os.path.join(self.tmp.name, "game.record")
+        state = GameState()
+        for r1, c1, r2, c2 in [(6, 0, 5, 0), (2, 6, 3, 6), (5, 0, 4, 0)]:
+            state.make_move(Position(r1, c1), Position(r2, c2))
+        state.save_record(record)
+
+        with EvaluationCache(self.path) as cache:
+            first = analysis.analyse_record(record, depth=1, cache=cache)
+        with EvaluationCache(self.path) as cache:
+            second = analysis.analyse_record(record, depth=1, cache=cache)
+            self.assertEqual(cache.misses, 0)
+        # deeper cached results may replace shallow ones, best moves stay
+        self.assertEqual(
+            [p["best_move"] for p in first["plies"]],
+            [p["best_move"] for p in second["plies"]]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,287 @@
+import multiprocessing
+import os
+import unittest
+
+from jungle_game.controller.game_controller import GameController
+from jungle_game.model.game_state import GameState
+from jungle_game.model.position import Position
+from jungle_game.model.piece import Piece
+from jungle_game.model.animal_type import RAT, CAT, DOG, LION, ELEPHANT
+from jungle_game.engine.engine import Engine
+from jungle_game.engine.evaluation import WIN_SCORE, evaluate
+from jungle_game.engine.search import Searcher, INFINITY
+from jungle_game.engine.parallel import _helper_results
+from jungle_game.engine.transposition import (
+    TranspositionTable, SharedTranspositionTable, position_key, EXACT, LOWER
+)
+
+
+def make_empty_state():
+    gs = GameState()
+    for r in range(9):
+        for c in range(7):
+            gs.board.pieces[r][c] = None
+    return gs
+
+
+def place(gs, animal, player, r, c):
+    gs.board.pieces[r][c] = Piece(animal, player, Position(r, c))
+
+
+def move_tuple(move):
+    fr, to = move
+    return (fr.row, fr.col, to.row, to.col)
+
+
+def _post_result(results, worker_id):
+    results.put((worker_id, None, 0, 1, 10))
+
+
+class TestSearch(unittest.TestCase):
+    def test_finds_den_entry(self):
+        gs = make_empty_state()
+        place(gs, CAT, 1, 1, 3)
+        place(gs, ELEPHANT, -1, 4, 0)
+        place(gs, DOG, -1, 8, 6)
+
+        result = Engine(depth=3).search(gs)
+        self.assertEqual(move_tuple(result.move), (1, 3, 0, 3))
+        self.assertGreater(result.score, WIN_SCORE - 10)
+
+    def test_takes_free_piece_and_leaves_state_untouched(self):
+        gs = make_empty_state()
+        place(gs, DOG, 1, 6, 3)
+        place(gs, CAT, -1, 5, 3)
+        place(gs, RAT, -1, 1, 0)
+        before = gs.to_bytes()
+
+        result = Engine(depth=2).search(gs)
+        self.assertEqual(move_tuple(result.move), (6, 3, 5, 3))
+        self.assertEqual(gs.to_bytes(), before)
+        self.assertEqual(gs.undo_used, {1: 0, -1: 0})
+
+    def test_rejected_child_move_leaves_parent_ply(self):
+        gs = GameState()
+        gs.make_move(Position(6, 0), Position(5, 0))
+        searcher = Searcher()
+        score = searcher._child_score(gs, Position(6, 6), Position(4, 6), 2,
+                                      -INFINITY, INFINITY, 0)
+        self.assertEqual(score, -INFINITY)
+        self.assertEqual(len(gs.move_history), 1)
+        self.assertIsNotNone(gs.board.get_piece(Position(5, 0)))
+
+    def test_node_limit_still_returns_a_move(self):
+        result = Engine(depth=6, max_nodes=200).search(GameState())
+        self.assertIsNotNone(result.move)
+        self.assertGreaterEqual(result.depth, 1)
+
+
+class TestQuiescence(unittest.TestCase):
+    def test_sees_recapture_past_the_horizon(self):
+        gs = make_empty_state()
+        place(gs, DOG, 1, 6, 3)
+        place(gs, CAT, -1, 5, 3)
+        place(gs, ELEPHANT, -1, 4, 3)   # takes the dog back
+        place(gs, RAT, 1, 8, 0)
+
+        greedy = Engine(depth=1, quiescence=False).search(gs)
+        self.assertEqual(move_tuple(greedy.move), (6, 3, 5, 3))
+        careful = Engine(depth=1).search(gs)
+        self.assertNotEqual(move_tuple(careful.move), (6, 3, 5, 3))
+
+    def test_den_threat_forbids_stand_pat(self):
+        gs = make_empty_state()
+        place(gs, DOG, -1, 7, 3)   # next to player 1's den
+        place(gs, CAT, 1, 2, 0)
+        place(gs, RAT, -1, 0, 0)
+        score = Searcher().leaf_score(gs, -INFINITY, INFINITY, 0)
+        self.assertLess(score, -WIN_SCORE + 10)
+
+        place(gs, LION, 1, 6, 3)   # can take the intruder
+        score = Searcher().leaf_score(gs, -INFINITY, INFINITY, 0)
+        self.assertGreater(score, 0)
+
+    def test_den_threat_out_of_budget_is_not_a_mate(self):
+        gs = make_empty_state()
+        place(gs, DOG, -1, 7, 3)   # next to player 1's den
+        place(gs, CAT, 1, 2, 0)
+        place(gs, RAT, -1, 1, 0)   # the cat can take it, which saves nothing
+        place(gs, LION, 1, 6, 3)   # can take the intruder
+
+        class Exhausting(Searcher):
+            # the first defence tried uses up the rest of the budget
+            def _quiet_child_score(self, state, fr, to, alpha, beta, ply, qply):
+                self._qs_budget = 0
+                return -(WIN_SCORE - (ply + 1))
+
+        score = Exhausting().leaf_score(gs, -INFINITY, INFINITY, 0)
+        self.assertEqual(score, evaluate(gs))
+
+    def test_rejected_quiet_move_leaves_parent_ply(self):
+        gs = GameState()
+        gs.make_move(Position(6, 0), Position(5, 0))
+        score = Searcher()._quiet_child_score(gs, Position(6, 6), Position(4, 6),
+                                              -INFINITY, INFINITY, 0, 0)
+        self.assertEqual(score, -INFINITY)
+        self.assertEqual(len(gs.move_history), 1)
+        self.assertIsNotNone(gs.board.get_piece(Position(5, 0)))
+
+    def test_node_cap_and_disabled_quiescence(self):
+        gs = make_empty_state()
+        # a column of alternating pieces: captures everywhere
+        for row, animal in enumerate((DOG, CAT, RAT, ELEPHANT, LION, DOG, CAT)):
+            place(gs, animal, 1 if row % 2 else -1, row + 1, 3)
+            place(gs, animal, -1 if row % 2 else 1, row + 1, 0)
+        uncapped = Searcher(qs_max_nodes=10 ** 6)
+        uncapped.leaf_score(gs, -INFINITY, INFINITY, 0)
+        self.assertGreater(uncapped.qs_nodes, 20)
+        capped = Searcher(qs_max_nodes=20)
+        capped.leaf_score(gs, -INFINITY, INFINITY, 0)
+        self.assertLessEqual(capped.qs_nodes, 20)
+
+        gs = GameState()
+        plain = Searcher(quiescence=False)
+        self.assertEqual(plain.leaf_score(gs, -INFINITY, INFINITY, 0), evaluate(gs))
+        self.assertEqual(plain.qs_nodes, 0)
+
+
+class TestPondering(unittest.TestCase):
+    def setUp(self):
+        self.engine = Engine(depth=3)
+        self.addCleanup(self.engine.close)
+        self.state = GameState()
+        self.state.make_move(*self.engine.best_move(self.state))
+
+    def test_ponder_hit_reuses_background_search(self):
+        predicted = self.engine.start_pondering(self.state)
+        self.assertIsNotNone(predicted)
+        ponder = self.engine._ponder
+        self.state.make_move(*predicted)
+        result = self.engine.search(self.state)
+        self.assertIs(result, ponder.result)
+        self.assertEqual(result.depth, 3)
+        self.assertTrue(self.state.is_legal(*result.move))
+        self.assertFalse(self.engine.pondering)
+
+    def test_ponder_miss_searches_the_real_position(self):
+        predicted = self.engine.start_pondering(self.state)
+        ponder = self.engine._ponder
+        other = next(m for m in self.state.get_legal_moves(-1) if m != predicted)
+        self.state.make_move(*other)
+        result = self.engine.search(self.state)
+        self.assertIsNot(result, ponder.result)
+        self.assertFalse(ponder.active)
+        self.assertTrue(self.state.is_legal(*result.move))
+
+    def test_controller_pondering_stops_on_undo(self):
+        controller = GameController(GameState())
+        move = controller.make_bot_move(self.engine, ponder=True)
+        self.assertIsNotNone(move)
+        self.assertIsNotNone(self.engine._ponder)
+        self.assertTrue(controller.undo())
+        self.assertIsNone(self.engine._ponder)
+        self.assertIsNone(controller.start_pondering(object()))
+
+    def test_other_bot_or_batch_stops_pondering(self):
+        other = Engine(depth=1)
+        self.addCleanup(other.close)
+        controller = GameController(GameState())
+        controller.make_bot_move(self.engine, ponder=True)
+        ponder = self.engine._ponder
+        self.assertIsNotNone(controller.make_bot_move(other))
+        self.assertFalse(ponder.active)
+        self.assertIsNone(self.engine._ponder)
+
+        controller.make_bot_move(self.engine, ponder=True)
+        ponder = self.engine._ponder
+        pending = controller.start_bot_move(other)
+        self.assertIsNone(self.engine._ponder)
+        self.assertFalse(ponder.active)
+        self.assertTrue(pending.wait(30))
+
+        controller = GameController(GameState())
+        controller.make_bot_move(self.engine, ponder=True)
+        ponder = self.engine._ponder
+        reply = controller.game_state.get_legal_moves(-1)[0]
+        controller.apply_moves([(reply[0].row, reply[0].col, reply[1].row, reply[1].col)])
+        self.assertIsNone(self.engine._ponder)
+        self.assertFalse(ponder.active)
+
+    def test_background_bot_move_is_played_and_ponders(self):
+        controller = GameController(GameState())
+        controller.make_move(6, 0, 5, 0)
+        pending = controller.start_bot_move(self.engine)
+        self.assertTrue(pending.wait(30))
+        move = controller.finish_bot_move(pending, ponder=True)
+        self.assertEqual(move, pending.move)
+        self.assertEqual(controller.get_current_player(), 1)
+        self.assertIsNotNone(self.engine._ponder)
+        controller.stop_pondering()
+
+    def test_background_bot_move_is_dropped_after_undo(self):
+        controller = GameController(GameState())
+        controller.make_move(6, 0, 5, 0)
+        pending = controller.start_bot_move(self.engine)
+        self.assertTrue(controller.undo())
+        self.assertTrue(pending.wait(30))
+        self.assertIsNone(controller.finish_bot_move(pending))
+        self.assertEqual(len(controller.game_state.move_history), 0)
+        self.assertEqual(controller.get_current_player(), 1)
+
+
+class TestTranspositionTables(unittest.TestCase):
+    def test_position_key_depends_on_side_to_move(self):
+        gs = GameState()
+        key = position_key(gs)
+        gs.current_player = -1
+        self.assertNotEqual(position_key(gs), key)
+
+    def test_local_table_keeps_deeper_entry(self):
+        tt = TranspositionTable()
+        tt.store(42, 3, 10, EXACT, 7)
+        tt.store(42, 1, -5, LOWER, 8)
+        self.assertEqual(tt.probe(42), (3, 10, EXACT, 7))
+
+    def test_shared_table_roundtrip_between_handles(self):
+        tt = SharedTranspositionTable(1024)
+        try:
+            key = position_key(GameState())
+            tt.store(key, 4, -123, LOWER, 3000)
+            other = SharedTranspositionTable(1024, name=tt.name)
+            try:
+                self.assertEqual(other.probe(key), (4, -123, LOWER, 3000))
+                self.assertIsNone(other.probe(key ^ 1))
+            finally:
+                other.close()
+        finally:
+            tt.close()
+
+
+class TestParallelSearch(unittest.TestCase):
+    def test_workers_return_a_legal_move(self):
+        gs = GameState()
+        with Engine(depth=2, workers=2) as engine:
+            result = engine.search(gs)
+        self.assertIsNotNone(result.move)
+        self.assertTrue(gs.is_legal(*result.move))
+        self.assertGreaterEqual(result.depth, 2)
+
+    def test_dead_helper_is_skipped(self):
+        ctx = multiprocessing.get_context()
+        results = ctx.Queue()
+        helpers = [ctx.Process(target=_post_result, args=(results, 1)),
+                   ctx.Process(target=os._exit, args=(1,))]
+        for proc in helpers:
+            proc.start()
+        collected = list(_helper_results(results, helpers, poll=0.05))
+        for proc in helpers:
+            proc.join()
+        self.assertEqual([item[0] for item in collected], [1])
+
+    def test_rejects_zero_workers(self):
+        with self.assertRaises(ValueError):
+            Engine(workers=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
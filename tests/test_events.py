@@ -0,0 +1,65 @@
+import unittest
+
+from jungle_game.controller.game_controller import GameController
+from jungle_game.model.game_state import GameState
+from jungle_game.model.position import Position
+from jungle_game.model.piece import Piece
+from jungle_game.model.animal_type import RAT
+from jungle_game.model import events
+
+
+def make_capture_state():
+    """P1 rat at (6,0) can take the only P2 piece, a rat at (5,0)."""
+    gs = GameState()
+    for r in range(9):
+        for c in range(7):
+            gs.board.pieces[r][c] = None
+    gs.board.pieces[6][0] = Piece(RAT, 1, Position(6, 0))
+    gs.board.pieces[5][0] = Piece(RAT, -1, Position(5, 0))
+    return gs
+
+
+class TestGameEvents(unittest.TestCase):
+    def test_capture_emits_move_capture_and_game_over(self):
+        gs = make_capture_state()
+        received = []
+        gs.add_listener(received.append)
+
+        self.assertTrue(gs.make_move(Position(6, 0), Position(5, 0)))
+        self.assertEqual([e.kind for e in received],
+                         [events.MOVE_MADE, events.PIECE_CAPTURED, events.GAME_OVER])
+        move, capture, over = received
+        self.assertEqual(move.squares, (6 * 7, 5 * 7))
+        self.assertEqual(move.player, 1)
+        self.assertEqual(capture.squares, (5 * 7,))
+        self.assertEqual(capture.captured, RAT.rank + 8)
+        self.assertEqual(over.player, 1)
+
+        received.clear()
+        gs.undo_last_move()
+        self.assertEqual(received, [events.GameEvent(events.UNDO, (42, 35), 1, RAT.rank + 8)])
+
+    def test_illegal_move_and_removed_listener_emit_nothing(self):
+        gs = GameState()
+        received = []
+        gs.add_listener(received.append)
+        self.assertFalse(gs.make_move(Position(6, 0), Position(4, 0)))
+        gs.remove_listener(received.append)
+        gs.make_move(Position(6, 0), Position(5, 0))
+        self.assertEqual(received, [])
+
+    def test_controller_listeners_survive_reset_and_load(self):
+        ctrl = GameController.new_game()
+        received = []
+        ctrl.add_listener(received.append)
+
+        ctrl.make_move(6, 0, 5, 0)
+        ctrl.reset_game()
+        ctrl.make_move(6, 0, 5, 0)
+
+        self.assertEqual([e.kind for e in received],
+                         [events.MOVE_MADE, events.STATE_LOADED, events.MOVE_MADE])
+
+
+if __name__ == "__main__":
+    unittest.main()
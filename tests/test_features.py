@@ -0,0 +1,140 @@
+import importlib.util
+import os
+import random
+import tempfile
+import unittest
+
+from jungle_game.model.game_state import GameState
+from jungle_game.model.encoding import square_of
+from jungle_game.model.rules import NO_WATER_CAPTURE
+from jungle_game.engine import features
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+def random_game(seed, plies=60):
+    rng = random.Random(seed)
+    gs = GameState()
+    for _ in range(plies):
+        if gs.is_game_over():
+            break
+        moves = gs.get_legal_moves(gs.get_current_player())
+        if not moves:
+            break
+        gs.make_move(*rng.choice(moves))
+    return gs
+
+
+class TestPolicyIndex(unittest.TestCase):
+    def test_legal_moves_round_trip(self):
+        rng = random.Random(2)
+        gs = GameState()
+        for _ in range(100):
+            if gs.is_game_over():
+                break
+            moves = gs.get_legal_moves(gs.get_current_player())
+            indices = set()
+            for from_pos, to_pos in moves:
+                move = (square_of(from_pos), square_of(to_pos))
+                index = features.move_index(*move)
+                self.assertTrue(0 <= index < features.POLICY_SIZE)
+                self.assertEqual(features.index_move(index), move)
+                indices.add(index)
+            # get_legal_moves may list a lion/tiger step twice
+            self.assertEqual(len(indices), len(set(moves)))
+            if not moves:
+                break
+            gs.make_move(*rng.choice(moves))
+
+    def test_jump_slots(self):
+        # lion on (6,1) jumping north over the river lands on (2,1)
+        index = features.move_index(6 * 7 + 1, 2 * 7 + 1)
+        self.assertEqual(index, (6 * 7 + 1) * 8 + 1 * 2 + 1)
+        with self.assertRaises(ValueError):
+            features.move_index(0, 20)
+        with self.assertRaises(ValueError):
+            features.index_move(1)   # no river jump from square 0
+
+
+class TestRecordSamples(unittest.TestCase):
+    def test_samples_follow_saved_record(self):
+        gs = random_game(5)
+        gs.undo_last_move()
+        filename = os.path.join(tempfile.mkdtemp(), "game.record")
+        gs.save_record(filename)
+        samples, winner = features.record_samples(filename)
+        self.assertEqual(len(samples), len(gs.move_history))
+        first_codes, side, undo_p1, undo_p2, index = samples[0]
+        self.assertEqual(list(first_codes), features.state_codes(GameState()))
+        self.assertEqual((side, undo_p1, undo_p2), (1, 0, 0))
+
+    def test_undo_marker_drops_sample(self):
+        filename = os.path.join(tempfile.mkdtemp(), "game.record")
+        with open(filename, "w") as f:
+            f.write("row_from column_from row_to column_to Captured_piece Player_move\n")
+            f.write("6 0 5 0 0 1\n2 0 3 0 0 2\nundo\n2 6 3 6 0 2\n")
+        samples, winner = features.record_samples(filename)
+        self.assertEqual(len(samples), 2)
+        self.assertEqual(samples[1][1:4], (-1, 0, 1))
+        self.assertEqual(winner, 0)
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy not installed")
+class TestTensorExport(unittest.TestCase):
+    def test_encode_state_planes(self):
+        import numpy as np
+        gs = random_game(9, plies=20)
+        planes = features.encode_state(gs)
+        self.assertEqual(planes.shape, (features.NUM_PLANES, 9, 7))
+        codes = features.state_codes(gs)
+        occupied = planes[:features.OCCUPANCY_PLANES].reshape(16, 63)
+        for sq, code in enumerate(codes):
+            self.assertEqual(occupied[:, sq].sum(), 0 if code == 0 else 1)
+            if code:
+                self.assertEqual(occupied[code - 1, sq], 1)
+        self.assertTrue(np.all(planes[features.OCCUPANCY_PLANES:features.SIDE_PLANE].sum(axis=0) == 1))
+        self.assertEqual(planes[features.SIDE_PLANE, 0, 0], 1 if gs.current_player == 1 else 0)
+
+    def test_encode_state_rejects_other_rulesets(self):
+        with self.assertRaises(ValueError):
+            features.encode_state(GameState(NO_WATER_CAPTURE))
+
+    def test_export_matches_per_position_encoding(self):
+        import numpy as np
+        directory = tempfile.mkdtemp()
+        names = []
+        for seed in range(3):
+            name = os.path.join(directory, f"g{seed}.record")
+            random_game(seed).save_record(name)
+            names.append(name)
+        prefix = os.path.join(directory, "data")
+
+        parsed = []
+        record_samples = features.record_samples
+
+        def counting_record_samples(name):
+            parsed.append(name)
+            return record_samples(name)
+
+        features.record_samples = counting_record_samples
+        self.addCleanup(setattr, features, "record_samples", record_samples)
+        count = features.export_records(names, prefix, chunk=16)
+        self.assertEqual(parsed, names)   # one pass over the records
+        features.record_samples = record_samples
+
+        planes = np.load(prefix + "_planes.npy", mmap_mode="r")
+        policy = np.load(prefix + "_policy.npy")
+        value = np.load(prefix + "_value.npy")
+        self.assertEqual(planes.shape[0], count)
+        self.assertEqual(value.shape, (count,))
+        self.assertTrue(set(value.tolist()) <= {-1, 0, 1})
+        expected = [s for name in names for s in features.record_samples(name)[0]]
+        self.assertEqual(len(expected), count)
+        for i, (codes, side, undo_p1, undo_p2, index) in enumerate(expected):
+            single = features.encode_batch([list(codes)], [side], [(undo_p1, undo_p2)])[0]
+            self.assertTrue(np.array_equal(planes[i], single))
+            self.assertEqual(policy[i], index)
+
+
+if __name__ == "__main__":
+    unittest.main()
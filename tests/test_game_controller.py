@@ -1,4 +1,6 @@
+import importlib.util
 import unittest
+from array import array
 
 from jungle_game.controller.game_controller import GameController
 from jungle_game.model.game_state import GameState
@@ -6,6 +8,8 @@ from jungle_game.model.position import Position
 from jungle_game.model.piece import Piece
 from jungle_game.model.animal_type import RAT
 
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
 
 def make_empty_controller():
     """
@@ -109,6 +113,13 @@ class TestGameController(unittest.TestCase):
 
         self.assertIs(ctrl.game_state.board.pieces[4][5], rat)
 
+    def test_is_legal_move_does_not_change_state(self):
+        ctrl = GameController.new_game()
+        self.assertTrue(ctrl.is_legal_move(6, 0, 5, 0))
+        self.assertFalse(ctrl.is_legal_move(6, 0, 4, 0))
+        self.assertEqual(ctrl.get_current_player(), 1)
+        self.assertIsNotNone(ctrl.get_piece_at(6, 0))
+
     # --------------------------------------------------------
     # undo
     # --------------------------------------------------------
@@ -185,6 +196,49 @@ class TestGameController(unittest.TestCase):
         finally:
             os.remove(name)
 
+    # --------------------------------------------------------
+    # apply_moves (batch)
+    # --------------------------------------------------------
+    def test_apply_moves_applies_all_legal_moves(self):
+        ctrl = GameController.new_game()
+        moves = [(6, 0, 5, 0), (2, 6, 3, 6), (5, 0, 4, 0)]
+        self.assertEqual(ctrl.apply_moves(moves), (3, None))
+        self.assertEqual(len(ctrl.game_state.move_history), 3)
+        self.assertIsNotNone(ctrl.get_piece_at(4, 0))
+
+    def test_apply_moves_stops_at_first_illegal_move(self):
+        ctrl = GameController.new_game()
+        moves = iter([(6, 0, 5, 0), (6, 0, 5, 0), (2, 6, 3, 6)])
+        self.assertEqual(ctrl.apply_moves(moves), (1, 1))
+        self.assertEqual(ctrl.get_current_player(), -1)
+
+    def test_apply_moves_can_skip_illegal_moves(self):
+        ctrl = GameController.new_game()
+        moves = [(6, 0, 5, 0), (9, 9, 9, 9), (2, 6, 3, 6)]
+        self.assertEqual(ctrl.apply_moves(moves, stop_on_illegal=False), (2, 1))
+
+    def test_apply_moves_accepts_packed_squares(self):
+        ctrl = GameController.new_game()
+        packed = bytes([6 * 7 + 0, 5 * 7 + 0, 2 * 7 + 6, 3 * 7 + 6])
+        self.assertEqual(ctrl.apply_moves(packed), (2, None))
+        ctrl = GameController.new_game()
+        self.assertEqual(ctrl.apply_moves(array("B", packed)), (2, None))
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy not installed")
+    def test_apply_moves_reads_numpy_rows_as_tuples(self):
+        import numpy as np
+        ctrl = GameController.new_game()
+        moves = np.array([(6, 0, 5, 0), (2, 6, 3, 6)], dtype=np.int64)
+        self.assertEqual(ctrl.apply_moves(moves), (2, None))
+        self.assertIsNotNone(ctrl.get_piece_at(5, 0))
+
+    def test_apply_moves_notifies_listeners_once(self):
+        ctrl = GameController.new_game()
+        received = []
+        ctrl.add_listener(received.append)
+        ctrl.apply_moves([(6, 0, 5, 0), (2, 6, 3, 6)])
+        self.assertEqual([e.kind for e in received], ["state_loaded"])
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -349,6 +349,48 @@ class TestGameState(unittest.TestCase):
 
         self.assertIn((3, 0, 3, 3), as_tuples)
 
+    def test_legal_move_cache_validates_and_is_dropped_after_move(self):
+        gs = GameState()
+        moves = gs.get_legal_moves(1)
+        self.assertIn(1, gs._legal_cache)
+
+        # same answer from the cache
+        self.assertEqual(len(gs.get_legal_moves(1)), len(moves))
+        self.assertTrue(gs.is_legal(Position(6, 0), Position(5, 0)))
+        self.assertFalse(gs.is_legal(Position(6, 0), Position(4, 0)))
+        self.assertFalse(gs.is_legal(Position(6, 6), Position(6, 7)))
+
+        # illegal move rejected through the cached set
+        self.assertFalse(gs.make_move(Position(6, 0), Position(4, 0)))
+        self.assertTrue(gs.make_move(Position(6, 0), Position(5, 0)))
+        self.assertEqual(gs._legal_cache, {})
+
+        gs.get_legal_moves(-1)
+        self.assertTrue(gs.undo_last_move())
+        self.assertEqual(gs._legal_cache, {})
+
+    def test_invalidate_legal_moves_after_direct_board_edit(self):
+        gs = make_empty_state()
+        gs.board.pieces[4][3] = Piece(RAT, 1, Position(4, 3))
+        gs.board.pieces[0][0] = Piece(RAT, -1, Position(0, 0))
+        self.assertEqual(len(gs.get_legal_moves(1)), 4)
+
+        gs.board.pieces[7][0] = Piece(LION, 1, Position(7, 0))
+        gs.invalidate_legal_moves()
+        self.assertTrue(gs.is_legal(Position(7, 0), Position(6, 0)))
+
+    def test_direct_board_edit_is_noticed_without_invalidating(self):
+        gs = make_empty_state()
+        gs.board.pieces[4][3] = Piece(RAT, 1, Position(4, 3))
+        gs.board.pieces[0][0] = Piece(RAT, -1, Position(0, 0))
+        gs.get_legal_moves(1)
+
+        # a new piece's moves are accepted, a blocked square refused
+        gs.board.pieces[7][0] = Piece(LION, 1, Position(7, 0))
+        gs.board.pieces[5][3] = Piece(LION, 1, Position(5, 3))
+        self.assertFalse(gs.make_move(Position(4, 3), Position(5, 3)))
+        self.assertTrue(gs.make_move(Position(7, 0), Position(6, 0)))
+
     # ------------------------------------------------------------------
     # Serialization: to_dict / from_dict
     # ------------------------------------------------------------------
@@ -401,6 +443,49 @@ class TestGameState(unittest.TestCase):
                     self.assertEqual(p2.position.row, r)
                     self.assertEqual(p2.position.col, c)
 
+    # ------------------------------------------------------------------
+    # Compact encoding: to_bytes / from_bytes / pickle
+    # ------------------------------------------------------------------
+    def test_to_bytes_roundtrip_keeps_board_meta_and_history(self):
+        gs, rat_pos, enemy_pos = make_simple_state()
+        gs.board.pieces[0][0] = Piece(LION, -1, Position(0, 0))
+        gs.undo_used[-1] = 2
+        self.assertTrue(gs.make_move(rat_pos, enemy_pos))
+
+        data = gs.to_bytes()
+        gs2 = GameState.from_bytes(data)
+
+        self.assertEqual(gs2.to_bytes(), data)
+        self.assertEqual(gs2.current_player, -1)
+        self.assertEqual(gs2.undo_used, {1: 0, -1: 2})
+        self.assertEqual(gs2.board.pieces[5][0].animal_type.name, "Rat")
+        self.assertEqual(gs2.board.pieces[5][0].player, 1)
+        self.assertIsNone(gs2.board.pieces[6][0])
+
+        # captured piece comes back on undo
+        self.assertTrue(gs2.undo_last_move())
+        restored = gs2.board.pieces[5][0]
+        self.assertEqual(restored.player, -1)
+        self.assertTrue(restored.alive)
+        self.assertEqual(gs2.board.pieces[6][0].player, 1)
+
+    def test_to_bytes_is_compact_for_start_position(self):
+        gs = GameState()
+        # 16 pieces * 2 bytes plus a small header
+        self.assertLess(len(gs.to_bytes()), 48)
+
+    def test_pickle_uses_compact_encoding(self):
+        import pickle
+
+        gs, rat_pos, enemy_pos = make_simple_state()
+        gs.make_move(rat_pos, enemy_pos)
+
+        gs2 = pickle.loads(pickle.dumps(gs))
+        self.assertIsInstance(gs2, GameState)
+        self.assertEqual(gs2.to_bytes(), gs.to_bytes())
+        self.assertTrue(gs2.game_over)
+        self.assertEqual(gs2.winner, 1)
+
     # ------------------------------------------------------------------
     # File I/O: save_record + replay_history
     # ------------------------------------------------------------------
@@ -0,0 +1,43 @@
+import unittest
+
+from jungle_game.model.board import Board
+from jungle_game.model.game_state import GameState
+from jungle_game.model.position import Position
+from jungle_game.model import instrumentation
+
+
+class TestInstrumentation(unittest.TestCase):
+    def test_disabled_by_default_leaves_methods_untouched(self):
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertFalse(hasattr(GameState.make_move, "__wrapped__"))
+        self.assertFalse(hasattr(Board.is_legal_move, "__wrapped__"))
+
+    def test_context_manager_counts_calls_and_restores(self):
+        original = GameState.make_move
+
+        with instrumentation.instrumented() as stats:
+            gs = GameState()
+            gs.get_legal_moves(1)
+            self.assertTrue(gs.make_move(Position(6, 0), Position(5, 0)))
+            gs.undo_last_move()
+
+        self.assertIs(GameState.make_move, original)
+        self.assertEqual(stats["GameState.make_move"].calls, 1)
+        self.assertEqual(stats["GameState.get_legal_moves"].calls, 1)
+        self.assertEqual(stats["GameState.undo_last_move"].calls, 1)
+        self.assertGreater(stats["Board.is_legal_move"].calls, 1)
+
+        legal = stats["Board.is_legal_move"]
+        self.assertEqual(sum(legal.histogram.values()), legal.calls)
+        self.assertGreater(legal.total_ns, 0)
+
+    def test_report_lists_every_target(self):
+        with instrumentation.instrumented():
+            GameState().get_legal_moves(1)
+        text = instrumentation.report()
+        for cls, attr in instrumentation.TARGETS:
+            self.assertIn(f"{cls.__name__}.{attr}", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
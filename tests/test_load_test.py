@@ -0,0 +1,63 @@
+import os
+import tempfile
+import unittest
+
+from benchmarks.load_test import (
+    OPERATIONS, GameServer, SocketClient, over_budget, percentile, run
+)
+from jungle_game.controller.game_controller import GameController
+
+
+class TestLoadTest(unittest.TestCase):
+    def test_percentile(self):
+        values = [i / 100 for i in range(101)]
+        self.assertEqual(percentile(values, 50), 0.5)
+        self.assertEqual(percentile(values, 99), 0.99)
+        self.assertEqual(percentile([], 50), 0.0)
+
+    def test_local_run_reports_every_operation(self):
+        result = run(clients=12, actions=20, workers=3, undo_rate=0.2, save_rate=0.2,
+                     memory_sample=4)
+        self.assertEqual(result["sessions"], 12)
+        for op in OPERATIONS:
+            self.assertGreater(result["operations"][op]["count"], 0, op)
+        self.assertGreater(result["throughput_ops_s"], 0)
+        self.assertGreater(result["memory_per_session_bytes"], 0)
+
+    def test_scripted_sessions_replay_the_script(self):
+        script = [(6, 0, 5, 0), (2, 0, 3, 0), (5, 0, 4, 0)]
+        result = run(clients=4, actions=3, workers=2, script=script,
+                     save_rate=0.0, memory_sample=0)
+        self.assertEqual(result["operations"]["make_move"]["count"], 12)
+        self.assertEqual(result["operations"]["undo"]["count"], 0)
+
+    def test_socket_client_matches_controller(self):
+        server = GameServer().start()
+        self.addCleanup(server.stop)
+        client = SocketClient(server.server_address)
+        self.addCleanup(client.close)
+        local = GameController()
+        state = local.game_state
+        self.assertEqual(
+            sorted(client.legal_moves()),
+            sorted((a.row, a.col, b.row, b.col)
+                   for a, b in state.get_legal_moves(state.current_player))
+        )
+        self.assertTrue(client.make_move(6, 0, 5, 0))
+        self.assertFalse(client.make_move(6, 0, 5, 0))
+        self.assertTrue(client.undo())
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "game.jungle")
+            self.assertTrue(client.save_game(filename))
+            self.assertTrue(client.load_game(filename))
+        with self.assertRaises(RuntimeError):
+            client.load_game(os.path.join(tmp, "missing.jungle"))
+
+    def test_budget_gate(self):
+        result = {"operations": {op: {"p99_ms": 2.0} for op in OPERATIONS}}
+        self.assertEqual(over_budget(result, {"make_move": 5.0}), [])
+        self.assertEqual(over_budget(result, {"undo": 1.0}), [("undo", 2.0, 1.0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+
+from jungle_game.model.move_history import MoveHistory
+from jungle_game.model.position import Position
+from jungle_game.model.piece import Piece
+from jungle_game.model.animal_type import RAT, CAT
+
+
+class TestMoveHistory(unittest.TestCase):
+    def make_history(self):
+        self.cat = Piece(CAT, -1, Position(5, 3))
+        self.rat = Piece(RAT, 1, Position(2, 2))
+        return MoveHistory([
+            (Position(6, 3), Position(5, 3), self.cat, 1),
+            (Position(2, 0), Position(3, 0), None, -1),
+            (Position(2, 1), Position(2, 2), self.rat, -1),
+        ])
+
+    def test_packs_four_bytes_per_ply(self):
+        history = self.make_history()
+        self.assertEqual(len(history), 3)
+        self.assertEqual(len(history.to_bytes()), 12)
+        self.assertEqual(history.last_player(), -1)
+
+    def test_indexing_returns_positions_and_captured_pieces(self):
+        history = self.make_history()
+        self.assertEqual(history[0], (Position(6, 3), Position(5, 3), self.cat, 1))
+        self.assertEqual(history[1], (Position(2, 0), Position(3, 0), None, -1))
+        self.assertIs(history[-1][2], self.rat)
+        self.assertEqual(list(history), [history[0], history[1], history[2]])
+        with self.assertRaises(IndexError):
+            history[3]
+
+    def test_pop_returns_same_captured_object(self):
+        history = self.make_history()
+        from_pos, to_pos, captured, player = history.pop()
+        self.assertEqual((from_pos, to_pos, player), (Position(2, 1), Position(2, 2), -1))
+        self.assertIs(captured, self.rat)
+        history.pop()
+        self.assertIs(history.pop()[2], self.cat)
+        self.assertFalse(history)
+        with self.assertRaises(IndexError):
+            history.pop()
+
+    def test_from_bytes_rebuilds_captured_pieces(self):
+        copy = MoveHistory.from_bytes(self.make_history().to_bytes())
+        captured = copy[0][2]
+        self.assertEqual(captured.animal_type.name, "Cat")
+        self.assertEqual(captured.player, -1)
+        self.assertEqual(captured.position, Position(5, 3))
+        self.assertFalse(captured.alive)
+        with self.assertRaises(ValueError):
+            MoveHistory.from_bytes(b"\x01\x02\x03")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import random
+import unittest
+
+from jungle_game.model.game_state import GameState
+from jungle_game.model.position import Position
+from jungle_game.model.piece import Piece
+from jungle_game.model.animal_type import RAT, CAT, DOG, LION, ELEPHANT
+from jungle_game.model import movegen
+
+
+def make_empty_state():
+    gs = GameState()
+    for r in range(9):
+        for c in range(7):
+            gs.board.pieces[r][c] = None
+    return gs
+
+
+def place(gs, animal, player, r, c):
+    gs.board.pieces[r][c] = Piece(animal, player, Position(r, c))
+
+
+def as_tuples(moves):
+    return [(f.row, f.col, t.row, t.col) for f, t in moves]
+
+
+class TestMoveGen(unittest.TestCase):
+    def test_same_moves_as_get_legal_moves_in_random_games(self):
+        rng = random.Random(7)
+        for _ in range(5):
+            gs = GameState()
+            for _ in range(80):
+                if gs.is_game_over():
+                    break
+                player = gs.get_current_player()
+                expected = set(as_tuples(gs.get_legal_moves(player)))
+                staged = as_tuples(movegen.iter_moves(gs))
+                self.assertEqual(len(staged), len(set(staged)))
+                self.assertEqual(set(staged), expected)
+                gs.make_move(*rng.choice(gs.get_legal_moves(player)))
+
+    def test_captures_come_first_most_valuable_victim_first(self):
+        gs = make_empty_state()
+        # P1 dog can take P2 cat or P2 rat; P1 rat can take P2 elephant
+        place(gs, DOG, 1, 6, 3)
+        place(gs, CAT, -1, 5, 3)
+        place(gs, RAT, -1, 6, 2)
+        place(gs, RAT, 1, 2, 0)
+        place(gs, ELEPHANT, -1, 1, 0)
+
+        moves = as_tuples(movegen.iter_moves(gs))
+        self.assertEqual(moves[:3], [(2, 0, 1, 0), (6, 3, 5, 3), (6, 3, 6, 2)])
+
+        captures = as_tuples(movegen.iter_moves(gs, movegen.CAPTURES))
+        self.assertEqual(captures, moves[:3])
+
+    def test_elephant_never_generates_rat_capture(self):
+        gs = make_empty_state()
+        place(gs, ELEPHANT, 1, 6, 0)
+        place(gs, RAT, -1, 5, 0)
+        self.assertEqual(list(movegen.iter_moves(gs, movegen.CAPTURES)), [])
+
+    def test_den_entry_stage(self):
+        gs = make_empty_state()
+        place(gs, CAT, 1, 0, 2)
+        place(gs, RAT, -1, 8, 0)
+        # (0,2) is a trap next to the P2 den at (0,3)
+        self.assertEqual(as_tuples(movegen.iter_moves(gs, movegen.DEN_ENTRIES)), [(0, 2, 0, 3)])
+
+    def test_generation_is_lazy(self):
+        gs = GameState()
+        gen = movegen.iter_moves(gs)
+        first = next(gen)
+        self.assertEqual(len(first), 2)
+        gen.close()
+
+    def test_lion_jump_is_generated(self):
+        gs = make_empty_state()
+        place(gs, LION, 1, 3, 0)
+        self.assertIn((3, 0, 3, 3), as_tuples(movegen.iter_moves(gs)))
+
+
+if __name__ == "__main__":
+    unittest.main()
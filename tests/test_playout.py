@@ -0,0 +1,75 @@
+import random
+import unittest
+
+from jungle_game.model.game_state import GameState
+from jungle_game.model.piece import Piece
+from jungle_game.model.position import Position
+from jungle_game.model.animal_type import ELEPHANT, CAT, RAT
+from jungle_game.model.encoding import square_of
+from jungle_game.engine import playout
+
+
+class TestPlayout(unittest.TestCase):
+    def test_move_generation_matches_game_state(self):
+        rng = random.Random(3)
+        for _ in range(4):
+            gs = GameState()
+            for _ in range(120):
+                if gs.is_game_over():
+                    break
+                player = gs.get_current_player()
+                legal = gs.get_legal_moves(player)
+                expected = {(square_of(f), square_of(t)) for f, t in legal}
+                moves, captures = playout.generate_moves(playout.flat_board(gs), player)
+                self.assertEqual(set(moves), expected)
+                board = playout.flat_board(gs)
+                for _, to_sq in captures:
+                    self.assertNotEqual(board[to_sq], 0)
+                if not legal:
+                    break
+                gs.make_move(*rng.choice(legal))
+
+    def test_trap_captures_match_board(self):
+        # each side's traps: (trap, square next to it the attacker comes from)
+        cases = [((7, 3), (6, 3)), ((8, 2), (8, 1)), ((1, 3), (2, 3)), ((0, 4), (0, 5))]
+        for (tr, tc), (ar, ac) in cases:
+            for defender_player in (1, -1):
+                for attacker, defender in ((CAT, ELEPHANT), (RAT, CAT), (ELEPHANT, CAT)):
+                    gs = GameState()
+                    for r in range(9):
+                        for c in range(7):
+                            gs.board.pieces[r][c] = None
+                    gs.board.pieces[tr][tc] = Piece(defender, defender_player, Position(tr, tc))
+                    gs.board.pieces[ar][ac] = Piece(attacker, -defender_player, Position(ar, ac))
+                    piece = gs.board.pieces[ar][ac]
+                    expected = gs.board.is_legal_move(piece, Position(tr, tc), -defender_player)
+                    moves, captures = playout.generate_moves(
+                        playout.flat_board(gs), -defender_player
+                    )
+                    move = (ar * 7 + ac, tr * 7 + tc)
+                    self.assertEqual(move in captures, expected,
+                                     (attacker.name, defender.name, defender_player, tr, tc))
+                    self.assertEqual(move in moves, expected)
+
+    def test_seeded_playouts_are_reproducible(self):
+        gs = GameState()
+        first = playout.playout_from_state(gs, seed=99)
+        second = playout.playout_from_state(gs, seed=99)
+        self.assertEqual(first, second)
+        winner, plies = first
+        self.assertIn(winner, (1, -1, None))
+        self.assertLessEqual(plies, 400)
+
+    def test_ply_cap(self):
+        winner, plies = playout.playout_from_state(GameState(), seed=1, max_plies=3)
+        self.assertLessEqual(plies, 3)
+
+    def test_playout_does_not_touch_state(self):
+        gs = GameState()
+        before = gs.to_bytes()
+        playout.playout_from_state(gs, seed=5, capture_bias=0.8)
+        self.assertEqual(gs.to_bytes(), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
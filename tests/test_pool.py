@@ -0,0 +1,92 @@
+import multiprocessing
+import unittest
+
+from jungle_game.controller.game_controller import GameController
+from jungle_game.model.game_state import GameState
+from jungle_game.model.position import Position
+from jungle_game.model.pool import GamePool, PoolFull
+from jungle_game.model.rules import OPEN_TRAPS
+
+
+def _play_in_worker(pool, index, move):
+    with pool.checkout(index) as state:
+        GameController(state).make_move(*move)
+    pool.close()
+
+
+class TestGamePool(unittest.TestCase):
+    def setUp(self):
+        self.pool = GamePool(num_slots=8, slot_size=512, lock_stripes=4)
+        self.addCleanup(self.pool.close)
+
+    def test_add_read_remove(self):
+        state = GameState(OPEN_TRAPS)
+        state.make_move(Position(6, 0), Position(5, 0))
+        index = self.pool.add(state)
+        self.assertEqual(len(self.pool), 1)
+        copy = self.pool.read(index)
+        self.assertEqual(copy.to_bytes(), state.to_bytes())
+        self.assertIs(copy.board.ruleset, OPEN_TRAPS)
+        self.pool.remove(index)
+        self.assertTrue(self.pool.is_free(index))
+        with self.assertRaises(KeyError):
+            self.pool.read(index)
+
+    def test_checkout_writes_back(self):
+        index = self.pool.add(GameState())
+        with self.pool.checkout(index) as state:
+            controller = GameController(state)
+            self.assertTrue(controller.make_move(6, 0, 5, 0))
+        stored = self.pool.read(index)
+        self.assertIsNotNone(stored.board.get_piece(Position(5, 0)))
+        self.assertEqual(stored.current_player, -1)
+
+    def test_failed_checkout_discards_changes(self):
+        index = self.pool.add(GameState())
+        with self.assertRaises(RuntimeError):
+            with self.pool.checkout(index) as state:
+                state.make_move(Position(6, 0), Position(5, 0))
+                raise RuntimeError("worker crashed")
+        self.assertEqual(len(self.pool.read(index).move_history), 0)
+
+    def test_full_pool_and_oversized_game(self):
+        for _ in range(8):
+            self.pool.add(GameState())
+        with self.assertRaises(PoolFull):
+            self.pool.add(GameState())
+        small = GamePool(num_slots=1, slot_size=16)
+        self.addCleanup(small.close)
+        with self.assertRaises(ValueError):
+            small.add(GameState())
+
+    def test_worker_process_moves_pooled_game(self):
+        indices = [self.pool.add(GameState()) for _ in range(2)]
+        moves = [(6, 0, 5, 0), (6, 6, 5, 6)]
+        workers = [
+            multiprocessing.Process(target=_play_in_worker, args=(self.pool, index, move))
+            for index, move in zip(indices, moves)
+        ]
+        for proc in workers:
+            proc.start()
+        for proc in workers:
+            proc.join(30)
+            self.assertEqual(proc.exitcode, 0)
+        for index, (r1, c1, r2, c2) in zip(indices, moves):
+            state = self.pool.read(index)
+            self.assertIsNone(state.board.get_piece(Position(r1, c1)))
+            self.assertIsNotNone(state.board.get_piece(Position(r2, c2)))
+
+    def test_pool_pickles_to_spawned_worker(self):
+        ctx = multiprocessing.get_context("spawn")
+        pool = GamePool(num_slots=2, slot_size=256, mp_context=ctx)
+        self.addCleanup(pool.close)
+        index = pool.add(GameState())
+        proc = ctx.Process(target=_play_in_worker, args=(pool, index, (6, 0, 5, 0)))
+        proc.start()
+        proc.join(60)
+        self.assertEqual(proc.exitcode, 0)
+        self.assertEqual(len(pool.read(index).move_history), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import os
+import tempfile
+import time
+import unittest
+
+from jungle_game.controller.game_controller import GameController
+from jungle_game.model.game_state import GameState
+from jungle_game.model.position import Position
+from jungle_game.model.recorder import RecordWriter, RECORD_HEADER
+
+
+def read_lines(filename):
+    with open(filename) as f:
+        return [line.strip() for line in f]
+
+
+class TestRecordWriter(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp.name, "live.record")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_moves_and_undo_are_appended(self):
+        gs = GameState()
+        with RecordWriter(self.filename, flush_every=1) as recorder:
+            gs.attach_recorder(recorder)
+            gs.make_move(Position(6, 0), Position(5, 0))
+            gs.make_move(Position(2, 6), Position(3, 6))
+            self.assertFalse(gs.make_move(Position(0, 0), Position(0, 1)))  # not P1's piece
+            gs.undo_last_move()
+
+            # flushed line by line, visible before close
+            self.assertEqual(read_lines(self.filename), [
+                RECORD_HEADER.strip(), "6 0 5 0 0 1", "2 6 3 6 0 2", "undo"
+            ])
+
+        self.assertEqual(GameState.replay_history(self.filename), [(6, 0, 5, 0)])
+
+    def test_replay_matches_full_rewrite(self):
+        gs = GameState()
+        gs.make_move(Position(6, 0), Position(5, 0))   # played before attaching
+        with RecordWriter(self.filename) as recorder:
+            gs.attach_recorder(recorder)
+            gs.make_move(Position(2, 6), Position(3, 6))
+            gs.make_move(Position(5, 0), Position(4, 0))
+            gs.undo_last_move()
+            gs.make_move(Position(5, 0), Position(5, 1))
+
+        full = os.path.join(self.tmp.name, "full.record")
+        gs.save_record(full)
+        self.assertEqual(
+            GameState.replay_history(self.filename),
+            GameState.replay_history(full)
+        )
+
+    def test_attaching_twice_to_same_file_starts_over(self):
+        gs = GameState()
+        gs.make_move(Position(6, 0), Position(5, 0))
+        for _ in range(2):
+            with RecordWriter(self.filename) as recorder:
+                gs.attach_recorder(recorder)
+                gs.make_move(*gs.get_legal_moves(gs.current_player)[0])
+                gs.detach_recorder()
+
+        lines = read_lines(self.filename)
+        self.assertEqual(lines.count(RECORD_HEADER.strip()), 1)
+        full = os.path.join(self.tmp.name, "full.record")
+        gs.save_record(full)
+        self.assertEqual(GameState.replay_history(self.filename),
+                         GameState.replay_history(full))
+
+    def test_resume_appends_without_rewriting_history(self):
+        ctrl = GameController.new_game()
+        ctrl.start_recording(self.filename)
+        ctrl.make_move(6, 0, 5, 0)
+        ctrl.stop_recording()
+        ctrl.start_recording(self.filename, resume=True)
+        ctrl.make_move(2, 6, 3, 6)
+        ctrl.stop_recording()
+        self.assertEqual(read_lines(self.filename),
+                         [RECORD_HEADER.strip(), "6 0 5 0 0 1", "2 6 3 6 0 2"])
+
+    def test_buffered_until_flush_every(self):
+        gs = GameState()
+        recorder = RecordWriter(self.filename, flush_every=3)
+        gs.attach_recorder(recorder)
+        gs.make_move(Position(6, 0), Position(5, 0))
+        self.assertEqual(os.path.getsize(self.filename), 0)
+        gs.make_move(Position(2, 6), Position(3, 6))
+        gs.make_move(Position(5, 0), Position(4, 0))
+        self.assertEqual(len(read_lines(self.filename)), 4)
+        recorder.close()
+
+    def test_every_move_reaches_the_file_by_default(self):
+        gs = GameState()
+        recorder = RecordWriter(self.filename)
+        gs.attach_recorder(recorder)
+        gs.make_move(Position(6, 0), Position(5, 0))
+        self.assertEqual(read_lines(self.filename), [RECORD_HEADER.strip(), "6 0 5 0 0 1"])
+        recorder.close()
+
+    def test_flush_interval_flushes_an_idle_game(self):
+        gs = GameState()
+        recorder = RecordWriter(self.filename, flush_every=100, flush_interval=0.05)
+        gs.attach_recorder(recorder)
+        gs.make_move(Position(6, 0), Position(5, 0))
+        self.assertEqual(os.path.getsize(self.filename), 0)
+        deadline = time.monotonic() + 5
+        while os.path.getsize(self.filename) == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(read_lines(self.filename)[1:], ["6 0 5 0 0 1"])
+        recorder.close()
+
+    def test_controller_start_and_stop_recording(self):
+        ctrl = GameController.new_game()
+        ctrl.start_recording(self.filename)
+        ctrl.make_move(6, 0, 5, 0)
+        ctrl.undo()
+        ctrl.stop_recording()
+        self.assertIsNone(ctrl.game_state.recorder)
+        self.assertEqual(read_lines(self.filename)[1:], ["6 0 5 0 0 1", "undo"])
+
+    def test_batched_moves_still_reach_recorder(self):
+        ctrl = GameController.new_game()
+        ctrl.start_recording(self.filename)
+        ctrl.apply_moves([(6, 0, 5, 0), (2, 6, 3, 6)])
+        ctrl.stop_recording()
+        self.assertEqual(GameState.replay_history(self.filename), [(6, 0, 5, 0), (2, 6, 3, 6)])
+
+
+if __name__ == "__main__":
+    unittest.main()
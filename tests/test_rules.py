@@ -0,0 +1,184 @@
+import os
+import pickle
+import random
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from jungle_game.controller.game_controller import GameController
+from jungle_game.model.game_state import GameState
+from jungle_game.model.board import Board, LAND, RIVER, TRAP_P1, TRAP_P2, DEN_P1, DEN_P2
+from jungle_game.model.piece import Piece
+from jungle_game.model.position import Position
+from jungle_game.model.animal_type import RAT, CAT, ELEPHANT
+from jungle_game.model.encoding import square_of
+from jungle_game.model.rules import (
+    Ruleset, STANDARD, NO_WATER_CAPTURE, OPEN_TRAPS, STANDARD_LAYOUT,
+    CUSTOM_ID, capture_index, registered_rulesets
+)
+from jungle_game.engine import playout
+from jungle_game.engine.engine import Engine
+
+# a custom variant, encoded by its fingerprint rather than a fixed id
+NARROW_RIVER = Ruleset("narrow-river", layout=(
+    "..tdt..", "...t...", ".......", ".~~~~~.", ".......",
+    ".~~~~~.", ".......", "...T...", "..TDT..",
+))
+
+
+def clear_board(gs):
+    for r in range(9):
+        for c in range(7):
+            gs.board.pieces[r][c] = None
+
+
+def place(gs, animal, player, r, c):
+    gs.board.pieces[r][c] = Piece(animal, player, Position(r, c))
+
+
+class TestRuleset(unittest.TestCase):
+    def test_standard_layout(self):
+        self.assertEqual(Board().tiles, [
+            [LAND, LAND, TRAP_P2, DEN_P2, TRAP_P2, LAND, LAND],
+            [LAND, LAND, LAND, TRAP_P2, LAND, LAND, LAND],
+            [LAND, LAND, LAND, LAND, LAND, LAND, LAND],
+            [LAND, RIVER, RIVER, LAND, RIVER, RIVER, LAND],
+            [LAND, RIVER, RIVER, LAND, RIVER, RIVER, LAND],
+            [LAND, RIVER, RIVER, LAND, RIVER, RIVER, LAND],
+            [LAND, LAND, LAND, LAND, LAND, LAND, LAND],
+            [LAND, LAND, LAND, TRAP_P1, LAND, LAND, LAND],
+            [LAND, LAND, TRAP_P1, DEN_P1, TRAP_P1, LAND, LAND]
+        ])
+        self.assertEqual(STANDARD.goal, {1: 3, -1: 59})
+
+    def test_capture_matrix_follows_animal_definitions(self):
+        def captures(attacker, defender, in_water=0, defender_in_water=0, trapped=0):
+            return STANDARD.capture[capture_index(
+                attacker.rank, defender.rank, in_water, defender_in_water, trapped
+            )] == 1
+
+        self.assertTrue(captures(ELEPHANT, CAT))
+        self.assertFalse(captures(CAT, ELEPHANT))
+        self.assertFalse(captures(ELEPHANT, RAT))
+        self.assertFalse(captures(ELEPHANT, RAT, trapped=1))
+        self.assertTrue(captures(RAT, ELEPHANT))
+        self.assertFalse(captures(RAT, ELEPHANT, in_water=1))
+        self.assertTrue(captures(CAT, ELEPHANT, trapped=1))
+        self.assertTrue(captures(RAT, RAT, 1, 1))
+        self.assertFalse(captures(RAT, RAT, 1, 0))
+
+    def test_bad_layouts(self):
+        with self.assertRaises(ValueError):
+            Ruleset("short", layout=STANDARD_LAYOUT[:8])
+        with self.assertRaises(ValueError):
+            Ruleset("odd", layout=("..?d...",) + STANDARD_LAYOUT[1:])
+
+    def test_flat_generator_matches_board_for_every_ruleset(self):
+        rng = random.Random(6)
+        self.assertIn(NARROW_RIVER, registered_rulesets())
+        for ruleset in registered_rulesets():
+            gs = GameState(ruleset)
+            for _ in range(150):
+                if gs.is_game_over():
+                    break
+                player = gs.get_current_player()
+                legal = {(square_of(f), square_of(t)) for f, t in gs.get_legal_moves(player)}
+                moves, _ = playout.generate_moves(playout.flat_board(gs), player, ruleset)
+                self.assertEqual(set(moves), legal, ruleset.name)
+                if not legal:
+                    break
+                gs.make_move(*rng.choice(gs.get_legal_moves(player)))
+
+    def test_no_water_capture(self):
+        for ruleset, allowed in ((STANDARD, True), (NO_WATER_CAPTURE, False)):
+            gs = GameState(ruleset)
+            clear_board(gs)
+            place(gs, RAT, 1, 4, 1)
+            place(gs, RAT, -1, 3, 1)
+            place(gs, CAT, -1, 0, 0)
+            self.assertEqual(gs.make_move(Position(4, 1), Position(3, 1)), allowed)
+
+    def test_open_traps_weaken_own_pieces(self):
+        for ruleset, allowed in ((STANDARD, False), (OPEN_TRAPS, True)):
+            gs = GameState(ruleset)
+            clear_board(gs)
+            place(gs, ELEPHANT, 1, 7, 3)   # on player 1's own trap
+            place(gs, CAT, -1, 6, 3)
+            gs.current_player = -1
+            self.assertEqual(gs.make_move(Position(6, 3), Position(7, 3)), allowed)
+
+    def test_ruleset_survives_serialisation(self):
+        gs = GameState(OPEN_TRAPS)
+        gs.make_move(Position(6, 0), Position(5, 0))
+        self.assertIs(GameState.from_bytes(gs.to_bytes()).board.ruleset, OPEN_TRAPS)
+        self.assertIs(GameState.from_dict(gs.to_dict()).board.ruleset, OPEN_TRAPS)
+        self.assertNotIn("ruleset", GameState().to_dict())
+
+        filename = os.path.join(tempfile.mkdtemp(), "variant.jungle")
+        controller = GameController.new_game(NO_WATER_CAPTURE)
+        controller.save_game(filename)
+        controller.reset_game()
+        self.assertIs(controller.game_state.board.ruleset, NO_WATER_CAPTURE)
+        self.assertIs(GameState.load_game(filename).board.ruleset, NO_WATER_CAPTURE)
+
+    def test_custom_ruleset_pickles_saves_and_searches(self):
+        gs = GameState(NARROW_RIVER)
+        gs.make_move(Position(6, 0), Position(5, 0))
+        copy = pickle.loads(pickle.dumps(gs))
+        self.assertIs(copy.board.ruleset, NARROW_RIVER)
+        self.assertEqual(copy.to_bytes(), gs.to_bytes())
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "narrow.jungle")
+            gs.save_game(filename)
+            self.assertIs(GameState.load_game(filename).board.ruleset, NARROW_RIVER)
+
+        result = Engine(depth=2).search(gs)
+        self.assertTrue(gs.is_legal(*result.move))
+
+    def test_ruleset_names_are_unique(self):
+        with self.assertRaises(ValueError):
+            Ruleset("standard", water_captures=False)
+        with self.assertRaises(ValueError):
+            Ruleset("narrow-river")
+        # the same definition again is the same ruleset
+        again = Ruleset("narrow-river", layout=NARROW_RIVER.layout)
+        gs = GameState(again)
+        self.assertIs(GameState.from_bytes(gs.to_bytes()).board.ruleset, NARROW_RIVER)
+
+    def test_custom_rulesets_are_not_limited(self):
+        variants = [Ruleset(f"many-{i}", traps_weaken_owner=bool(i % 2)) for i in range(20)]
+        for ruleset in variants:
+            self.assertEqual(ruleset.id, CUSTOM_ID)
+            gs = GameState(ruleset)
+            self.assertIs(GameState.from_bytes(gs.to_bytes()).board.ruleset, ruleset)
+
+    def test_custom_ruleset_decodes_in_another_process(self):
+        # the other process creates its rulesets in a different order
+        script = (
+            "from jungle_game.model.game_state import GameState\n"
+            "from jungle_game.model.rules import Ruleset\n"
+            "Ruleset('other-first', water_captures=False)\n"
+            "narrow = Ruleset('narrow-river', layout=%r)\n"
+            "print(GameState(narrow).to_bytes().hex())\n" % (NARROW_RIVER.layout,)
+        )
+        output = subprocess.run([sys.executable, "-c", script], check=True,
+                                capture_output=True, text=True).stdout
+        state = GameState.from_bytes(bytes.fromhex(output.strip()))
+        self.assertIs(state.board.ruleset, NARROW_RIVER)
+
+    def test_unknown_ruleset_fails_loudly(self):
+        data = bytearray(GameState().to_bytes())
+        data[2] |= 0xE0   # a built-in id that does not exist
+        with self.assertRaises(ValueError):
+            GameState.from_bytes(bytes(data))
+
+        # a custom ruleset this process never created
+        data = bytearray(GameState(NARROW_RIVER).to_bytes())
+        data[12] ^= 0xFF
+        with self.assertRaisesRegex(ValueError, "unknown ruleset"):
+            GameState.from_bytes(bytes(data))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+
+from benchmarks.startup import measure, parse_importtime
+
+
+class TestStartup(unittest.TestCase):
+    def test_parse_importtime(self):
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   jungle_game.model.position\n"
+            "import time:       300 |        420 | jungle_game.model.board\n"
+        )
+        self.assertEqual(parse_importtime(stderr), {
+            "jungle_game.model.position": (120, 120),
+            "jungle_game.model.board": (300, 420),
+        })
+
+    def test_main_does_not_load_gui(self):
+        modules = measure("jungle_game.main", repeat=1)["modules"]
+        self.assertNotIn("tkinter", modules)
+        self.assertNotIn("jungle_game.view.gui", modules)
+
+    def test_headless_imports_stay_light(self):
+        modules = measure("jungle_game.engine.engine", repeat=1)["modules"]
+        for heavy in ("multiprocessing", "sqlite3", "numpy"):
+            self.assertNotIn(heavy, modules)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import random
+import unittest
+
+from jungle_game.model.game_state import GameState
+from jungle_game.model.position import Position
+from jungle_game.model.rules import Ruleset, STANDARD
+from jungle_game.model import symmetry
+
+# the river is shifted left, so the board is no longer mirror symmetric
+SHIFTED_RIVER = Ruleset("symmetry-shifted-river", layout=(
+    "..tdt..", "...t...", ".......", "~~.~~..", "~~.~~..",
+    "~~.~~..", ".......", "...T...", "..TDT..",
+))
+
+
+def as_tuples(moves):
+    return {(f.row, f.col, t.row, t.col) for f, t in moves}
+
+
+def random_state(seed, plies):
+    rng = random.Random(seed)
+    gs = GameState()
+    for _ in range(plies):
+        if gs.is_game_over():
+            break
+        gs.make_move(*rng.choice(gs.get_legal_moves(gs.get_current_player())))
+    return gs
+
+
+class TestSymmetry(unittest.TestCase):
+    def test_transforms_are_involutions(self):
+        for t in symmetry.TRANSFORMS:
+            for sq in range(63):
+                self.assertEqual(symmetry.transform_square(symmetry.transform_square(sq, t), t), sq)
+
+    def test_tile_layout_is_preserved(self):
+        gs = GameState()
+        tiles = gs.board.tiles
+        swap_tile = {0: 0, 1: 1, 2: 3, 3: 2, 4: 5, 5: 4}
+        for t in symmetry.TRANSFORMS:
+            for r in range(9):
+                for c in range(7):
+                    p = symmetry.transform_position(Position(r, c), t)
+                    expected = swap_tile[tiles[r][c]] if symmetry.swaps_players(t) else tiles[r][c]
+                    self.assertEqual(tiles[p.row][p.col], expected)
+
+    def test_symmetric_positions_share_canonical_key(self):
+        gs = random_state(3, 30)
+        key = symmetry.canonical_key(gs)
+        for t in symmetry.TRANSFORMS:
+            image = symmetry.transform_state(gs, t)
+            self.assertEqual(symmetry.canonical_key(image), key)
+
+    def test_moves_map_between_frames(self):
+        gs = random_state(11, 25)
+        key, t = symmetry.canonicalize(gs)
+        canonical = symmetry.transform_state(gs, t)
+
+        original_moves = as_tuples(gs.get_legal_moves(gs.current_player))
+        mapped_back = as_tuples(
+            symmetry.transform_move(m, symmetry.inverse(t))
+            for m in canonical.get_legal_moves(canonical.current_player)
+        )
+        self.assertEqual(mapped_back, original_moves)
+
+    def test_start_position_is_rotation_symmetric_but_not_mirror_symmetric(self):
+        # lion and tiger sit on opposite corners for the two sides
+        codes = symmetry.board_codes(GameState())
+        identity = symmetry.position_key(codes, 1, symmetry.IDENTITY)
+        rotated = symmetry.position_key(codes, 1, symmetry.ROTATE_SWAP)
+        mirrored = symmetry.position_key(codes, 1, symmetry.MIRROR)
+        self.assertEqual(identity[:63], rotated[:63])
+        self.assertNotEqual(identity[63], rotated[63])
+        self.assertNotEqual(identity[:63], mirrored[:63])
+
+    def test_only_layout_symmetries_are_used(self):
+        self.assertEqual(symmetry.layout_transforms(STANDARD), symmetry.TRANSFORMS)
+        self.assertEqual(symmetry.layout_transforms(SHIFTED_RIVER),
+                         (symmetry.IDENTITY, symmetry.FLIP_SWAP))
+
+        gs = GameState(SHIFTED_RIVER)
+        gs.make_move(Position(6, 0), Position(5, 0))
+        key, t = symmetry.canonicalize(gs)
+        canonical = symmetry.transform_state(gs, t)
+        self.assertIs(canonical.board.ruleset, SHIFTED_RIVER)
+        self.assertEqual(symmetry.canonical_key(canonical), key)
+        mapped_back = as_tuples(
+            symmetry.transform_move(m, symmetry.inverse(t))
+            for m in canonical.get_legal_moves(canonical.current_player)
+        )
+        self.assertEqual(mapped_back, as_tuples(gs.get_legal_moves(gs.current_player)))
+        with self.assertRaises(ValueError):
+            symmetry.transform_state(gs, symmetry.MIRROR)
+
+if __name__ == "__main__":
+    unittest.main()
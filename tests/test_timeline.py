@@ -0,0 +1,132 @@
+import random
+import unittest
+
+from jungle_game.model.game_state import GameState
+from jungle_game.model.position import Position
+from jungle_game.model.timeline import Timeline
+
+
+def board_codes(state):
+    return [
+        None if p is None else (p.animal_type.rank, p.player)
+        for row in state.board.pieces for p in row
+    ]
+
+
+def play_random(timeline, plies, seed):
+    rng = random.Random(seed)
+    positions = [board_codes(timeline.state)]
+    for _ in range(plies):
+        state = timeline.state
+        if state.is_game_over():
+            break
+        moves = state.get_legal_moves(state.current_player)
+        if not moves:
+            break
+        timeline.play(*rng.choice(moves))
+        positions.append(board_codes(timeline.state))
+    return positions
+
+
+class TestTimeline(unittest.TestCase):
+    def test_seek_matches_played_positions(self):
+        timeline = Timeline(checkpoint_every=8)
+        positions = play_random(timeline, 60, seed=4)
+        rng = random.Random(1)
+        for _ in range(40):
+            ply = rng.randrange(len(positions))
+            timeline.seek(ply)
+            self.assertEqual(timeline.ply, ply)
+            self.assertEqual(board_codes(timeline.state), positions[ply])
+            self.assertEqual(len(timeline.state.move_history), ply)
+
+    def test_seek_keeps_history_in_step(self):
+        timeline = Timeline(checkpoint_every=4)
+        play_random(timeline, 80, seed=9)
+        histories = []
+        for ply in range(timeline.end + 1):
+            timeline.seek(ply)
+            histories.append(timeline.state.move_history.to_bytes())
+        for ply in (timeline.end, 3, 70, 0, 41):
+            timeline.seek(ply)
+            history = timeline.state.move_history
+            self.assertEqual(history.to_bytes(), histories[ply])
+            # captured pieces line up with the plies, so undo still works
+            captures = sum(1 for _, _, code, _ in history.iter_raw() if code)
+            self.assertEqual(len(history.captured), captures)
+        start = board_codes(GameState())
+        timeline.seek(timeline.end)
+        timeline.seek(2)
+        timeline.seek(timeline.end)
+        while timeline.state.move_history:
+            self.assertTrue(timeline.state.undo_last_move())
+        self.assertEqual(board_codes(timeline.state), start)
+
+    def test_back_and_redo_leave_undo_counts_alone(self):
+        timeline = Timeline()
+        positions = play_random(timeline, 10, seed=2)
+        for _ in range(3):
+            self.assertTrue(timeline.back())
+        self.assertEqual(board_codes(timeline.state), positions[-4])
+        self.assertEqual(timeline.state.undo_used, {1: 0, -1: 0})
+        self.assertTrue(timeline.redo())
+        self.assertEqual(board_codes(timeline.state), positions[-3])
+        timeline.seek(0)
+        self.assertFalse(timeline.back())
+
+    def test_variations_share_the_main_line(self):
+        timeline = Timeline(checkpoint_every=4)
+        main_positions = play_random(timeline, 12, seed=8)
+        main_end = timeline.end
+
+        timeline.seek(5)
+        state = timeline.state
+        main_next = timeline.line.move_at(6)[:2]
+        alternatives = [
+            m for m in state.get_legal_moves(state.current_player)
+            if (m[0].row * 7 + m[0].col, m[1].row * 7 + m[1].col) != main_next
+        ]
+        self.assertTrue(timeline.play(*alternatives[0]))
+        variation = timeline.line
+        self.assertIsNot(variation, timeline.main)
+        self.assertEqual(variation.fork, 5)
+        self.assertEqual(len(variation.moves), 4)   # only its own move is stored
+        play_random(timeline, 6, seed=3)
+        variation_end = timeline.ply
+
+        # the shared part of the path is still reachable from the variation
+        timeline.seek(2)
+        self.assertEqual(board_codes(timeline.state), main_positions[2])
+        timeline.seek(variation_end)
+        self.assertEqual(timeline.line, variation)
+
+        # back on the main line nothing was lost
+        self.assertTrue(timeline.exit_variation())
+        self.assertEqual(timeline.ply, 5)
+        self.assertEqual(timeline.variations(), [variation])
+        timeline.seek(main_end)
+        self.assertEqual(board_codes(timeline.state), main_positions[-1])
+
+        # replaying the variation's first move re-enters it
+        timeline.seek(5)
+        self.assertTrue(timeline.play(*alternatives[0]))
+        self.assertIs(timeline.line, variation)
+
+    def test_illegal_move_is_rejected(self):
+        timeline = Timeline()
+        self.assertFalse(timeline.play(Position(8, 0), Position(6, 0)))
+        self.assertEqual(timeline.end, 0)
+
+    def test_existing_history_is_kept(self):
+        state = GameState()
+        state.make_move(Position(6, 0), Position(5, 0))
+        timeline = Timeline(state, checkpoint_every=2)
+        play_random(timeline, 6, seed=5)
+        timeline.seek(0)
+        self.assertEqual(len(state.move_history), 1)
+        timeline.seek(5)
+        self.assertEqual(len(state.move_history), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()